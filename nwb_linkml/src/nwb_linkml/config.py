@@ -111,6 +111,21 @@ class Config(BaseSettings):
         """Directory for :class:`nwb_linkml.providers.git.GitRepo` to clone to"""
         return self.cache_dir / "git"
 
+    @computed_field
+    @property
+    def plan_dir(self) -> Path:
+        """Directory to cache :class:`nwb_linkml.io.hdf5.ReadPlan` s for read hdf5 files"""
+        return self.cache_dir / "plans"
+
+    @computed_field
+    @property
+    def spec_dir(self) -> Path:
+        """
+        Directory to build models from the specifications embedded in NWB files into,
+        one subdirectory per :func:`nwb_linkml.io.hdf5.spec_hash`
+        """
+        return self.cache_dir / "specs"
+
     @field_validator("cache_dir", mode="before")
     @classmethod
     def folder_exists(cls, v: Path, info: FieldValidationInfo) -> Path:
@@ -147,3 +162,5 @@ class Config(BaseSettings):
         self.linkml_dir.mkdir(exist_ok=True)
         self.pydantic_dir.mkdir(exist_ok=True)
         self.git_dir.mkdir(exist_ok=True)
+        self.plan_dir.mkdir(exist_ok=True)
+        self.spec_dir.mkdir(exist_ok=True)
@@ -7,13 +7,19 @@ See class and module docstrings for details :)
 
 import re
 from dataclasses import dataclass, field
-from typing import Callable, ClassVar, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from linkml.generators import PydanticGenerator
 from linkml.generators.pydanticgen.array import ArrayRepresentation, NumpydanticArray
 from linkml.generators.pydanticgen.build import ClassResult, SlotResult
 from linkml.generators.pydanticgen.pydanticgen import SplitMode
-from linkml.generators.pydanticgen.template import Import, Imports, ObjectImport, PydanticModule
+from linkml.generators.pydanticgen.template import (
+    Import,
+    Imports,
+    ObjectImport,
+    PydanticModule,
+)
 from linkml_runtime.linkml_model.meta import (
     ArrayExpression,
     SchemaDefinition,
@@ -22,11 +28,13 @@ from linkml_runtime.linkml_model.meta import (
 )
 from linkml_runtime.utils.formatutils import remove_empty_items
 from linkml_runtime.utils.schemaview import SchemaView
+from pydantic import Field
 
 from nwb_linkml.includes.base import (
-    BASEMODEL_CAST_WITH_VALUE,
     BASEMODEL_COERCE_SUBCLASS,
-    BASEMODEL_COERCE_VALUE,
+    BASEMODEL_COERCIONS,
+    BASEMODEL_COERCIONS_IMPORTS,
+    BASEMODEL_DEFER_BUILD,
     BASEMODEL_EXTRA_TO_VALUE,
     BASEMODEL_GETITEM,
 )
@@ -36,7 +44,32 @@ from nwb_linkml.includes.hdmf import (
     TSRVD_IMPORTS,
     TSRVD_INJECTS,
 )
-from nwb_linkml.includes.types import ModelTypeString, NamedImports, NamedString, _get_name
+from nwb_linkml.includes.namespace import (
+    NAMESPACE_GETATTR,
+    make_class_modules,
+    make_type_checking_imports,
+)
+from nwb_linkml.includes.types import (
+    CastWithValueString,
+    CoerceValueString,
+    CoercionImports,
+    ModelTypeString,
+    NamedImports,
+    NamedString,
+    ValueTypeString,
+    _cast_with_value,
+    _coerce_value,
+    _get_name,
+)
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+"""
+Templates that override the defaults from :mod:`linkml.generators.pydanticgen` :
+
+* ``footer.py.jinja`` - models are built when they are first used
+  (see :data:`~nwb_linkml.includes.base.BASEMODEL_DEFER_BUILD` ),
+  so don't rebuild them all at the end of the module
+"""
 
 OPTIONAL_PATTERN = re.compile(r"Optional\[(.*)\]")
 
@@ -48,22 +81,25 @@ class NWBPydanticGenerator(PydanticGenerator):
     """
 
     injected_fields: List[str] = (
+        BASEMODEL_DEFER_BUILD,
         (
             'hdf5_path: Optional[str] = Field(None, description="The absolute path that this object'
             ' is stored in an NWB file")'
         ),
         'object_id: Optional[str] = Field(None, description="Unique UUID for each object")',
         BASEMODEL_GETITEM,
-        BASEMODEL_COERCE_VALUE,
-        BASEMODEL_CAST_WITH_VALUE,
         BASEMODEL_COERCE_SUBCLASS,
         BASEMODEL_EXTRA_TO_VALUE,
     )
+    injected_classes: List[Union[Type, str]] = field(
+        default_factory=lambda: BASEMODEL_COERCIONS.copy()
+    )
     split: bool = True
     imports: list[Import] = field(
         default_factory=lambda: [
             Import(module="numpy", alias="np"),
             Import(module="pydantic", objects=[ObjectImport(name="model_validator")]),
+            *BASEMODEL_COERCIONS_IMPORTS.imports,
         ]
     )
 
@@ -72,6 +108,7 @@ class NWBPydanticGenerator(PydanticGenerator):
     array_representations: List[ArrayRepresentation] = field(
         default_factory=lambda: [ArrayRepresentation.NUMPYDANTIC]
     )
+    template_dir: Optional[Union[str, Path]] = TEMPLATE_DIR
     black: bool = False
     inlined: bool = True
     emit_metadata: bool = True
@@ -118,7 +155,46 @@ class NWBPydanticGenerator(PydanticGenerator):
             is_namespace = ns_annotation.value
         self.split_mode = SplitMode.FULL if is_namespace else SplitMode.AUTO
 
-        return super().render()
+        module = super().render()
+        if is_namespace and self.split:
+            module = self.make_lazy_namespace(module)
+        return module
+
+    @staticmethod
+    def make_lazy_namespace(module: PydanticModule) -> "NWBPydanticModule":
+        """
+        Import the classes in a namespace module from their split modules
+        when they are first used, rather than when the namespace is imported.
+
+        The imports from the split modules are moved to :attr:`.NWBPydanticModule.lazy_imports`
+        and are only injected for type checkers, and a module ``__getattr__`` imports classes
+        using an index of the module that defines each of them
+        (see :mod:`nwb_linkml.includes.namespace` ).
+        """
+        lazy_imports = [an_import for an_import in module.python_imports if an_import.is_schema]
+        module = NWBPydanticModule(
+            **{key: getattr(module, key) for key in PydanticModule.model_fields},
+            lazy_imports=Imports(imports=lazy_imports),
+        )
+        if not lazy_imports:
+            return module
+
+        class_modules = {
+            obj.name: an_import.module for an_import in lazy_imports for obj in an_import.objects
+        }
+        module.class_modules = dict(sorted(class_modules.items()))
+        module.python_imports = (
+            Imports(imports=[i for i in module.python_imports if not i.is_schema])
+            + Import(module="importlib", objects=[ObjectImport(name="import_module")])
+            + Import(module="typing", objects=[ObjectImport(name="TYPE_CHECKING")])
+        )
+        module.injected_classes = [
+            *(module.injected_classes or []),
+            make_type_checking_imports(module.lazy_imports),
+            make_class_modules(module.class_modules),
+            NAMESPACE_GETATTR,
+        ]
+        return module
 
     def before_generate_slot(self, slot: SlotDefinition, sv: SchemaView) -> SlotDefinition:
         """
@@ -144,6 +220,7 @@ class NWBPydanticGenerator(PydanticGenerator):
         cls = AfterGenerateClass.inject_dynamictable(cls)
         cls = AfterGenerateClass.wrap_dynamictable_columns(cls, sv)
         cls = AfterGenerateClass.inject_dynamictable_imports(cls, sv, self._get_element_import)
+        cls = AfterGenerateClass.make_coercion_plan(cls, sv)
         return cls
 
     def before_render_template(self, template: PydanticModule, sv: SchemaView) -> PydanticModule:
@@ -238,6 +315,21 @@ class AfterGenerateSlot:
         return slot
 
 
+class NWBPydanticModule(PydanticModule):
+    """
+    Module that imports some of its classes lazily -
+    see :meth:`.NWBPydanticGenerator.make_lazy_namespace`
+    """
+
+    lazy_imports: Imports = Field(default_factory=Imports)
+    """Imports of other schema modules that are only evaluated by type checkers"""
+    class_modules: Dict[str, str] = Field(default_factory=dict)
+    """
+    Index from each lazily imported class to the module that defines it,
+    relative to the namespace module
+    """
+
+
 class AfterGenerateClass:
     """
     Container class for class-modification methods
@@ -351,6 +443,74 @@ class AfterGenerateClass:
             cls.imports += imp
         return cls
 
+    @staticmethod
+    def make_coercion_plan(cls: ClassResult, sv: SchemaView) -> ClassResult:
+        """
+        Decide which fields can need to be rescued by wrapping or unwrapping a ``value`` ,
+        rather than trying (and failing) to rescue every field of every model when validating.
+
+        * Fields whose range includes a class with a ``value`` slot might be given just
+          the value (eg. an array for a ``TimeSeries.data`` ), so they are wrapped in
+          :class:`.CastWithValue` , and might be given a dict or model holding the value
+          (eg. a dataset read from a file), so they are also wrapped in :class:`.CoerceValue` .
+        * Array fields might be given a dataset with attributes that holds the array,
+          so they are wrapped in :class:`.CoerceValue` .
+        * Every other field (eg. a ``name`` string) gets neither.
+        """
+        if not cls.cls.attributes:
+            return cls
+
+        classes = sv.all_classes()
+        is_table = cls.source.name == "DynamicTable" or "DynamicTable" in sv.class_ancestors(
+            cls.source.name
+        )
+        slots = {a_slot.name: a_slot for a_slot in sv.class_induced_slots(cls.source.name)}
+        coerced = False
+        for name, attr in cls.cls.attributes.items():
+            if name not in slots or attr.range is None:
+                continue
+            a_slot = slots[name]
+            ranges = [a_slot.range, *(expr.range for expr in a_slot.any_of)]
+            is_array = a_slot.array is not None or any(
+                expr.array is not None for expr in a_slot.any_of
+            )
+            if is_table and is_array:
+                # arrays in tables are wrapped in VectorData, see wrap_dynamictable_columns
+                ranges.append("VectorData")
+
+            if any(a_range in classes and "value" in sv.class_slots(a_range) for a_range in ranges):
+                attr.range = wrap_preserving_optional(
+                    wrap_preserving_optional(attr.range, "CoerceValue"), "CastWithValue"
+                )
+            elif is_array:
+                attr.range = wrap_preserving_optional(attr.range, "CoerceValue")
+            else:
+                continue
+            coerced = True
+
+        if coerced:
+            coercion_injects = [
+                ValueTypeString,
+                _coerce_value,
+                _cast_with_value,
+                CoerceValueString,
+                CastWithValueString,
+            ]
+            if cls.injected_classes is None:
+                cls.injected_classes = coercion_injects
+            else:
+                cls.injected_classes.extend(coercion_injects)
+
+            if isinstance(cls.imports, Imports):
+                cls.imports += CoercionImports
+            elif isinstance(
+                cls.imports, list
+            ):  # pragma: no cover - for completeness, shouldn't happen
+                cls.imports = Imports(imports=cls.imports) + CoercionImports
+            else:  # pragma: no cover - for completeness, shouldn't happen
+                cls.imports = CoercionImports.model_copy()
+        return cls
+
 
 def wrap_preserving_optional(annotation: str, wrap: str) -> str:
     """
@@ -2,6 +2,17 @@
 Modifications to the ConfiguredBaseModel used by all generated classes
 """
 
+from typing import Type
+
+from linkml.generators.pydanticgen.template import Import, Imports, ObjectImport
+from pydantic import BaseModel
+
+BASEMODEL_DEFER_BUILD = 'model_config["defer_build"] = True'
+"""
+Build models when they are first used rather than when their module is imported.
+Added to the ``model_config`` rendered by the default base model template.
+"""
+
 BASEMODEL_GETITEM = """
     def __getitem__(self, val: Union[int, slice, str]) -> Any:
         \"\"\"Try and get a value from value or "data" if we have it\"\"\"
@@ -13,36 +24,103 @@ BASEMODEL_GETITEM = """
             raise KeyError("No value or data field to index from")
 """
 
-BASEMODEL_COERCE_VALUE = """
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        \"\"\"Try to rescue instantiation by using the value field\"\"\"
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
+
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+"""
+Validators from the generated ``ConfiguredBaseModel`` that only do anything
+when a value doesn't already validate, so they can be skipped for values that are
+already known to be fine (see :func:`._constructable` )
 """
 
-BASEMODEL_CAST_WITH_VALUE = """
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        \"\"\"Try to rescue instantiation by casting into the model's value field\"\"\"
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
+BASEMODEL_COERCIONS = [
+    "RESCUE_VALIDATORS = (" + ", ".join(f'"{name}"' for name in RESCUE_VALIDATORS) + ")",
+    _constructable,
+    _construct_validating,
+    _recast_subclass,
+]
+"""
+Functions used by the rescue validators, injected into every generated module.
 """
+BASEMODEL_COERCIONS_IMPORTS = Imports(
+    imports=[
+        Import(module="typing", objects=[ObjectImport(name="Type")]),
+    ]
+)
+"""Imports for the annotations of :data:`.BASEMODEL_COERCIONS`"""
 
 BASEMODEL_COERCE_SUBCLASS = """
     @field_validator("*", mode="before")
@@ -55,10 +133,7 @@ BASEMODEL_COERCE_SUBCLASS = """
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)            
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
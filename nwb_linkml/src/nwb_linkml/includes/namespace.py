@@ -0,0 +1,45 @@
+"""
+Lazy loading for generated namespace modules, so importing a namespace
+doesn't import every module in it and build every model.
+
+See :meth:`.NWBPydanticGenerator.make_lazy_namespace`
+"""
+
+from textwrap import indent
+
+from linkml.generators.pydanticgen.template import Imports
+
+NAMESPACE_GETATTR = """
+def __getattr__(name: str) -> Any:
+    \"\"\"Import classes from the module that defines them the first time they are used\"\"\"
+    if name not in _CLASS_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(import_module(_CLASS_MODULES[name], __package__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_CLASS_MODULES})
+"""
+
+
+def make_type_checking_imports(imports: Imports) -> str:
+    """
+    Render the imports of the classes in a namespace module for type checkers only,
+    since they are otherwise imported when first used.
+    """
+    return "if TYPE_CHECKING:\n" + indent(imports.render(), "    ") + "\n"
+
+
+def make_class_modules(class_modules: dict[str, str]) -> str:
+    """
+    Render the ``_CLASS_MODULES`` index of a namespace module,
+    mapping each class to the (relative) module that defines it.
+    """
+    items = "".join(f'    "{name}": "{module}",\n' for name, module in class_modules.items())
+    return (
+        f"_CLASS_MODULES = {{\n{items}}}\n"
+        '"""Modules that define the classes in this namespace, imported when first used"""\n\n'
+        "__all__ = list(_CLASS_MODULES)\n"
+    )
@@ -6,10 +6,16 @@ Used to customize behavior of pydantic classes either to match pynwb behavior or
 reduce the verbosity of the generated models with convenience classes.
 """
 
-from typing import Annotated, Type, TypeVar, Union
+from typing import Annotated, Any, Type, TypeVar, Union
 
 from linkml.generators.pydanticgen.template import Import, Imports, ObjectImport
-from pydantic import BaseModel, BeforeValidator, ValidationInfo
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
 
 ModelType = TypeVar("ModelType", bound=Type[BaseModel])
 # inspect.getsource() doesn't work for typevars because everything in the typing module
@@ -63,3 +69,86 @@ NamedImports = Imports(
         ),
     ]
 )
+
+ValueType = TypeVar("ValueType")
+ValueTypeString = """ValueType = TypeVar("ValueType")"""
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+"""
+Generic annotated type for fields that might be given a model or dict that holds
+their value, eg. a dataset with attributes read from a file.
+
+Examples:
+
+    class MyModel(BaseModel):
+        array: CoerceValue[list[int]]
+
+    instance = MyModel(array={'value': [1, 2, 3], 'unit': 'seconds'})
+    instance.array == [1, 2, 3]
+"""
+CoerceValueString = """CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]"""
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+"""
+Generic annotated type for fields whose model has a ``value`` slot,
+and so might be given just the value.
+
+Examples:
+
+    class ChildModel(BaseModel):
+        value: list[int]
+
+    class MyModel(BaseModel):
+        child: CastWithValue[ChildModel]
+
+    instance = MyModel(child=[1, 2, 3])
+    instance.child.value == [1, 2, 3]
+"""
+CastWithValueString = """CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]"""
+
+CoercionImports = Imports(
+    imports=[
+        Import(
+            module="typing",
+            objects=[
+                ObjectImport(name="Annotated"),
+                ObjectImport(name="Any"),
+                ObjectImport(name="TypeVar"),
+            ],
+        ),
+        Import(
+            module="pydantic",
+            objects=[
+                ObjectImport(name="ValidationInfo"),
+                ObjectImport(name="ValidatorFunctionWrapHandler"),
+                ObjectImport(name="WrapValidator"),
+            ],
+        ),
+    ]
+)
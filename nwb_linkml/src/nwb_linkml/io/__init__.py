@@ -3,6 +3,6 @@ Loading and dumping data from and to files
 """
 
 from nwb_linkml.io import schema
-from nwb_linkml.io.hdf5 import HDF5IO
+from nwb_linkml.io.hdf5 import HDF5IO, read_many
 
-__all__ = ["HDF5IO", "schema"]
+__all__ = ["HDF5IO", "read_many", "schema"]
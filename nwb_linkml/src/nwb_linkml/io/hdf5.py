@@ -20,30 +20,54 @@ Other TODO:
 
 """
 
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import traceback
+import types
 import warnings
-from pathlib import Path
-from types import ModuleType
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, overload
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from types import ModuleType, TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
 
 import h5py
 import networkx as nx
-import numpy as np
 from numpydantic.interface.hdf5 import H5ArrayPath
 from pydantic import BaseModel
 from tqdm import tqdm
 
+from nwb_linkml.config import Config
+from nwb_linkml.includes.base import _construct_validating, _constructable
 from nwb_linkml.maps.hdf5 import (
     get_attr_references,
     get_dataset_references,
+    get_reference_fields,
     get_references,
+    is_reference_dtype,
     resolve_hardlink,
 )
+from nwb_linkml.providers.cache import path_lock, write_atomic
 
 if TYPE_CHECKING:
     from nwb_linkml.providers.schema import SchemaProvider
@@ -58,6 +82,25 @@ else:
 SKIP_PATTERN = re.compile("(^/specifications.*)|(\.specloc)")
 """Nodes to always skip in reading e.g. because they are handled elsewhere"""
 
+SUPERBLOCK_SIZE = 96
+"""
+Number of bytes from the start of the HDF5 superblock to use in :func:`.file_identity` -
+enough for a version 0 superblock with 8-byte addresses,
+and includes the checksum of version 2 and 3 superblocks.
+"""
+PLAN_NODE_ATTRS = ("neurodata_type", "namespace")
+"""Node attributes that are stored in a :class:`.ReadPlan`"""
+GLOB_PATTERN = re.compile(r"[*?\[]")
+"""Characters that indicate a path is a glob pattern rather than a literal path"""
+SPEC_VERSIONS_FILE = "versions.json"
+"""
+Written to a :func:`.spec_hash` directory once its models are built,
+storing the namespace versions for its :class:`.SchemaProvider`
+"""
+
+_spec_providers: Dict[str, "SchemaProvider"] = {}
+"""Providers already made by :meth:`.HDF5IO.make_provider` in this process, by spec hash"""
+
 
 def hdf_dependency_graph(h5f: Path | h5py.File | h5py.Group) -> nx.DiGraph:
     """
@@ -143,8 +186,257 @@ def filter_dependency_graph(g: nx.DiGraph) -> nx.DiGraph:
     return g
 
 
+def file_identity(path: Path) -> str:
+    """
+    Hash that identifies a particular state of an hdf5 file from its
+    absolute path, size, modification time, and the contents of its superblock
+    (which includes the end-of-file address, and the checksum in superblock versions >= 2).
+
+    Changing the file in any way that changes its contents should change its identity
+    without needing to read anything past the superblock.
+
+    Args:
+        path (:class:`pathlib.Path`): Path to an hdf5 file
+
+    Returns:
+        str: sha256 hex digest
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    with h5py.File(str(path), "r") as h5f:
+        superblock_start = h5f.userblock_size
+    with open(path, "rb") as f:
+        f.seek(superblock_start)
+        superblock = f.read(SUPERBLOCK_SIZE)
+
+    identity = hashlib.sha256()
+    identity.update(f"{path}|{stat.st_size}|{stat.st_mtime_ns}|".encode())
+    identity.update(superblock)
+    return identity.hexdigest()
+
+
+class ReadPlan(BaseModel):
+    """
+    A filtered dependency graph (see :func:`.hdf_dependency_graph` ,
+    :func:`.filter_dependency_graph` ) and the order to read its nodes in,
+    stored so that repeated reads of the same file don't need to walk the whole file.
+
+    Plans are cached as JSON in :attr:`.Config.plan_dir` , keyed by :func:`.file_identity` .
+    """
+
+    nodes: Dict[str, Dict[str, str]]
+    """
+    Mapping from each node's path to the subset of its attributes in :data:`.PLAN_NODE_ATTRS`
+    """
+    edges: List[Tuple[str, str, str]]
+    """``(source, target, label)`` for each edge"""
+    order: List[str]
+    """Topological order to read the nodes in, dependencies first"""
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "ReadPlan":
+        """
+        Create a plan from a (filtered) dependency graph
+
+        Attributes stored as bytes (eg. fixed-length hdf5 strings) are decoded.
+        """
+        nodes = {
+            node: {
+                k: attrs[k].decode("utf-8") if isinstance(attrs[k], bytes) else str(attrs[k])
+                for k in PLAN_NODE_ATTRS
+                if k in attrs
+            }
+            for node, attrs in graph.nodes(data=True)
+        }
+        edges = [(source, target, label) for source, target, label in graph.edges(data="label")]
+        order = list(reversed(list(nx.topological_sort(graph))))
+        return cls(nodes=nodes, edges=edges, order=order)
+
+    @classmethod
+    def from_file(cls, h5f: Path | h5py.File | h5py.Group) -> "ReadPlan":
+        """
+        Create a plan by walking an hdf5 file or group
+        """
+        graph = hdf_dependency_graph(h5f)
+        graph = filter_dependency_graph(graph)
+        return cls.from_graph(graph)
+
+    @classmethod
+    def cache_path(cls, path: Path, plan_dir: Optional[Path] = None) -> Path:
+        """
+        Location of the cached plan for an hdf5 file
+
+        Args:
+            path (:class:`pathlib.Path`): Path to the hdf5 file
+            plan_dir (:class:`pathlib.Path`): Directory to store plans in.
+                If ``None`` (default), use :attr:`.Config.plan_dir`
+        """
+        if plan_dir is None:
+            plan_dir = Config().plan_dir
+        return Path(plan_dir) / f"{file_identity(path)}.json"
+
+    @classmethod
+    def load(cls, path: Path, plan_dir: Optional[Path] = None) -> Optional["ReadPlan"]:
+        """
+        Load a cached plan for an hdf5 file if one exists.
+
+        Returns:
+            :class:`.ReadPlan` or ``None`` if there is no cached plan
+        """
+        cache_path = cls.cache_path(path, plan_dir)
+        if not cache_path.exists():
+            return None
+        return cls.model_validate_json(cache_path.read_text())
+
+    def dump(self, path: Path, plan_dir: Optional[Path] = None) -> Path:
+        """
+        Cache this plan for an hdf5 file (see :func:`.write_atomic` ).
+
+        Returns:
+            :class:`pathlib.Path` path of the cached plan
+        """
+        cache_path = self.cache_path(path, plan_dir)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        return write_atomic(cache_path, self.model_dump_json())
+
+    def to_graph(self) -> nx.DiGraph:
+        """
+        Recreate the dependency graph, with the node attributes stored in the plan
+        """
+        g = nx.DiGraph()
+        g.add_nodes_from(self.nodes.items())
+        g.add_edges_from((source, target, {"label": label}) for source, target, label in self.edges)
+        return g
+
+    def match(self, paths: str | List[str]) -> List[str]:
+        """
+        Find the nodes in the plan that match a path or list of paths.
+
+        Paths can be literal hdf5 paths or glob patterns, where wildcards only match
+        within a single level of the hierarchy (eg. ``/acquisition/*``
+        matches ``/acquisition/series`` but not ``/acquisition/series/data`` ).
+        Literal paths that are not in the plan (eg. because they were filtered from
+        the dependency graph) are returned as-is.
+
+        Returns:
+            list[str]: Matching paths, in the order they were given,
+            with glob matches in read order.
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+
+        matches = []
+        for path in paths:
+            if GLOB_PATTERN.search(path):
+                matches.extend(node for node in self.order if PurePosixPath(node).match(path))
+            else:
+                path = path.rstrip("/") if path != "/" else path
+                matches.append(path)
+        return list(dict.fromkeys(matches))
+
+    def closure(self, paths: List[str]) -> List[str]:
+        """
+        The minimal set of nodes that need to be loaded to read ``paths`` -
+        the paths themselves and all their children and references, recursively.
+
+        Args:
+            paths (list[str]): Nodes to read (see :meth:`.match` )
+
+        Returns:
+            list[str]: Nodes in read order
+        """
+        graph = self.to_graph()
+        needed = set()
+        for path in paths:
+            if path in graph:
+                needed.add(path)
+                needed.update(nx.descendants(graph, path))
+        return [node for node in self.order if node in needed]
+
+
+def _is_trusted(annotation: Any, value: Any) -> bool:
+    """
+    Whether validating ``value`` against ``annotation`` would return it unchanged.
+
+    Conservative - only plain python types, already-built models, and containers of them
+    are trusted. Anything else (arrays, numpy scalars, dicts that would be cast to models...)
+    is not.
+    """
+    if annotation is Any:
+        return True
+    if annotation is None or annotation is type(None):
+        return value is None
+
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        return any(_is_trusted(arg, value) for arg in get_args(annotation))
+    elif origin is Literal:
+        return any(type(value) is type(arg) and value == arg for arg in get_args(annotation))
+    elif origin is dict:
+        _, val_type = get_args(annotation)
+        return type(value) is dict and all(
+            type(k) is str and _is_trusted(val_type, v) for k, v in value.items()
+        )
+    elif origin is list:
+        (item_type,) = get_args(annotation)
+        return type(value) is list and all(_is_trusted(item_type, v) for v in value)
+    elif origin is not None or not isinstance(annotation, type):
+        # generics, TypeVars, etc.
+        return False
+    elif issubclass(annotation, BaseModel):
+        # parent classes would be recast by ``coerce_subclass``
+        return isinstance(value, annotation)
+    elif annotation in (str, int, float, bool):
+        return type(value) is annotation
+    return False
+
+
+def _construct(model: type[BaseModel], args: dict, validate: bool = False) -> BaseModel:
+    """
+    Build a model from values loaded from an hdf5 file.
+
+    Values read from the file are already resolved to the types that the
+    model expects - nested models have already been built, references resolved, etc.
+    so validating the whole model again mostly just runs the rescue validators
+    (see :data:`~nwb_linkml.includes.base.RESCUE_VALIDATORS` ) over values that are already fine.
+
+    Instead, the trusted values (see :func:`._is_trusted` ) are set as they are,
+    and only the rest (arrays, numpy scalars, etc.) are validated one field at a time
+    (see :func:`~nwb_linkml.includes.base._construct_validating` ).
+
+    Models that aren't :func:`~nwb_linkml.includes.base._constructable` from the values
+    are always validated in full.
+
+    Args:
+        model (type[:class:`pydantic.BaseModel`]): Model to build
+        args (dict): Field values
+        validate (bool): If ``True`` , always validate the whole model
+
+    Returns:
+        :class:`pydantic.BaseModel` : an instance of ``model``
+    """
+    if validate or not _constructable(model, args):
+        return model(**args)
+
+    fields = model.model_fields
+    trusted = {}
+    untrusted = {}
+    for key, value in args.items():
+        field = fields.get(key)
+        if field is None or (not field.metadata and _is_trusted(field.annotation, value)):
+            trusted[key] = value
+        else:
+            untrusted[key] = value
+
+    return _construct_validating(model, trusted, untrusted)
+
+
 def _load_node(
-    path: str, h5f: h5py.File, provider: "SchemaProvider", context: dict
+    path: str,
+    h5f: h5py.File,
+    provider: "SchemaProvider",
+    context: dict,
+    validate: bool = False,
 ) -> dict | BaseModel:
     """
     Load an individual node in the graph, then removes it from the graph
@@ -152,6 +444,8 @@ def _load_node(
         path:
         g:
         context:
+        validate (bool): If ``True`` , fully validate models rather than
+            only validating the values that need it (see :func:`._construct` )
 
     Returns:
 
@@ -171,8 +465,11 @@ def _load_node(
             del args[".specloc"]
 
         model = provider.get_class(obj.attrs["namespace"], obj.attrs["neurodata_type"])
-        return model(**args)
+        return _construct(model, args, validate)
 
+    elif not isinstance(args, dict):
+        # scalar dataset
+        return args
     else:
         if "name" in args:
             del args["name"]
@@ -200,13 +497,14 @@ def _load_dataset(
             return val
 
         res["value"] = val
-    elif len(dataset) > 0 and isinstance(dataset[0], h5py.h5r.Reference):
+    elif is_reference_dtype(dataset.dtype):
         # vector of references
         res["value"] = [context.get(h5f[ref].name) for ref in dataset[:]]
     elif len(dataset.dtype) > 1:
         # compound dataset - check if any of the fields are references
+        ref_fields = get_reference_fields(dataset.dtype)
         for name in dataset.dtype.names:
-            if isinstance(dataset[name][0], h5py.h5r.Reference):
+            if name in ref_fields:
                 res[name] = [context.get(h5f[ref].name) for ref in dataset[name]]
             else:
                 res[name] = H5ArrayPath(h5f.filename, dataset.name, name)
@@ -275,6 +573,105 @@ def _load_group(group: h5py.Group, h5f: h5py.File, context: dict) -> dict:
     return res
 
 
+def _load_generations(
+    graph: nx.DiGraph,
+    h5f: h5py.File,
+    provider: "SchemaProvider",
+    context: dict,
+    max_workers: Optional[int] = None,
+    validate: bool = False,
+) -> dict:
+    """
+    Load the nodes in a dependency graph in parallel, one topological generation at a time.
+
+    Nodes within a generation have no edges between them, so each can be loaded
+    independently from the ``context`` built by the previous generations.
+    Results are only added to ``context`` once the whole generation has completed,
+    and are added in sorted node order, so the loaded objects are the same
+    regardless of how the threads are scheduled.
+
+    Args:
+        graph (:class:`networkx.DiGraph`): Filtered dependency graph
+            (see :func:`.filter_dependency_graph` )
+        h5f (:class:`h5py.File`): Open hdf5 file
+        provider (:class:`.SchemaProvider`): Provider to get model classes from
+        context (dict): Already-loaded nodes, updated in place
+        max_workers (int, optional): Number of threads to use.
+            If ``None`` , use the :class:`concurrent.futures.ThreadPoolExecutor` default.
+        validate (bool): Fully validate models (see :func:`._construct` )
+
+    Returns:
+        dict: the updated ``context``
+    """
+    # import the generated modules before starting any threads,
+    # concurrent first imports of the same module are not safe
+    for ns, ndtype in {
+        (attrs["namespace"], attrs["neurodata_type"])
+        for attrs in graph.nodes.values()
+        if "namespace" in attrs and "neurodata_type" in attrs
+    }:
+        provider.get_class(ns, ndtype)
+
+    # generations go from dependents to dependencies, so read them in reverse
+    generations = list(reversed(list(nx.topological_generations(graph))))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for generation in generations:
+            generation = sorted(generation)
+            results = list(
+                executor.map(
+                    lambda node: _load_node(node, h5f, provider, context, validate), generation
+                )
+            )
+            context.update(zip(generation, results))
+
+    return context
+
+
+def _load_closure(
+    plan: "ReadPlan",
+    targets: List[str],
+    h5f: h5py.File,
+    provider: "SchemaProvider",
+    context: dict,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    validate: bool = False,
+) -> dict:
+    """
+    Load some target nodes and everything they depend on (see :meth:`.ReadPlan.closure` ),
+    skipping any nodes that are already in ``context`` .
+
+    Args:
+        plan (:class:`.ReadPlan`): Plan for the whole file
+        targets (list[str]): Paths to load
+        h5f (:class:`h5py.File`): Open hdf5 file
+        provider (:class:`.SchemaProvider`): Provider to get model classes from
+        context (dict): Already-loaded nodes, updated in place
+        parallel (bool): Load with :func:`._load_generations` rather than one node at a time
+        max_workers (int, optional): Number of threads to use when ``parallel == True``
+        validate (bool): Fully validate models (see :func:`._construct` )
+
+    Returns:
+        dict: the updated ``context``
+    """
+    nodes = [node for node in plan.closure(targets) if node not in context]
+
+    if parallel:
+        graph = plan.to_graph().subgraph(nodes)
+        _load_generations(graph, h5f, provider, context, max_workers, validate)
+    else:
+        for node in nodes:
+            res = _load_node(node, h5f, provider, context, validate)
+            context[node] = res
+
+    # nodes that were filtered from the plan (eg. untyped datasets) are loaded directly
+    for target in targets:
+        if target not in context:
+            context[target] = _load_node(target, h5f, provider, context, validate)
+
+    return context
+
+
 class HDF5IO:
     """
     Read (and eventually write) from an NWB HDF5 file.
@@ -285,12 +682,59 @@ class HDF5IO:
         self._modules: Dict[str, ModuleType] = {}
 
     @overload
-    def read(self, path: None) -> "NWBFile": ...
+    def read(
+        self,
+        path: Optional[str] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        *,
+        lazy: Literal[True],
+        validate: bool = False,
+    ) -> "LazyGroup": ...
 
     @overload
-    def read(self, path: str) -> BaseModel | Dict[str, BaseModel]: ...
+    def read(
+        self,
+        path: None = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        lazy: bool = False,
+        validate: bool = False,
+    ) -> "NWBFile": ...
 
-    def read(self, path: Optional[str] = None) -> Union["NWBFile", BaseModel, Dict[str, BaseModel]]:
+    @overload
+    def read(
+        self,
+        path: str,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        lazy: bool = False,
+        validate: bool = False,
+    ) -> BaseModel | Dict[str, BaseModel]: ...
+
+    @overload
+    def read(
+        self,
+        path: List[str],
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        lazy: bool = False,
+        validate: bool = False,
+    ) -> Dict[str, BaseModel | dict]: ...
+
+    def read(
+        self,
+        path: Optional[str | List[str]] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        lazy: bool = False,
+        validate: bool = False,
+    ) -> Union["NWBFile", BaseModel, Dict[str, BaseModel], "LazyGroup"]:
         """
         Read data into models from an NWB File.
 
@@ -322,34 +766,86 @@ class HDF5IO:
             not rig up a whole query system ourselves.
 
         Args:
-            path (Optional[str]): If ``None`` (default), read whole file.
-                Otherwise, read from specific (hdf5) path and its children
+            path (Optional[str | list[str]]): If ``None`` (default), read whole file.
+                Otherwise, read from a specific (hdf5) path, glob pattern, or list of them
+                (see :meth:`.ReadPlan.match` ). Only the requested nodes and
+                the nodes they depend on (their children and anything they reference,
+                wherever it is in the file) are loaded (see :meth:`.ReadPlan.closure` ).
+            parallel (bool): If ``True`` , load each topological generation of the dependency
+                graph on a thread pool (see :func:`._load_generations` ).
+                If ``False`` (default), load nodes one at a time.
+            max_workers (Optional[int]): Number of threads to use when ``parallel == True`` .
+                If ``None`` , use the :class:`concurrent.futures.ThreadPoolExecutor` default.
+            cache (bool): If ``True`` , use a cached :class:`.ReadPlan` , or cache it
+                if it hasn't been made yet (see :meth:`.plan` ). Off by default,
+                so reads don't write to :attr:`.Config.plan_dir` unless asked to.
+            lazy (bool): If ``True`` , don't read anything yet, and instead return a
+                :class:`.LazyGroup` proxy for ``path`` (or the root of the file)
+                that reads its children when they are accessed.
+                Close it (or use it as a context manager) to close the file.
+            validate (bool): If ``True`` , fully validate every model.
+                Otherwise (default), values read from the file that are already
+                the right type are trusted, and only the rest are validated
+                (see :func:`._construct` ).
 
         Returns:
             ``NWBFile`` if ``path`` is ``None``,
-            otherwise whatever Model or dictionary of models applies to the requested ``path``
+            otherwise whatever Model or dictionary of models applies to the requested ``path`` ,
+            or a dictionary mapping each matched path to its model
+            if ``path`` is a list or a glob pattern.
+            A :class:`.LazyGroup` if ``lazy == True``
         """
 
+        if lazy:
+            if path is not None and not isinstance(path, str):
+                raise ValueError("Lazy reads can only be made from a single path")
+            reader = _LazyReader(
+                self, cache=cache, parallel=parallel, max_workers=max_workers, validate=validate
+            )
+            return reader.group(path if path is not None else "/")
+
         provider = self.make_provider()
 
         h5f = h5py.File(str(self.path))
-        src = h5f.get(path) if path else h5f
-        graph = hdf_dependency_graph(src)
-        graph = filter_dependency_graph(graph)
+        plan = self.plan(cache=cache)
+
+        targets = plan.match(path if path is not None else "/")
+        for target in targets:
+            if target not in h5f:
+                raise KeyError(f"{target} not found in {self.path}")
 
-        # topo sort to get read order
-        # TODO: This could be parallelized using `topological_generations`,
-        # but it's not clear what the perf bonus would be because there are many generations
-        # with few items
-        topo_order = list(reversed(list(nx.topological_sort(graph))))
         context = {}
-        for node in topo_order:
-            res = _load_node(node, h5f, provider, context)
-            context[node] = res
+        _load_closure(plan, targets, h5f, provider, context, parallel, max_workers, validate)
+
+        if isinstance(path, str) and not GLOB_PATTERN.search(path):
+            return context[targets[0]]
+        elif path is None:
+            return context["/"]
+        else:
+            return {target: context[target] for target in targets}
 
-        if path is None:
-            path = "/"
-        return context[path]
+    def plan(self, cache: bool = True) -> ReadPlan:
+        """
+        Get the :class:`.ReadPlan` for the whole file.
+
+        Args:
+            cache (bool): If ``True`` (default), load the plan from :attr:`.Config.plan_dir`
+                if it has already been made for this exact file (see :func:`.file_identity` ),
+                otherwise make it and store it there.
+                If ``False`` , always walk the file to make a new plan.
+
+        Returns:
+            :class:`.ReadPlan`
+        """
+        if cache and (plan := ReadPlan.load(self.path)) is not None:
+            return plan
+
+        with h5py.File(str(self.path), "r") as h5f:
+            plan = ReadPlan.from_file(h5f)
+
+        if cache:
+            plan.dump(self.path)
+        return plan
 
     def write(self, path: Path) -> Never:
         """
@@ -377,35 +873,420 @@ class HDF5IO:
         """
         raise NotImplementedError("Writing to HDF5 is not implemented yet!")
 
-    def make_provider(self) -> "SchemaProvider":
+    def make_provider(self, cache: bool = True) -> "SchemaProvider":
         """
         Create a :class:`~.providers.schema.SchemaProvider` by
         reading specifications from the NWBFile ``/specification`` group and translating
         them to LinkML and generating pydantic models
 
+        Models are built into a directory beneath :attr:`.Config.spec_dir` named by the
+        :func:`.spec_hash` of the embedded specifications, so files that embed
+        different specifications under the same namespace versions don't overwrite
+        each other's models. Files that embed the same specifications reuse the models
+        already built in that directory, or the provider already made for them
+        in this process, without reading or building the specifications again.
+
+        Note:
+            Generated modules are imported by namespace and version
+            (see :meth:`.PydanticProvider.module_name` ), so only one variant
+            of a given namespace version can be imported in a python session.
+
+        Args:
+            cache (bool): If ``True`` (default), use already-built models for the
+                specifications if they exist. If ``False`` , always build them.
+
         Returns:
             :class:`~.providers.schema.SchemaProvider` : Schema Provider with correct versions
                 specified as defaults
         """
+        from nwb_linkml.providers.pydantic import PydanticProvider
         from nwb_linkml.providers.schema import SchemaProvider
 
         h5f = h5py.File(str(self.path), "r")
-        schema = read_specs_as_dicts(h5f.get("specifications"))
+        specs = h5f.get("specifications")
+        key = spec_hash(specs)
+        if cache and key in _spec_providers:
+            h5f.close()
+            return _spec_providers[key]
+
+        path = Config().spec_dir / key
+        versions_file = path / SPEC_VERSIONS_FILE
+        # wait for any other process that is building these specs
+        with path_lock(path):
+            if cache and versions_file.exists():
+                h5f.close()
+                provider = SchemaProvider(versions=json.loads(versions_file.read_text()), path=path)
+                PydanticProvider(path=path).install_pathfinder()
+                _spec_providers[key] = provider
+                return provider
+
+            schema = read_specs_as_dicts(specs)
+
+            # get versions for each namespace
+            versions = {}
+            for ns_schema in schema.values():
+                # each "namespace" can actually contain multiple namespaces
+                # which actually contain the version info
+                for inner_ns in ns_schema["namespace"]["namespaces"]:
+                    versions[inner_ns["name"]] = inner_ns["version"]
+
+            provider = SchemaProvider(versions=versions, path=path)
+
+            # build schema so we have them cached
+            provider.build_from_dicts(schema, force=not cache)
+            h5f.close()
+
+            # only mark the models as built once they all are
+            write_atomic(versions_file, json.dumps(versions))
+
+        _spec_providers[key] = provider
+        return provider
 
-        # get versions for each namespace
-        versions = {}
-        for ns_schema in schema.values():
-            # each "namespace" can actually contain multiple namespaces
-            # which actually contain the version info
-            for inner_ns in ns_schema["namespace"]["namespaces"]:
-                versions[inner_ns["name"]] = inner_ns["version"]
 
-        provider = SchemaProvider(versions=versions)
+class _LazyReader:
+    """
+    State shared by all the :class:`.LazyGroup` s made from a single lazy
+    :meth:`.HDF5IO.read` - the open file, the loaded nodes, and the
+    provider and plan, which are only made once they are needed.
 
-        # build schema so we have them cached
-        provider.build_from_dicts(schema)
-        h5f.close()
-        return provider
+    The file is opened when it is first needed, and stays open until :meth:`.close` .
+    """
+
+    def __init__(
+        self,
+        io: HDF5IO,
+        cache: bool = False,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        validate: bool = False,
+    ):
+        self.io = io
+        self.cache = cache
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.validate = validate
+        self.context = {}
+        self.groups: Dict[str, LazyGroup] = {}
+        self._provider: Optional[SchemaProvider] = None
+        self._plan: Optional[ReadPlan] = None
+        self._h5f: Optional[h5py.File] = None
+
+    @property
+    def h5f(self) -> h5py.File:
+        """The open file, (re)opened if it isn't open"""
+        if not self._h5f:
+            self._h5f = h5py.File(str(self.io.path), "r")
+        return self._h5f
+
+    def close(self) -> None:
+        """Close the file, if it's open"""
+        if self._h5f:
+            self._h5f.close()
+        self._h5f = None
+
+    @property
+    def provider(self) -> "SchemaProvider":
+        if self._provider is None:
+            self._provider = self.io.make_provider()
+        return self._provider
+
+    @property
+    def plan(self) -> ReadPlan:
+        if self._plan is None:
+            self._plan = self.io.plan(cache=self.cache)
+        return self._plan
+
+    def group(self, path: str) -> "LazyGroup":
+        """Get the (memoized) proxy for an untyped group"""
+        if path not in self.groups:
+            self.groups[path] = LazyGroup(self, path)
+        return self.groups[path]
+
+    def load(self, path: str) -> Any:
+        """
+        Load a node, along with its dependency closure if it has one.
+
+        Untyped datasets without any references don't depend on anything,
+        so they are read directly without needing the provider or plan.
+        """
+        if path in self.context:
+            return self.context[path]
+
+        obj = self.h5f[path]
+        if (
+            isinstance(obj, h5py.Dataset)
+            and "neurodata_type" not in obj.attrs
+            and not get_references(obj)
+        ):
+            val = _load_node(path, self.h5f, None, self.context)
+            if isinstance(val, bytes):
+                # as would be coerced by the parent model's ``str`` field
+                val = val.decode("utf-8")
+            self.context[path] = val
+        else:
+            _load_closure(
+                self.plan,
+                [path],
+                self.h5f,
+                self.provider,
+                self.context,
+                self.parallel,
+                self.max_workers,
+                self.validate,
+            )
+        return self.context[path]
+
+
+class LazyGroup:
+    """
+    Proxy to a group in an NWB file that only reads its children when they are accessed.
+
+    Children are accessed by their names in the hdf5 file, either as attributes
+    or items, eg. ``nwbfile.acquisition["my_series"]`` or ``nwbfile.session_description`` .
+
+    * Groups without a ``neurodata_type`` are returned as nested :class:`.LazyGroup` s
+    * Datasets without a ``neurodata_type`` or references are read directly
+    * Everything else is loaded as a model, along with everything it depends on
+      (see :meth:`.ReadPlan.closure` )
+
+    Loaded children are memoized and shared between all the proxies
+    made by the same call to :meth:`.HDF5IO.read` , so models that are referred to
+    from several places (like an electrodes table) are only loaded once.
+
+    Group attributes can be accessed as attributes too, or from :attr:`.attrs` .
+    Use :meth:`.materialize` to read the whole group at once.
+
+    The file stays open while children are being accessed - use the proxy as a
+    context manager or call :meth:`.close` to close it when done. Loaded children
+    can still be used after closing, and accessing more of them reopens the file.
+    """
+
+    def __init__(self, reader: _LazyReader, path: str = "/"):
+        self._reader = reader
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """hdf5 path of the group"""
+        return self._path
+
+    @property
+    def attrs(self) -> dict:
+        """hdf5 attributes of the group"""
+        return dict(self._reader.h5f[self._path].attrs)
+
+    def keys(self) -> List[str]:
+        """Names of the children of the group"""
+        return list(self._reader.h5f[self._path].keys())
+
+    def materialize(self) -> Union["NWBFile", BaseModel, dict]:
+        """
+        Read the whole group - the same thing that :meth:`.HDF5IO.read` would return for it.
+        """
+        path = self._path
+        if path not in self._reader.context and path not in self._reader.plan.nodes:
+            # untyped groups with no children in the plan don't depend on anything
+            self._reader.context[path] = _load_node(
+                path, self._reader.h5f, None, self._reader.context
+            )
+        return self._reader.load(path)
+
+    def close(self) -> None:
+        """
+        Close the file shared by all the proxies made by the same :meth:`.HDF5IO.read`
+        """
+        self._reader.close()
+
+    def __enter__(self) -> "LazyGroup":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _child_path(self, key: str) -> str:
+        return "/".join([self._path.rstrip("/"), key])
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._reader.h5f[self._path]:
+            raise KeyError(f"{key} not found in {self._path}")
+
+        path = self._child_path(key)
+        obj = self._reader.h5f[path]
+        if isinstance(obj, h5py.Group) and "neurodata_type" not in obj.attrs:
+            return self._reader.group(path)
+        return self._reader.load(path)
+
+    def __getattr__(self, item: str) -> Any:
+        if item.startswith("_"):
+            raise AttributeError(item)
+        try:
+            return self[item]
+        except KeyError:
+            attrs = self._reader.h5f[self._path].attrs
+            if item in attrs:
+                return attrs[item]
+            raise AttributeError(f"{self._path} has no child or attribute named {item}") from None
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._reader.h5f[self._path]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._reader.h5f[self._path])
+
+    def __dir__(self) -> List[str]:
+        return [*super().__dir__(), *self.keys()]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path}, children={self.keys()})"
+
+
+@dataclass
+class ReadResult:
+    """Result of reading a single file with :func:`.read_many`"""
+
+    path: Path
+    """The file that was read"""
+    result: Any = None
+    """What was read, or what ``fn`` returned for it, if the read succeeded"""
+    error: Optional[BaseException] = None
+    """The exception raised while reading, if it failed"""
+    traceback: Optional[str] = None
+    """Formatted traceback for :attr:`.error`"""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was read successfully"""
+        return self.error is None
+
+
+def _read_one(
+    path: Path,
+    read_path: Optional[str | List[str]] = None,
+    fn: Optional[Callable[[Any], Any]] = None,
+    cache: bool = False,
+) -> Any:
+    """Read a single file in a :func:`.read_many` worker process"""
+    res = HDF5IO(path).read(read_path, cache=cache)
+    if fn is not None:
+        res = fn(res)
+    return res
+
+
+def _error_result(path: Path, e: BaseException) -> ReadResult:
+    return ReadResult(
+        path=path,
+        error=e,
+        traceback="".join(traceback.format_exception(type(e), e, e.__traceback__)),
+    )
+
+
+def read_many(
+    paths: Iterable[Path],
+    path: Optional[str | List[str]] = None,
+    fn: Optional[Callable[[Any], Any]] = None,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    cache: bool = False,
+) -> Iterator[ReadResult]:
+    """
+    Read many NWB files in a process pool.
+
+    Files are grouped by the :func:`.spec_hash` of their embedded specifications,
+    and models for each distinct set of specifications are built once
+    (see :meth:`.HDF5IO.make_provider` ) before any files are read,
+    so the workers only ever load already-built models.
+
+    Results are yielded as soon as each file is finished, in the order they finish,
+    and no more than ``max_in_flight`` files are being read or waiting to be yielded
+    at once. Files that fail to read are yielded as :class:`.ReadResult` s with
+    an :attr:`~.ReadResult.error` rather than raising.
+
+    Results have to be pickled to get them back from the workers, and generated models
+    can't always be pickled (eg. generic array classes like ``VectorData[NDArray]`` ),
+    so use ``fn`` to reduce what is read to what you need, eg. a dict of metadata.
+
+    Examples:
+
+        .. code-block:: python
+
+            def summarize(nwbfile):
+                return {
+                    "identifier": nwbfile.identifier,
+                    "acquisition": list(nwbfile.acquisition.keys()),
+                }
+
+            for res in read_many(Path("archive").rglob("*.nwb"), fn=summarize):
+                if res.ok:
+                    index[res.path] = res.result
+                else:
+                    print(res.traceback)
+
+    Args:
+        paths (Iterable[:class:`pathlib.Path`]): Files to read
+        path (Optional[str | list[str]]): Path within each file to read,
+            passed to :meth:`.HDF5IO.read`
+        fn (Callable, optional): Called in the worker with the result of each read,
+            returning what should be sent back instead.
+            Must be picklable, eg. a module-level function.
+        max_workers (int, optional): Number of worker processes.
+            If ``None`` , use the :class:`concurrent.futures.ProcessPoolExecutor` default.
+        max_in_flight (int, optional): Maximum number of files submitted to the pool
+            and not yet yielded. If ``None`` , twice the number of workers.
+        cache (bool): Use cached read plans, passed to :meth:`.HDF5IO.read`
+
+    Yields:
+        :class:`.ReadResult`
+    """
+    paths = [Path(p) for p in paths]
+
+    # build the models for each distinct set of specifications once
+    to_read = []
+    prebuilt = set()
+    for a_path in paths:
+        try:
+            with h5py.File(str(a_path), "r") as h5f:
+                key = spec_hash(h5f["specifications"])
+            if key not in prebuilt:
+                HDF5IO(a_path).make_provider()
+                prebuilt.add(key)
+        except Exception as e:
+            yield _error_result(a_path, e)
+            continue
+        to_read.append(a_path)
+
+    if max_workers is None:
+        max_workers = min(32, os.cpu_count() or 1)
+    if max_in_flight is None:
+        max_in_flight = max_workers * 2
+
+    remaining = iter(to_read)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+        while True:
+            for a_path in remaining:
+                in_flight[executor.submit(_read_one, a_path, path, fn, cache)] = a_path
+                if len(in_flight) >= max_in_flight:
+                    break
+
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                a_path = in_flight.pop(future)
+                try:
+                    res = ReadResult(path=a_path, result=future.result())
+                except Exception as e:
+                    res = _error_result(a_path, e)
+                yield res
 
 
 def read_specs_as_dicts(group: h5py.Group) -> dict:
@@ -436,6 +1317,40 @@ def read_specs_as_dicts(group: h5py.Group) -> dict:
     return spec_dict
 
 
+def spec_hash(group: h5py.Group) -> str:
+    """
+    Hash of the specifications embedded in an NWB file, used to identify
+    files that can use the same generated models.
+
+    Hashes the serialized specifications as they are stored,
+    without needing to parse them.
+
+    Args:
+        group ( :class:`h5py.Group` ): the ``/specifications`` group!
+
+    Returns:
+        str: sha256 hex digest
+    """
+    specs = []
+
+    def _read_spec(name: str, node: h5py.Dataset) -> None:
+        if isinstance(node, h5py.Dataset):
+            spec = node[()]
+            if isinstance(spec, str):
+                spec = spec.encode("utf-8")
+            specs.append((node.name, spec))
+
+    group.visititems(_read_spec)
+
+    spec_hash = hashlib.sha256()
+    for name, spec in sorted(specs):
+        spec_hash.update(name.encode("utf-8"))
+        spec_hash.update(b"\0")
+        spec_hash.update(spec)
+        spec_hash.update(b"\0")
+    return spec_hash.hexdigest()
+
+
 def find_references(h5f: h5py.File, path: str) -> List[str]:
     """
     Find all objects that make a reference to a given object in
@@ -467,15 +1382,12 @@ def find_references(h5f: h5py.File, path: str) -> List[str]:
 
         if isinstance(obj, h5py.Dataset):
             # dataset is all references
-            if obj.dtype.metadata is not None and isinstance(
-                obj.dtype.metadata.get("ref", None), h5py.h5r.Reference
-            ):
+            if is_reference_dtype(obj.dtype):
                 refs.extend(obj[:].tolist())
             # compound dtype
-            elif isinstance(obj.dtype, np.dtypes.VoidDType):
-                for name in obj.dtype.names:
-                    if isinstance(obj[name][0], h5py.h5r.Reference):
-                        refs.extend(obj[name].tolist())
+            else:
+                for name in get_reference_fields(obj.dtype):
+                    refs.extend(obj[name].tolist())
 
         for ref in refs:
             assert isinstance(ref, h5py.h5r.Reference)
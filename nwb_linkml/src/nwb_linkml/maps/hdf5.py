@@ -11,6 +11,7 @@ so we will make our own mapping class here and re-evaluate whether they should b
 from typing import List, Union
 
 import h5py
+import numpy as np
 
 
 def get_attr_references(obj: h5py.Dataset | h5py.Group) -> dict[str, str]:
@@ -25,26 +26,45 @@ def get_attr_references(obj: h5py.Dataset | h5py.Group) -> dict[str, str]:
     return refs
 
 
+def is_reference_dtype(dtype: np.dtype) -> bool:
+    """
+    Check if a dtype holds object or region references using only its metadata,
+    without reading any data.
+    """
+    return h5py.check_ref_dtype(dtype) in (h5py.Reference, h5py.RegionReference)
+
+
+def get_reference_fields(dtype: np.dtype) -> List[str]:
+    """
+    Names of the fields in a compound dtype that hold object references.
+
+    Empty if the dtype is not compound or has no reference fields
+    """
+    if dtype.names is None:
+        return []
+    return [name for name in dtype.names if is_reference_dtype(dtype.fields[name][0])]
+
+
 def get_dataset_references(obj: h5py.Dataset | h5py.Group) -> list[str] | dict[str, str]:
     """
     Get references in datasets
+
+    Whether a dataset (or a field in a compound dataset) contains references
+    is determined from its dtype, so only datasets that hold references are read.
     """
     refs = []
     # For datasets, apply checks depending on shape of data.
     if isinstance(obj, h5py.Dataset):
-        if obj.shape == ():
-            # scalar
-            if isinstance(obj[()], h5py.h5r.Reference):
+        if is_reference_dtype(obj.dtype):
+            if obj.shape == ():
+                # scalar
                 refs = [obj.file.get(obj[()]).name]
-        elif len(obj) > 0 and isinstance(obj[0], h5py.h5r.Reference):
-            # single-column
-            refs = [obj.file.get(ref).name for ref in obj[:]]
-        elif len(obj.dtype) > 1:
+            else:
+                # single-column
+                refs = [obj.file.get(ref).name for ref in obj[:]]
+        elif ref_fields := get_reference_fields(obj.dtype):
             # "compound" datasets
-            refs = {}
-            for name in obj.dtype.names:
-                if isinstance(obj[name][0], h5py.h5r.Reference):
-                    refs[name] = [obj.file.get(ref).name for ref in obj[name]]
+            refs = {name: [obj.file.get(ref).name for ref in obj[name]] for name in ref_fields}
     return refs
 
 
@@ -0,0 +1,155 @@
+"""
+Locking and atomic writes for provider cache directories,
+so many processes can share a cache directory (eg. by setting the same
+``NWB_LINKML_CACHE_DIR`` ) without building the same thing twice
+or importing half-written models.
+
+* Builders hold a :func:`.path_lock` on their provider's directory while they
+  check whether something needs to be built and build it, so other builders wait
+  for them to finish and then find it already built.
+* Built files and directories are written somewhere temporary and then
+  moved into place (:func:`.write_atomic` , :func:`.publish_directory` ),
+  so readers never see partial results.
+"""
+
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+LOCK_FILE = ".lock"
+"""Name of the lock file made in a locked directory"""
+
+
+@dataclass
+class _LockState:
+    """Per-process state of a lock file"""
+
+    rlock: threading.RLock
+    depth: int = 0
+    fd: Optional[int] = None
+
+
+_lock_states: Dict[str, _LockState] = {}
+_lock_states_lock = threading.Lock()
+
+
+def _acquire(fd: int, blocking: bool = True) -> None:
+    if sys.platform == "win32":
+        # msvcrt only blocks for ~10s before raising, so keep trying
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                return
+            except OSError as e:
+                if not blocking:
+                    raise BlockingIOError(str(e)) from e
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _release(fd: int) -> None:
+    if sys.platform == "win32":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def path_lock(path: Path, blocking: bool = True) -> Iterator[Path]:
+    """
+    Exclusive lock on a directory, shared between processes and threads.
+
+    Reentrant within a thread, so a builder can call other methods that lock the same
+    directory while it holds the lock.
+
+    Args:
+        path (:class:`pathlib.Path`): Directory to lock. Created if it doesn't exist.
+        blocking (bool): If ``True`` (default), wait for the lock.
+            Otherwise raise a :class:`BlockingIOError` if another process holds it.
+
+    Yields:
+        :class:`pathlib.Path` : the lock file
+    """
+    path = Path(path).resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    lock_file = path / LOCK_FILE
+
+    with _lock_states_lock:
+        state = _lock_states.setdefault(str(lock_file), _LockState(rlock=threading.RLock()))
+
+    if not state.rlock.acquire(blocking=blocking):
+        raise BlockingIOError(f"{lock_file} is locked by another thread")
+    try:
+        if state.depth == 0:
+            fd = os.open(lock_file, os.O_RDWR | os.O_CREAT)
+            try:
+                _acquire(fd, blocking)
+            except BaseException:
+                os.close(fd)
+                raise
+            state.fd = fd
+        state.depth += 1
+        try:
+            yield lock_file
+        finally:
+            state.depth -= 1
+            if state.depth == 0:
+                _release(state.fd)
+                os.close(state.fd)
+                state.fd = None
+    finally:
+        state.rlock.release()
+
+
+def temp_path(path: Path, suffix: str = "tmp") -> Path:
+    """
+    A temporary sibling of ``path`` that is unique to this process and thread,
+    and hidden from directory scans.
+    """
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.{suffix}")
+
+
+def write_atomic(path: Path, text: str) -> Path:
+    """
+    Write text to a temporary file and then move it into place
+    so that nothing ever reads a partially written file.
+    """
+    path = Path(path)
+    tmp_path = temp_path(path)
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+    return path
+
+
+def publish_directory(tmp_dir: Path, path: Path) -> Path:
+    """
+    Move a directory that was built somewhere temporary (eg. :func:`.temp_path` )
+    into place, replacing anything already there.
+
+    Any existing directory is renamed aside before the new one is moved into place
+    and only deleted afterwards, so readers see either the old or the new directory
+    rather than one that is being deleted.
+
+    Should be called while holding a :func:`.path_lock` on the directory's provider.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    old_path = None
+    if path.exists():
+        old_path = temp_path(path, "old")
+        os.replace(path, old_path)
+    os.replace(tmp_dir, path)
+    if old_path is not None:
+        shutil.rmtree(old_path)
+    return path
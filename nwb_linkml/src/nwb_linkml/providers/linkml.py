@@ -2,6 +2,7 @@
 Provider for LinkML schema built from NWB schema
 """
 
+import hashlib
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,6 +16,7 @@ from nwb_linkml import adapters, io
 from nwb_linkml.adapters import BuildResult
 from nwb_linkml.maps.naming import relative_path
 from nwb_linkml.providers import Provider
+from nwb_linkml.providers.cache import publish_directory, temp_path
 from nwb_linkml.providers.git import DEFAULT_REPOS
 from nwb_linkml.ui import AdapterProgress
 from nwb_schema_language import Namespaces
@@ -155,6 +157,9 @@ class LinkMLProvider(Provider):
             force (bool): If ``False`` (default), don't build schema that already exist.
                 If ``True`` , clear directory and rebuild
 
+        Builds hold the provider's :meth:`.lock` , so if several processes try to build
+        the same schema at once, one builds it and the others wait for it.
+
         Returns:
             Dict[str, LinkMLSchemaBuild]. For normal builds,
             :attr:`.LinkMLSchemaBuild.result` will be populated with results
@@ -162,22 +167,45 @@ class LinkMLProvider(Provider):
         """
 
         # Return cached result if available
-        if not force and all(
+        if not force and (cached := self._cached_build(ns_adapter)) is not None:
+            return cached
+
+        with self.lock():
+            # check again in case another process built it while we waited for the lock
+            if not force and (cached := self._cached_build(ns_adapter)) is not None:
+                return cached
+            return self._build(ns_adapter, force)
+
+    def _cached_build(
+        self, ns_adapter: adapters.NamespacesAdapter
+    ) -> Optional[Dict[str | SchemaDefinitionName, LinkMLSchemaBuild]]:
+        """Build results for the namespaces in an adapter, if they have all been built"""
+        if not all(
             [
                 (self.namespace_path(ns, version) / "namespace.yaml").exists()
                 for ns, version in ns_adapter.versions.items()
             ]
         ):
-            return {
-                k: LinkMLSchemaBuild(
-                    name=k,
-                    result=None,
-                    namespace=self.namespace_path(k, v) / "namespace.yaml",
-                    version=v,
-                )
-                for k, v in ns_adapter.versions.items()
-            }
+            return None
+        return {
+            k: LinkMLSchemaBuild(
+                name=k,
+                result=None,
+                namespace=self.namespace_path(k, v) / "namespace.yaml",
+                version=v,
+            )
+            for k, v in ns_adapter.versions.items()
+        }
+
+    def _build(
+        self, ns_adapter: adapters.NamespacesAdapter, force: bool = False
+    ) -> Dict[str | SchemaDefinitionName, LinkMLSchemaBuild]:
+        """
+        Build and write schema, see :meth:`.build` .
 
+        Each namespace is written to a temporary directory that is then moved into place,
+        so should be called while holding :meth:`.lock`
+        """
         if self.verbose:
             progress = AdapterProgress(ns_adapter)
             with progress:
@@ -199,9 +227,6 @@ class LinkMLProvider(Provider):
 
             # prepare the output directory
             version_path = self.namespace_path(ns_linkml.name, version, allow_repo=False)
-            if version_path.exists() and force:
-                shutil.rmtree(str(version_path))
-            version_path.mkdir(exist_ok=True, parents=True)
             ns_file = version_path / "namespace.yaml"
 
             # schema built as part of this namespace that aren't the namespace file
@@ -212,15 +237,24 @@ class LinkMLProvider(Provider):
             ]
 
             if force or not ns_file.exists():
+                # write to a temporary directory, fixing imports relative to the real one
+                tmp_path = temp_path(version_path)
+                if tmp_path.exists():
+                    shutil.rmtree(tmp_path)
+                tmp_path.mkdir(parents=True)
+
                 ns_linkml = self._fix_schema_imports(ns_linkml, ns_adapter, ns_file)
-                yaml_dumper.dump(ns_linkml, ns_file)
+                yaml_dumper.dump(ns_linkml, tmp_path / ns_file.name)
 
                 # write the schemas for this namespace
                 for sch in other_schema:
                     output_file = version_path / (sch.name + ".yaml")
                     # fix the paths for intra-schema imports
                     sch = self._fix_schema_imports(sch, ns_adapter, output_file)
-                    yaml_dumper.dump(sch, output_file)
+                    yaml_dumper.dump(sch, tmp_path / output_file.name)
+
+                publish_directory(tmp_path, version_path)
+                self.record_build(ns_linkml.name, version, self._spec_hash(ns_adapter))
 
             # make return result for just this namespace
             build_result[ns_linkml.name] = LinkMLSchemaBuild(
@@ -232,6 +266,16 @@ class LinkMLProvider(Provider):
 
         return build_result
 
+    @staticmethod
+    def _spec_hash(ns_adapter: adapters.NamespacesAdapter) -> str:
+        """Hash of the nwb schema language namespace and schemas that a build is made from"""
+        spec_hash = hashlib.sha256(ns_adapter.namespaces.model_dump_json().encode("utf-8"))
+        for sch in ns_adapter.schemas:
+            spec_hash.update(
+                sch.model_dump_json(include={"path", "groups", "datasets"}).encode("utf-8")
+            )
+        return spec_hash.hexdigest()
+
     def _fix_schema_imports(
         self, sch: SchemaDefinition, ns_adapter: adapters.NamespacesAdapter, output_file: Path
     ) -> SchemaDefinition:
@@ -4,15 +4,132 @@ Base provider class
 
 import importlib
 import os
+import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, ContextManager, Dict, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
 
 from nwb_linkml import Config
 from nwb_linkml.maps.naming import module_case, version_module_case
+from nwb_linkml.providers.cache import path_lock, write_atomic
 
 P = TypeVar("P")
 
+MANIFEST_FILE = "manifest.json"
+"""Name of the :class:`.Manifest` file at the root of each provider's :attr:`.Provider.path`"""
+
+
+class ManifestEntry(BaseModel):
+    """A single built version of a namespace in a :class:`.Manifest`"""
+
+    version: str
+    """
+    Version of the namespace, as written in its schema
+    (or the version directory name, if made by :meth:`.Manifest.from_directory` )
+    """
+    built: float = Field(default_factory=time.time)
+    """Timestamp of when the namespace was built"""
+    spec_hash: Optional[str] = None
+    """Hash of the source that the namespace was built from, if known"""
+
+
+class Manifest(BaseModel):
+    """
+    Index of the namespaces and versions that have been built into a provider's directory,
+    so we don't need to scan and stat the directory to find them.
+    """
+
+    namespaces: Dict[str, Dict[str, ManifestEntry]] = Field(default_factory=dict)
+    """
+    Mapping from namespace directory name (eg. ``hdmf_common`` ) to
+    version directory name (eg. ``v1_8_0`` ) to its entry
+    """
+
+    def versions(self, namespace: str) -> List[str]:
+        """
+        Version directory names for a namespace directory, in the order they were built
+        """
+        entries = self.namespaces.get(namespace, {})
+        return sorted(entries, key=lambda version: entries[version].built)
+
+    def add(self, namespace: str, version: str, spec_hash: Optional[str] = None) -> ManifestEntry:
+        """Add an entry for a namespace and version (as written in the schema)"""
+        entry = ManifestEntry(version=version, spec_hash=spec_hash)
+        self.namespaces.setdefault(module_case(namespace), {})[version_module_case(version)] = entry
+        return entry
+
+    @classmethod
+    def from_directory(cls, path: Path) -> "Manifest":
+        """
+        Make a manifest by scanning a provider directory,
+        using the modification times of the version directories as their build times.
+
+        Used for the builtin models and to migrate caches that were built
+        before manifests existed.
+        """
+        manifest = cls()
+        if not path.exists():
+            return manifest
+
+        for ns_dir in path.iterdir():
+            if not ns_dir.is_dir():
+                continue
+            for version_dir in ns_dir.iterdir():
+                if not version_dir.is_dir() or not version_dir.name.startswith("v"):
+                    continue
+                manifest.namespaces.setdefault(ns_dir.name, {})[version_dir.name] = ManifestEntry(
+                    version=version_dir.name, built=os.path.getmtime(version_dir)
+                )
+        return manifest
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["Manifest"]:
+        """Load the manifest in a provider directory, if there is one"""
+        manifest_path = path / MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+        return cls.model_validate_json(manifest_path.read_text())
+
+    def dump(self, path: Path) -> Path:
+        """
+        Write the manifest to a provider directory.
+
+        The manifest is written to a temporary file and then moved into place
+        so that concurrent readers never see a partially written manifest.
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        return write_atomic(path / MANIFEST_FILE, self.model_dump_json(indent=2))
+
+
+@lru_cache(maxsize=32)
+def _read_manifest(path: Path, inode: int, mtime_ns: int) -> Manifest:
+    """
+    Read a manifest file, cached by its inode and modification time,
+    which change whenever it is replaced by :meth:`.Manifest.dump`
+    """
+    return Manifest.model_validate_json(path.read_text())
+
+
+@lru_cache
+def builtin_manifest(provides: str) -> Manifest:
+    """
+    :class:`.Manifest` for the models provided by the ``nwb_models`` package,
+    which don't change while we're running, so are only scanned once.
+
+    Args:
+        provides (str): :attr:`.Provider.PROVIDES` - ``linkml`` or ``pydantic``
+    """
+    module_path = Path(importlib.util.find_spec("nwb_models").origin).parent
+    if provides == "linkml":
+        return Manifest.from_directory(module_path / "schema" / "linkml")
+    elif provides == "pydantic":
+        return Manifest.from_directory(module_path / "models" / "pydantic")
+    else:
+        return Manifest()
+
 
 class Provider(ABC):
     """
@@ -45,6 +162,7 @@ class Provider(ABC):
         self.cache_dir = config.cache_dir
         self.allow_repo = allow_repo
         self.verbose = verbose
+        self._migrate_manifest()
 
     @property
     @abstractmethod
@@ -67,6 +185,19 @@ class Provider(ABC):
         Optionally, try any build it if it's possible to do so
         """
 
+    def lock(self) -> ContextManager[Path]:
+        """
+        Lock :attr:`.path` while building into it, see :func:`.path_lock`
+
+        Examples:
+
+            .. code-block:: python
+
+                with provider.lock():
+                    # check if it's built, build it if not
+        """
+        return path_lock(self.path)
+
     def namespace_path(
         self, namespace: str, version: Optional[str] = None, allow_repo: Optional[bool] = None
     ) -> Path:
@@ -92,9 +223,11 @@ class Provider(ABC):
 
         namespace_module = module_case(namespace)
         namespace_path = self.path / namespace_module
+        manifest = None
         if not namespace_path.exists() and namespace in ("core", "hdmf-common") and allow_repo:
             # return builtins
             module_path = Path(importlib.util.find_spec("nwb_models").origin).parent
+            manifest = builtin_manifest(self.PROVIDES)
 
             if self.PROVIDES == "linkml":
                 namespace_path = module_path / "schema" / "linkml" / namespace_module
@@ -106,67 +239,83 @@ class Provider(ABC):
             # version_path.mkdir(exist_ok=True, parents=True)
         else:
             # or find the most recently built one
-            versions = sorted(namespace_path.iterdir(), key=os.path.getmtime)
-            versions = [v for v in versions if v.is_dir() and v.name not in ("__pycache__")]
+            if manifest is None:
+                manifest = self.manifest
+            versions = manifest.versions(namespace_module)
             if len(versions) == 0:
                 raise FileNotFoundError("No version provided, and no existing schema found")
-            version_path = versions[-1]
+            version_path = namespace_path / versions[-1]
 
         return version_path
 
     @property
-    def available_versions(self) -> Dict[str, List[str]]:
+    def manifest(self) -> Manifest:
         """
-        Dictionary mapping a namespace to a list of built versions
+        The :class:`.Manifest` of namespaces built into :attr:`.path` .
 
-        .. warning:: This is busted
-
-            at the moment this property is very broken and needs to be updated to actually read
-            module metadata rather than try and parse filenames which is extremely fragile!!!
+        The manifest file is only re-read when it has changed. Don't modify the
+        returned manifest, add entries to it with :meth:`.record_build` instead.
+        """
+        manifest_path = self.path / MANIFEST_FILE
+        try:
+            stat = manifest_path.stat()
+        except FileNotFoundError:
+            return Manifest()
+        return _read_manifest(manifest_path, stat.st_ino, stat.st_mtime_ns)
 
+    def _migrate_manifest(self) -> None:
         """
-        from nwb_linkml.providers import LinkMLProvider
+        Caches made before manifests existed are scanned once to make one.
+        """
+        if not self.path.exists() or (self.path / MANIFEST_FILE).exists():
+            return
+        with self.lock():
+            if not (self.path / MANIFEST_FILE).exists():
+                Manifest.from_directory(self.path).dump(self.path)
 
-        versions = {}  # type: Dict[str, List[Path]]
+    def record_build(
+        self, namespace: str, version: str, spec_hash: Optional[str] = None
+    ) -> ManifestEntry:
+        """
+        Add a built namespace to this provider's :attr:`.manifest`
 
-        # first get any builtins provided by the package itself
-        # these get overwritten by
-        module_path = Path(importlib.util.find_spec("nwb_models").origin).parent
-        builtin_namespaces = []
-        if self.PROVIDES == "linkml":
-            namespace_path = module_path / "schema" / "linkml"
-            builtin_namespaces = list(namespace_path.iterdir())
-        elif self.PROVIDES == "pydantic":
-            namespace_path = module_path / "models" / "pydantic"
-            builtin_namespaces = list(namespace_path.iterdir())
+        Args:
+            namespace (str): Name of the namespace
+            version (str): Version of the namespace, as written in its schema
+            spec_hash (str, optional): Hash of the source it was built from
+        """
+        with self.lock():
+            manifest = Manifest.load(self.path) or Manifest.from_directory(self.path)
+            entry = manifest.add(namespace, version, spec_hash)
+            manifest.dump(self.path)
+        return entry
 
-        tmp_paths = []
-        try:
-            tmp_paths.extend(list(self.path.iterdir()))
-            if self.PROVIDES == "pydantic":
-                # we also include versions that we just have the linkml version of
-                # because they are also available, we just have to build them.
-                # maybe the semantics of this property are getting overloaded tho
-                # and we need to separate the maintenance of the temporary directory
-                # from providing from it
-                tmp_paths.extend(list(LinkMLProvider(path=self.config.cache_dir).path.iterdir()))
-        except FileNotFoundError:
-            # fine, just return the builtins
-            pass
+    @property
+    def available_versions(self) -> Dict[str, List[str]]:
+        """
+        Dictionary mapping a namespace to a list of built versions,
+        in the order they were built.
 
-        for ns_dir in builtin_namespaces + tmp_paths:
-            if not ns_dir.is_dir():
-                continue
-            if ns_dir.name not in versions:
-                versions[ns_dir.name] = []
+        Read from the :attr:`.manifest` and the :func:`.builtin_manifest` ,
+        rather than scanning directories.
+        """
+        from nwb_linkml.providers import LinkMLProvider
 
-            versions[ns_dir.name].extend([v for v in ns_dir.iterdir() if v.is_dir()])
+        manifests = [builtin_manifest(self.PROVIDES), self.manifest]
+        if self.PROVIDES == "pydantic":
+            # we also include versions that we just have the linkml version of
+            # because they are also available, we just have to build them.
+            # maybe the semantics of this property are getting overloaded tho
+            # and we need to separate the maintenance of the temporary directory
+            # from providing from it
+            manifests.append(LinkMLProvider(path=self.config.cache_dir).manifest)
 
         # flatten out in case we got duplicates between the builtins and cache
-        res = {
-            k: [
-                v.name for v in sorted(set(v_paths), key=os.path.getmtime) if v.name.startswith("v")
-            ]
-            for k, v_paths in versions.items()
-        }
-        return res
+        built = {}  # type: Dict[str, Dict[str, float]]
+        for manifest in manifests:
+            for ns_name, versions in manifest.namespaces.items():
+                ns_built = built.setdefault(ns_name, {})
+                for version, entry in versions.items():
+                    ns_built[version] = max(entry.built, ns_built.get(version, entry.built))
+
+        return {k: sorted(versions, key=versions.get) for k, versions in built.items()}
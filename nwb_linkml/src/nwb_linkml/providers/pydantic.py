@@ -2,7 +2,9 @@
 Provider for pydantic models.
 """
 
+import hashlib
 import importlib
+import json
 import multiprocessing as mp
 import re
 import sys
@@ -10,7 +12,7 @@ from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec
 from pathlib import Path
 from types import ModuleType
-from typing import TYPE_CHECKING, List, Optional, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
 
 from linkml.generators.pydanticgen.pydanticgen import SplitMode, _ensure_inits, _import_to_path
 from pydantic import BaseModel
@@ -18,10 +20,19 @@ from pydantic import BaseModel
 from nwb_linkml.generators.pydantic import NWBPydanticGenerator
 from nwb_linkml.maps.naming import module_case, version_module_case
 from nwb_linkml.providers import LinkMLProvider, Provider
+from nwb_linkml.providers.cache import write_atomic
 
 if TYPE_CHECKING:
     from linkml_runtime.linkml_model.meta import SchemaDefinition
 
+CLASS_INDEX = "classes.json"
+"""
+Name of the index written next to each split ``namespace.py`` ,
+mapping each class to the module that defines it
+(see :attr:`.NWBPydanticModule.class_modules` ), so that
+:meth:`.PydanticProvider.get_class` can import just that module.
+"""
+
 
 class PydanticProvider(Provider):
     """
@@ -96,10 +107,27 @@ class PydanticProvider(Provider):
                 if ``False`` (default), don't.
             **kwargs: Passed to :class:`.NWBPydanticGenerator`
 
+        Builds hold the provider's :meth:`.lock` , so if several processes try to build
+        the same model at once, one builds it and the others wait for it.
+        Each module is written atomically, and the ``namespace.py`` module
+        that imports the others is written last.
+
         Returns:
             str: The built model file as returned from :meth:`.NWBPydanticGenerator.serialize`
         """
+        with self.lock():
+            return self._build(namespace, version, split, dump, force, parallel, **kwargs)
 
+    def _build(
+        self,
+        namespace: str | Path,
+        version: Optional[str] = None,
+        split: bool = True,
+        dump: bool = True,
+        force: bool = False,
+        parallel: bool = False,
+        **kwargs: dict,
+    ) -> str | List[str]:
         if isinstance(namespace, str) and not (
             namespace.endswith(".yaml") or namespace.endswith(".yml")
         ):
@@ -135,10 +163,9 @@ class PydanticProvider(Provider):
         serialized = generator.serialize()
         if dump:
             out_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(out_file, "w") as ofile:
-                ofile.write(serialized)
-
             self._make_inits(out_file)
+            write_atomic(out_file, serialized)
+            self._record_build(generator, path)
 
         return serialized
 
@@ -170,8 +197,7 @@ class PydanticProvider(Provider):
             ns_file.parent.mkdir(exist_ok=True, parents=True)
             serialized = gen.serialize(rendered_module=rendered)
             if dump:
-                with open(ns_file, "w") as ofile:
-                    ofile.write(serialized)
+                # written once everything it imports has been
                 module_paths.append(ns_file)
         else:
             with open(ns_file) as ofile:
@@ -182,7 +208,9 @@ class PydanticProvider(Provider):
         imported_schema: dict[str, SchemaDefinition] = {
             gen.generate_module_import(sch): sch for sch in gen.schemaview.schema_map.values()
         }
-        generated_imports = [i for i in rendered.python_imports if i.is_schema]
+        generated_imports = [
+            i for i in [*rendered.python_imports, *rendered.lazy_imports] if i.is_schema
+        ]
         # each task has an expected output file a corresponding SchemaDefinition
         import_paths = [
             (ns_file.parent / _import_to_path(an_import.module)).resolve()
@@ -218,9 +246,28 @@ class PydanticProvider(Provider):
             _ensure_inits(import_paths)
             # then extra_inits that usually aren't generated bc we're one layer deeper
             self._make_inits(ns_file)
+            write_atomic(ns_file.parent / CLASS_INDEX, json.dumps(rendered.class_modules, indent=2))
+            write_atomic(ns_file, serialized)
+            self._record_build(gen, path)
 
         return res
 
+    def _record_build(self, generator: NWBPydanticGenerator, path: Path) -> None:
+        """
+        Record a built namespace in the :attr:`.manifest` ,
+        hashing the linkml schema files it was built from
+        """
+        schema = generator.schemaview.schema
+        namespace = (
+            schema.annotations["namespace"].value
+            if "namespace" in schema.annotations
+            else schema.name
+        )
+        spec_hash = hashlib.sha256()
+        for schema_file in sorted(Path(path).parent.glob("*.yaml")):
+            spec_hash.update(schema_file.read_bytes())
+        self.record_build(namespace, schema.version, spec_hash.hexdigest())
+
     @staticmethod
     def _generate_single(
         import_file: Path,
@@ -249,8 +296,7 @@ class PydanticProvider(Provider):
             )
             serialized = import_gen.serialize()
             if dump:
-                with open(import_file, "w") as ofile:
-                    ofile.write(serialized)
+                write_atomic(import_file, serialized)
 
         else:
             with open(import_file) as ofile:
@@ -295,6 +341,32 @@ class PydanticProvider(Provider):
         made available in case you don't want to accidentally build something
         or invoke the rest of the provisioning system.
 
+        Args:
+            namespace (str): Name of namespace
+            version (Optional[str]): Version to import, if None,
+                try and get the most recently built version.
+
+        Returns:
+            :class:`types.ModuleType`
+        """
+        package = self.import_package(namespace, version)
+
+        # then the namespace package
+        module_name = package.__name__ + ".namespace"
+        spec = importlib.util.spec_from_file_location(
+            module_name, Path(package.__file__).parent / "namespace.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        return module
+
+    def import_package(self, namespace: str, version: Optional[str] = None) -> ModuleType:
+        """
+        Import the package that contains a namespace's modules, without the namespace module.
+
+        Like :meth:`.import_module` , this doesn't build anything.
+
         Args:
             namespace (str): Name of namespace
             version (Optional[str]): Version to import, if None,
@@ -311,24 +383,22 @@ class PydanticProvider(Provider):
         if not path.exists():
             raise ImportError(f"Module has not been built yet {path}")
         module_name = self.module_name(namespace, version)
+        init_path = path.parent / "__init__.py"
+
+        package = sys.modules.get(module_name)
+        if package is not None and Path(package.__file__) == init_path:
+            return package
 
         # import module level first - when python does relative imports,
         # it needs to have the parent modules imported separately
         # this breaks split model creation when they are outside of the
         # package repository (ie. loaded from an nwb file) because it tries
         # to look for the containing namespace folder within the nwb_linkml package and fails
-        init_spec = importlib.util.spec_from_file_location(module_name, path.parent / "__init__.py")
+        init_spec = importlib.util.spec_from_file_location(module_name, init_path)
         init_module = importlib.util.module_from_spec(init_spec)
         sys.modules[module_name] = init_module
         init_spec.loader.exec_module(init_module)
-
-        # then the namespace package
-        module_name = module_name + ".namespace"
-        spec = importlib.util.spec_from_file_location(module_name, path)
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        return module
+        return init_module
 
     def get(
         self, namespace: str, version: Optional[str] = None, allow_repo: Optional[bool] = None
@@ -387,17 +457,20 @@ class PydanticProvider(Provider):
         if namespace_name in sys.modules:
             return sys.modules[namespace_name]
 
+        self._ensure_built(namespace, version, allow_repo)
+        module = self.import_module(namespace, version)
+        return module
+
+    def _ensure_built(self, namespace: str, version: str, allow_repo: Optional[bool]) -> None:
+        """Build a namespace if we can't find its ``namespace.py``"""
         try:
             path = self.namespace_path(namespace, version, allow_repo)
         except FileNotFoundError:
             path = None
 
-        if path is None or not path.exists():
+        if path is None or not (path / "namespace.py").exists():
             _ = self.build(namespace, version=version)
 
-        module = self.import_module(namespace, version)
-        return module
-
     @staticmethod
     def _clear_package_imports() -> None:
         """
@@ -426,6 +499,12 @@ class PydanticProvider(Provider):
         """
         Get a class from a given namespace and version!
 
+        If the namespace module hasn't been imported yet, the class is imported
+        from the module that defines it using the :data:`.CLASS_INDEX`
+        written when the namespace was built, so only that module and the modules
+        it imports are imported. Otherwise (or if there is no index, eg. for unsplit builds),
+        get it from the namespace module returned by :meth:`.get` .
+
         Args:
             namespace (str): Name of a namespace that has been previously built and cached,
                 otherwise we will attempt to build it from the
@@ -436,9 +515,31 @@ class PydanticProvider(Provider):
         Returns:
             :class:`pydantic.BaseModel`
         """
+        if version is None:
+            version = self.available_versions[namespace][-1]
+
+        if not self.allow_repo:
+            self._clear_package_imports()
+
+        if self.module_name(namespace, version) + ".namespace" not in sys.modules:
+            self._ensure_built(namespace, version, self.allow_repo)
+            package = self.import_package(namespace, version)
+            class_modules = self._class_modules(package)
+            if class_ in class_modules:
+                module = importlib.import_module(class_modules[class_], package.__name__)
+                return getattr(module, class_)
+
         mod = self.get(namespace, version)
         return getattr(mod, class_)
 
+    @staticmethod
+    def _class_modules(package: ModuleType) -> Dict[str, str]:
+        """Read the :data:`.CLASS_INDEX` of a namespace package, if it has one"""
+        index = Path(package.__file__).parent / CLASS_INDEX
+        if not index.exists():
+            return {}
+        return json.loads(index.read_text())
+
     def install_pathfinder(self) -> None:
         """
         Add a :class:`.EctopicModelFinder` instance that allows us to import from
@@ -44,7 +44,7 @@ so eg. for the linkML and pydantic providers:
 
 from pathlib import Path
 from types import ModuleType
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
@@ -59,8 +59,8 @@ class SchemaProvider(Provider):
 
     Behaves like a singleton without needing to be one - since we're working off
     caches on disk that are indexed by hash in most "normal" conditions you should
-    be able to use this anywhere, though no file-level locks are present to ensure
-    consistency.
+    be able to use this anywhere. Builds are locked (see :mod:`.providers.cache` ),
+    so many processes can share the same cache.
 
     Store each generated schema in a directory structure indexed by
     schema namespace name and version
@@ -86,6 +86,8 @@ class SchemaProvider(Provider):
         """
         self.versions = versions
         super().__init__(**kwargs)
+        self._pydantic_provider = PydanticProvider(path=self.path, verbose=self.verbose)
+        self._classes: Dict[Tuple[str, str, Optional[str]], Type[BaseModel]] = {}
 
     @property
     def path(self) -> Path:
@@ -122,17 +124,21 @@ class SchemaProvider(Provider):
         linkml_kwargs.update(kwargs)
         pydantic_kwargs.update(kwargs)
 
+        # built models might replace the ones we have already resolved
+        self._classes.clear()
+
         linkml_provider = LinkMLProvider(path=self.path, verbose=verbose)
         pydantic_provider = PydanticProvider(path=self.path, verbose=verbose)
 
-        linkml_res = linkml_provider.build(
-            ns_adapter=ns_adapter, versions=self.versions, **linkml_kwargs
-        )
-        results = {}
-        for ns, ns_result in linkml_res.items():
-            results[ns] = pydantic_provider.build(
-                ns_result.namespace, versions=self.versions, **pydantic_kwargs
+        with self.lock():
+            linkml_res = linkml_provider.build(
+                ns_adapter=ns_adapter, versions=self.versions, **linkml_kwargs
             )
+            results = {}
+            for ns, ns_result in linkml_res.items():
+                results[ns] = pydantic_provider.build(
+                    ns_result.namespace, versions=self.versions, **pydantic_kwargs
+                )
         return results
 
     def get(self, namespace: str, version: Optional[str] = None) -> ModuleType:
@@ -144,7 +150,7 @@ class SchemaProvider(Provider):
         if version is None and self.versions is not None:
             version = self.versions.get(namespace, None)
 
-        return PydanticProvider(path=self.path).get(namespace, version)
+        return self._pydantic_provider.get(namespace, version)
 
     def get_class(
         self, namespace: str, class_: str, version: Optional[str] = None
@@ -152,9 +158,14 @@ class SchemaProvider(Provider):
         """
         Get a pydantic model class from a given namespace and version!
 
-        Wrapper around :meth:`.PydanticProvider.get_class`
+        Wrapper around :meth:`.PydanticProvider.get_class` .
+        Classes are memoized by namespace, class name, and version,
+        until the next time this provider builds anything.
         """
         if version is None and self.versions is not None:
             version = self.versions.get(namespace, None)
 
-        return PydanticProvider(path=self.path).get_class(namespace, class_, version)
+        key = (namespace, class_, version)
+        if key not in self._classes:
+            self._classes[key] = self._pydantic_provider.get_class(namespace, class_, version)
+        return self._classes[key]
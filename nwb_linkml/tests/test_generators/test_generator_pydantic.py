@@ -7,17 +7,17 @@ because it's tested in the base linkml package.
 
 # ruff: noqa: F821 - until the tests here settle down
 
+import importlib
 import sys
 import typing
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 from typing import Optional, TypedDict
 
 import numpy as np
 import pytest
-from linkml_runtime.utils.compile_python import compile_python
 from numpydantic.dtype import Float
 from numpydantic.ndarray import NDArrayMeta
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError, WrapValidator
 
 from nwb_linkml.generators.pydantic import NWBPydanticGenerator
 
@@ -67,9 +67,15 @@ def generate_and_import(
 
     sys.path.append(str(linkml_schema.core_path.parents[1]))
 
-    core = compile_python(str(linkml_schema.core_path.with_suffix(".py")))
-    imported = compile_python(str(linkml_schema.imported_path.with_suffix(".py")))
-    namespace = compile_python(str(linkml_schema.namespace_path.with_suffix(".py")))
+    # import as a package rather than with ``compile_python`` so that models, which are
+    # built on first use, can find the modules they were defined in.
+    # clear any modules from another parameterization first
+    package = linkml_schema.core_path.parent.name
+    for name in [name for name in sys.modules if name.split(".")[0] == package]:
+        del sys.modules[name]
+    core = importlib.import_module(f"{package}.{linkml_schema.core_path.stem}")
+    imported = importlib.import_module(f"{package}.{linkml_schema.imported_path.stem}")
+    namespace = importlib.import_module(f"{package}.{linkml_schema.namespace_path.stem}")
 
     return TestModules(core=core, imported=imported, namespace=namespace, split=split)
 
@@ -99,7 +105,8 @@ def test_array(imported_schema):
     """
     # check that we have gotten an NDArray annotation and its shape is correct
     array = imported_schema["core"].MainTopLevel.model_fields["value"].annotation
-    args = typing.get_args(array)
+    # unwrap Optional and CoerceValue (see test_coercion_plan)
+    args = typing.get_args(typing.get_args(array)[0].__origin__)
     for i, shape in enumerate(("* x, * y", "* x, * y, 3 z", "* x, * y, 3 z, 4 a")):
         assert isinstance(args[i], NDArrayMeta)
         assert args[i].__args__[0].__args__[0] == shape
@@ -125,6 +132,8 @@ def test_inline_with_identifier(imported_schema):
     as a string rather than its class. We overrode that to be able to make dictionaries of collections
     """
     main = imported_schema["core"].MainTopLevel
+    # models are built (resolving forward references) when they are first used
+    main.model_rebuild()
     inline = main.model_fields["inline_dict"].annotation
     assert typing.get_origin(typing.get_args(inline)[0]) is dict
     # god i hate pythons typing interface
@@ -166,6 +175,7 @@ def test_named_slot(imported_schema):
     """
     OtherClass = imported_schema["core"].OtherClass
     MainClass = imported_schema["core"].MainTopLevel
+    MainClass.model_rebuild()
 
     # We did in fact get the outer annotation
     # this is a wild ass way to get the function name but hey
@@ -181,3 +191,79 @@ def test_named_slot(imported_schema):
     instance = MainClass(named_slot={})
     assert isinstance(instance.named_slot, OtherClass)
     assert instance.named_slot.name == "named_slot"
+
+
+def _wrap_validators(model: type[BaseModel], field: str) -> set[str]:
+    """Names of the functions of the annotated wrap validators on a field"""
+    # models are built on first use
+    model.model_rebuild()
+    # top-level annotated metadata is moved to the field info by pydantic
+    field_info = model.model_fields[field]
+    annotation = field_info.annotation
+    names = {meta.func.__name__ for meta in field_info.metadata if isinstance(meta, WrapValidator)}
+    while hasattr(annotation, "__args__"):
+        names.update(
+            meta.func.__name__
+            for meta in getattr(annotation, "__metadata__", ())
+            if isinstance(meta, WrapValidator)
+        )
+        annotation = annotation.__args__[0]
+    return names
+
+
+def test_coercion_plan(imported_schema):
+    """
+    Only fields that could need to be wrapped or unwrapped from a ``value`` get
+    the rescue validators, rather than every field of every model
+    """
+    base = imported_schema["core"].ConfiguredBaseModel
+    main = imported_schema["core"].MainTopLevel
+    assert "coerce_value" not in base.__pydantic_decorators__.field_validators
+    assert "cast_with_value" not in base.__pydantic_decorators__.field_validators
+
+    # plain scalar, string, and class fields get nothing
+    for field in ("name", "meta_slot", "inline_dict", "named_slot"):
+        assert not _wrap_validators(main, field)
+
+    # arrays might be given a dataset with attributes that holds them
+    assert _wrap_validators(main, "value") == {"_coerce_value"}
+    array = np.array([[1, 2, 3], [4, 5, 6]], dtype=float)
+    instance = main(value={"value": array})
+    assert np.array_equal(instance.value, array)
+    instance = main(value=SimpleNamespace(value=array))
+    assert np.array_equal(instance.value, array)
+
+    # but a class field is not unwrapped
+    other = imported_schema["core"].OtherClass(name="named_slot")
+    with pytest.raises(ValidationError):
+        main(named_slot=SimpleNamespace(value=other))
+
+
+def test_coercion_plan_value_class():
+    """
+    Fields whose range is a class with a ``value`` slot can both be cast into
+    and unwrapped from the value
+    """
+    from nwb_models.models.pydantic.core.v2_7_0 import core_nwb_misc
+
+    series_cls = core_nwb_misc.IntervalSeries
+    assert _wrap_validators(series_cls, "data") == {"_coerce_value", "_cast_with_value"}
+    assert _wrap_validators(series_cls, "timestamps") == {"_coerce_value"}
+    assert not _wrap_validators(series_cls, "name")
+    assert not _wrap_validators(series_cls, "description")
+
+    data = np.array([1, -1, 1, -1], dtype=np.int8)
+    timestamps = np.arange(4, dtype=float)
+    series = series_cls(name="series", data=data, timestamps=timestamps)
+    assert isinstance(series.data, core_nwb_misc.IntervalSeriesData)
+    assert np.array_equal(series.data.value, data)
+
+    # datasets read from a file, with their attributes
+    series = series_cls(
+        name="series",
+        data=SimpleNamespace(value={"value": data, "unit": "n/a"}),
+        timestamps={"value": timestamps, "interval": 1, "unit": "seconds"},
+    )
+    assert isinstance(series.data, core_nwb_misc.IntervalSeriesData)
+    assert np.array_equal(series.data.value, data)
+    assert np.array_equal(series.timestamps, timestamps)
@@ -1,9 +1,11 @@
 from typing import Optional, Type
 
+import h5py
 import numpy as np
 import pandas as pd
 import pytest
 from numpydantic import NDArray, Shape
+from numpydantic.interface.hdf5 import H5ArrayPath
 from pydantic import ValidationError
 
 from nwb_linkml.includes import hdmf
@@ -124,6 +126,330 @@ def test_dynamictable_mixin_indexing(basic_table):
         _ = inst[5.5]
 
 
+def test_dynamictable_mixin_array_indexing(basic_table, tmp_output_dir_func):
+    """
+    Arrays of rows and boolean masks are gathered from each column at once,
+    in the order they are given, including from hdf5-backed columns that can only be
+    indexed with sorted, unique indices
+    """
+    MyData, cols = basic_table
+    h5f_path = tmp_output_dir_func / "array_indexing.h5"
+    with h5py.File(h5f_path, "w") as h5f:
+        h5f.create_dataset("col_5", data=np.arange(10) * 2)
+    cols["col_5"] = hdmf.VectorData(
+        name="col_5", description="", value=H5ArrayPath(file=h5f_path, path="col_5")
+    )
+    inst = MyData(**cols)
+
+    rows = np.array([5, 1, 1, 8])
+    df = inst[rows]
+    assert df.index.tolist() == rows.tolist()
+    assert df["col_1"].tolist() == rows.tolist()
+    assert df["col_5"].tolist() == (rows * 2).tolist()
+    assert inst[rows, "col_5"]["col_5"].tolist() == (rows * 2).tolist()
+    assert inst[[2, 0], ["col_1", "col_5"]].shape == (2, 2)
+
+    mask = np.arange(10) % 3 == 0
+    df = inst[mask]
+    assert df.index.tolist() == [0, 3, 6, 9]
+    assert df["col_5"].tolist() == [0, 6, 12, 18]
+
+    assert inst[np.array([], dtype=int)].shape == (0, 5)
+
+
+def test_dynamictable_mixin_where(tmp_output_dir_func):
+    """
+    Tables can be filtered by a predicate that is given chunks of only the columns it uses,
+    and then only the matching rows of the requested columns are read
+    """
+    n_rows = 25
+    spike_times, spike_idx = _ragged_array(n_rows)
+    quality = np.array(["good" if i % 3 == 0 else "noise" for i in range(n_rows)])
+
+    h5f_path = tmp_output_dir_func / "where.h5"
+    with h5py.File(h5f_path, "w") as h5f:
+        h5f.create_dataset("amplitude", data=np.arange(n_rows) * 2.0)
+
+    table = DynamicTableMixin(
+        name="units",
+        description="",
+        quality=quality,
+        amplitude=hdmf.VectorData(
+            name="amplitude",
+            description="",
+            value=H5ArrayPath(file=h5f_path, path="amplitude"),
+        ),
+        spike_times=np.concatenate(spike_times),
+        spike_times_index=spike_idx,
+    )
+
+    chunks = []
+
+    def _predicate(c):
+        chunks.append(len(c.quality))
+        assert "amplitude" not in c._cache
+        return c.quality == "good"
+
+    df = table.where(_predicate, columns=["amplitude", "spike_times"], chunk_size=10)
+    assert chunks == [10, 10, 5]
+    good = np.arange(0, n_rows, 3)
+    assert df.index.tolist() == good.tolist()
+    assert df.columns.tolist() == ["amplitude", "spike_times"]
+    assert df["amplitude"].tolist() == (good * 2.0).tolist()
+    for i, times in zip(good, df["spike_times"]):
+        assert np.array_equal(times, spike_times[i])
+
+    # ragged columns, ids, and item access in predicates
+    df = table.where(lambda c: np.array([len(s) > 20 for s in c["spike_times"]]) & (c.id > 5))
+    expected = [i for i in range(n_rows) if len(spike_times[i]) > 20 and i > 5]
+    assert df.index.tolist() == expected
+    assert df.shape[1] == 3
+
+    assert table.where(lambda c: c.amplitude > 1000).shape == (0, 3)
+
+    with pytest.raises(AttributeError):
+        table.where(lambda c: c.not_a_column == 1)
+    with pytest.raises(ValueError, match="one bool per row"):
+        table.where(lambda c: True)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_dynamictable_mixin_iter_batches(basic_table, tmp_output_dir_func, prefetch, monkeypatch):
+    """
+    Tables can be iterated over in batches aligned to the chunks of hdf5-backed columns,
+    including ragged and region columns
+    """
+    n_rows = 100
+    spike_times, spike_idx = _ragged_array(n_rows)
+    h5f_path = tmp_output_dir_func / "iter_batches.h5"
+    with h5py.File(h5f_path, "w") as h5f:
+        h5f.create_dataset("amplitude", data=np.arange(n_rows) * 2.0, chunks=(16,))
+
+    model, cols = basic_table
+    other = model(**cols)
+    table = DynamicTableMixin(
+        name="units",
+        description="",
+        amplitude=hdmf.VectorData(
+            name="amplitude",
+            description="",
+            value=H5ArrayPath(file=h5f_path, path="amplitude"),
+        ),
+        spike_times=np.concatenate(spike_times),
+        spike_times_index=spike_idx,
+        region=hdmf.DynamicTableRegion(
+            name="region", description="", table=other, value=np.arange(n_rows) % 10
+        ),
+    )
+
+    # region columns read their table once per batch, not once per row
+    reads = []
+    table_getitem = model.__getitem__
+
+    def _getitem(self, item):
+        reads.append(item)
+        return table_getitem(self, item)
+
+    monkeypatch.setattr(model, "__getitem__", _getitem)
+
+    batches = list(table.iter_batches(batch_size=30, prefetch=prefetch))
+    assert len(reads) == len(batches)
+    monkeypatch.undo()
+    # rounded to two chunks
+    assert [len(batch) for batch in batches] == [32, 32, 32, 4]
+    assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+    df = pd.concat(batches)
+    assert df.index.tolist() == list(range(n_rows))
+    assert df["amplitude"].tolist() == (np.arange(n_rows) * 2.0).tolist()
+    for i, times in enumerate(df["spike_times"]):
+        assert np.array_equal(times, spike_times[i])
+    for i, row in enumerate(df["region"]):
+        assert row.index.tolist() == [i % 10]
+        assert row.equals(table["region"][i])
+
+    # without chunked columns, batches are as big as we ask for
+    batches = list(
+        table.iter_batches(batch_size=30, columns="spike_times", as_frame=False, prefetch=prefetch)
+    )
+    assert [len(batch["id"]) for batch in batches] == [30, 30, 30, 10]
+    assert all(list(batch.keys()) == ["id", "spike_times"] for batch in batches)
+    assert np.array_equal(batches[1]["spike_times"][0], spike_times[30])
+
+    # stopping early is fine too
+    batches = table.iter_batches(batch_size=16, prefetch=prefetch)
+    assert len(next(batches)) == 16
+    batches.close()
+
+
+def test_dynamictable_mixin_to_arrow(basic_table, tmp_output_dir_func):
+    """
+    Tables convert to arrow with ragged columns as list arrays and
+    region columns as integer keys, and write to parquet with their region tables
+    """
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    n_rows = 20
+    spike_times, spike_idx = _ragged_array(n_rows)
+    model, cols = basic_table
+    electrodes = model(name="electrodes", **cols)
+    amplitude = np.arange(n_rows * 2, dtype=float).reshape(n_rows, 2)
+
+    table = DynamicTableMixin(
+        name="units",
+        description="",
+        amplitude=amplitude,
+        quality=["good"] * n_rows,
+        spike_times=np.concatenate(spike_times),
+        spike_times_index=spike_idx,
+        electrodes=hdmf.DynamicTableRegion(
+            name="electrodes", description="", table=electrodes, value=np.arange(n_rows) % 10
+        ),
+    )
+
+    arrow = table.to_arrow()
+    assert arrow.column_names == ["id", "amplitude", "quality", "spike_times", "electrodes"]
+    assert arrow.num_rows == n_rows
+    assert arrow.schema.field("spike_times").type == pa.list_(pa.float64())
+    assert arrow.schema.field("amplitude").type == pa.list_(pa.float64(), 2)
+    assert arrow.schema.field("electrodes").metadata == {b"table": b"electrodes"}
+
+    ragged = arrow.column("spike_times").chunk(0)
+    assert np.array_equal(ragged.offsets.to_numpy()[1:], spike_idx)
+    assert np.array_equal(ragged[3].values.to_numpy(), spike_times[3])
+    assert np.array_equal(arrow.column("amplitude").chunk(0)[5].values.to_numpy(), amplitude[5])
+    assert arrow.column("electrodes").to_pylist() == (np.arange(n_rows) % 10).tolist()
+
+    # fixed-width in-memory columns aren't copied
+    ids = np.arange(n_rows)
+    table.id = ids
+    assert np.shares_memory(table.to_arrow("quality").column("id").chunk(0).to_numpy(), ids)
+
+    written = table.to_parquet(tmp_output_dir_func / "units.parquet")
+    assert [p.name for p in written] == ["units.parquet", "units.electrodes.parquet"]
+    assert pq.read_table(written[0]).equals(table.to_arrow())
+    assert pq.read_table(written[1]).equals(electrodes.to_arrow())
+
+
+def test_dynamictable_mixin_loc_ids(basic_table):
+    """
+    Rows can be gotten by id with a hash index that is remade when the ids change
+    """
+    MyData, cols = basic_table
+    inst = MyData(id=np.arange(10) * 10 + 5, **cols)
+
+    df = inst.loc_ids([45, 5, 95, 45])
+    assert df.index.tolist() == [45, 5, 95, 45]
+    assert df["col_1"].tolist() == [4, 0, 9, 4]
+    assert inst.loc_ids(25, columns="col_2").shape == (1, 1)
+    index = inst._id_index
+    assert inst._id_index is index
+
+    with pytest.raises(KeyError, match=r"\[6, 7\]"):
+        inst.loc_ids([5, 6, 7])
+
+    inst.id = np.arange(10)[::-1]
+    assert inst._id_index_cache is None
+    assert inst.loc_ids([0, 9])["col_1"].tolist() == [9, 0]
+
+    # duplicate ids get all their rows
+    inst.id = np.arange(10) % 5
+    assert inst.loc_ids([1])["col_1"].tolist() == [1, 6]
+
+
+def test_dynamictable_mixin_columns_cached(basic_table):
+    """
+    The column mapping is only remade when the columns change
+    """
+    MyData, cols = basic_table
+    inst = MyData(**cols)
+    assert inst._columns is inst._columns
+
+    columns = inst._columns
+    inst.new_col = hdmf.VectorData(name="new_col", description="", value=np.arange(10))
+    assert inst._columns is not columns
+    assert "new_col" in inst._columns
+
+    columns = inst._columns
+    inst.col_1 = hdmf.VectorData(name="col_1", description="", value=np.arange(10) + 1)
+    assert inst._columns is not columns
+    assert inst._columns["col_1"][0] == 1
+    assert "_columns_cache" not in inst.colnames
+
+
+def test_dynamictable_mixin_getattr_frame(basic_table, monkeypatch):
+    """
+    Pandas attributes should be gotten from a dataframe of the table that is only made
+    once until the table changes, attributes that a dataframe doesn't have either shouldn't
+    make one at all, and the shape, columns, and dtypes shouldn't read any rows.
+    """
+    MyData, cols = basic_table
+    inst = MyData(**cols)
+
+    reads = []
+    _slice_range = MyData._slice_range
+
+    def _counting_slice_range(self, rows, *args, **kwargs):
+        reads.append(rows)
+        return _slice_range(self, rows, *args, **kwargs)
+
+    monkeypatch.setattr(MyData, "_slice_range", _counting_slice_range)
+
+    assert not hasattr(inst, "not_an_attribute")
+    with pytest.raises(AttributeError):
+        _ = inst.__array_not_an_interface__
+    assert len(reads) == 0
+
+    assert hasattr(inst, "shape")
+    assert inst.shape == (10, 5)
+    assert list(inst.columns) == ["col_1", "col_2", "col_3", "col_4", "col_5"]
+    dtypes = inst.dtypes
+    assert all(rows == slice(0, 0) for rows in reads)
+    assert dtypes.equals(inst[:, :].dtypes)
+    reads.clear()
+
+    assert inst.values[0].tolist() == [0] * 5
+    assert inst.values[1].tolist() == [1] * 5
+    assert len(reads) == 1
+
+    # writing to a column remakes it
+    inst.col_1[0] = 100
+    assert inst.values[0].tolist() == [100, 0, 0, 0, 0]
+    assert len(reads) == 2
+
+    # and so does assigning a column
+    inst.new_col = hdmf.VectorData(name="new_col", description="", value=np.arange(10))
+    assert inst.values.shape == (10, 6)
+    assert len(reads) == 3
+
+
+def test_aligned_dynamictable_getattr_frame(aligned_table):
+    """
+    Aligned tables should also keep the dataframe they use for pandas attributes
+    until they or any of their tables change
+    """
+    AlignedTable, tables = aligned_table
+    atable = AlignedTable(**tables)
+
+    assert not hasattr(atable, "not_an_attribute")
+    assert atable.shape == (10, 9)
+    assert atable.columns.equals(atable[:].columns)
+    assert atable._frame_cache is None
+
+    values = atable.values
+    frame = atable._frame_cache
+    assert frame is not None
+    assert np.array_equal(atable.values, values)
+    assert atable._frame_cache is frame
+
+    tables["table1"].col1[0] = 100
+    assert atable.values[0, 1] == 100
+    assert atable._frame_cache is not frame
+
+    atable.table3 = tables["table3"]
+    assert atable._frame_cache is None
+
+
 def test_dynamictable_mixin_colnames():
     """
     Should correctly infer colnames
@@ -400,6 +726,101 @@ def test_vectordata_indexing():
         data[0:3] = [5, 4]
 
 
+class _CountingArray(np.ndarray):
+    """Array that counts how many times it has been indexed"""
+
+    reads = 0
+
+    def __getitem__(self, item):
+        type(self).reads += 1
+        return np.asarray(self)[item]
+
+
+def test_vectorindex_batched_reads():
+    """
+    Indexing many rows of a ragged array should read the index and target in as
+    few reads as possible, and give the same results as indexing each row
+    """
+    n_rows = 50
+    value_array, index_array = _ragged_array(n_rows)
+    value_array = np.concatenate(value_array)
+
+    data = hdmf.VectorData(name="data", description="", value=value_array)
+    index = hdmf.VectorIndex(name="data_index", description="", value=index_array, target=data)
+    data._index = index
+    expected = [index[i] for i in range(n_rows)]
+
+    for item in (
+        slice(None),
+        slice(3, 20, 2),
+        [5, 2, 2, 40, 0],
+        np.array([-1, -2, 10]),
+        np.arange(n_rows) % 3 == 0,
+        [],
+    ):
+        rows = np.arange(n_rows)[item]
+        res = index[item]
+        assert len(res) == len(rows)
+        for row, subitem in zip(rows, res):
+            assert np.array_equal(subitem, expected[row])
+
+    # contiguous rows are read with one read of the index and one of the target
+    _CountingArray.reads = 0
+    index.value = index_array.view(_CountingArray)
+    data.value = value_array.view(_CountingArray)
+    _ = index[10:30]
+    assert _CountingArray.reads == 2
+
+    # discontiguous rows are read in runs
+    _CountingArray.reads = 0
+    _ = index[[10, 11, 12, 30, 31]]
+    assert _CountingArray.reads == 3
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1048576])
+def test_vectorindex_reduce(chunk_size):
+    """
+    Ragged rows can be reduced all at once, in chunks of the target,
+    giving the same results as reducing each row
+    """
+    generator = np.random.default_rng()
+    rows = [generator.random((generator.integers(0, 10), 3)) for _ in range(40)]
+    rows[0] = rows[0][0:0]
+    rows[-1] = rows[-1][0:0]
+    index_array = np.cumsum([len(row) for row in rows])
+
+    data = hdmf.VectorData(name="data", description="", value=np.concatenate(rows))
+    index = hdmf.VectorIndex(name="data_index", description="", value=index_array, target=data)
+    data._index = index
+
+    assert np.array_equal(data.lengths(), [len(row) for row in rows])
+    assert np.array_equal(index.lengths(), data.lengths())
+
+    empty = np.array([len(row) == 0 for row in rows])
+    full = [row for row in rows if len(row) > 0]
+    for how, expected in (
+        ("sum", [row.sum(axis=0) for row in rows]),
+        (np.multiply, [row.prod(axis=0) for row in rows]),
+        ("mean", [row.mean(axis=0) for row in full]),
+        ("min", [row.min(axis=0) for row in full]),
+        ("max", [row.max(axis=0) for row in full]),
+        ("first", [row[0] for row in full]),
+        ("last", [row[-1] for row in full]),
+    ):
+        reduced = data.reduce(how, chunk_size=chunk_size)
+        assert reduced.shape == (len(rows), 3)
+        if len(expected) == len(rows):
+            assert np.allclose(reduced, expected)
+        else:
+            assert np.isnan(reduced[empty]).all()
+            assert np.allclose(reduced[~empty], expected)
+
+    with pytest.raises(ValueError, match="how to reduce with median"):
+        data.reduce("median")
+    with pytest.raises(ValueError, match="Not a ragged column"):
+        hdmf.VectorData(name="flat", description="", value=np.arange(10)).reduce()
+
+
 def test_vectordata_getattr():
     """
     VectorData and VectorIndex both forward getattr to ``value``
@@ -555,6 +976,40 @@ def test_dynamictable_region_ragged():
         assert df.equals(region[i])
 
 
+def test_dynamictable_region_gather(basic_table):
+    """
+    DynamicTableRegions should be able to get all their referenced rows as one dataframe,
+    indexed by the region row that referenced them
+    """
+    model, cols = basic_table
+    inst = model(**cols)
+
+    index = np.array([9, 4, 8, 3, 7, 2, 6, 1, 5, 0])
+    region = hdmf.DynamicTableRegion(name="region", description="", value=index, table=inst)
+
+    frame = region.gather()
+    assert frame.index.names == ["region", "id"]
+    assert all(frame.index.get_level_values("region") == np.arange(10))
+    assert all(frame.index.get_level_values("id") == index)
+    for i in range(10):
+        assert frame.loc[i].equals(region[i])
+
+    assert all(region.gather([2, 5, 2]).index.get_level_values("id") == index[[2, 5, 2]])
+    assert all(region.gather(slice(3, 5)).index.get_level_values("region") == [3, 4])
+    assert region.gather([]).shape == (0, 5)
+
+    # ragged regions have many table rows per region row
+    value = np.array([0, 1, 2, 1, 2, 3, 2, 3, 4])
+    ragged = hdmf.DynamicTableRegion(name="ragged", description="", value=value, table=inst)
+    ragged._index = hdmf.VectorIndex(
+        name="ragged_index", description="", target=ragged, value=np.array([3, 6, 9])
+    )
+    frame = ragged.gather([2, 0])
+    assert all(frame.index.get_level_values("ragged") == [2, 2, 2, 0, 0, 0])
+    assert all(frame.index.get_level_values("id") == [2, 3, 4, 0, 1, 2])
+    assert frame.loc[2].equals(ragged[2])
+
+
 def test_aligned_dynamictable_indexing(aligned_table):
     """
     Should be able to index aligned dynamic tables to yield a multi-index df
@@ -655,6 +1110,40 @@ def test_timeseriesreferencevectordata_index():
     assert all(response[2] == 1)
 
 
+def test_timeseriesreferencevectordata_grouped_reads():
+    """
+    Rows that refer to the same timeseries should be read from it in coalesced runs,
+    and give the same results as reading each row
+    """
+    series_a = np.arange(1000).view(_CountingArray)
+    series_b = (np.arange(1000) * -1).view(_CountingArray)
+    timeseries = np.empty(8, dtype=object)
+    timeseries[:] = [series_a, series_b, series_a, series_a, series_b, series_a, series_a, series_b]
+    # overlapping, adjacent, and separate windows
+    idx_start = np.array([0, 100, 5, 20, 110, 500, 30, 900])
+    count = np.array([10, 10, 10, 10, 5, 10, 5, 50])
+
+    response = hdmf.TimeSeriesReferenceVectorData(
+        idx_start=idx_start, count=count, timeseries=timeseries
+    )
+
+    _CountingArray.reads = 0
+    res = response[:]
+    # series_a: [0, 15) + [20, 35) + [500, 510), series_b: [100, 115) + [900, 950)
+    assert _CountingArray.reads == 5
+    for i, item in enumerate(res):
+        assert np.array_equal(item, timeseries[i][idx_start[i] : idx_start[i] + count[i]])
+
+    rows = np.array([6, 0, -1])
+    res = response[rows]
+    assert np.array_equal(res[0], np.arange(30, 35))
+    assert np.array_equal(res[1], np.arange(0, 10))
+    assert np.array_equal(res[2], np.arange(900, 950) * -1)
+    # negative indices don't modify the index that was passed
+    assert rows.tolist() == [6, 0, -1]
+    assert response[[]] == []
+
+
 # --------------------------------------------------
 # Model-based tests
 # --------------------------------------------------
@@ -0,0 +1,75 @@
+"""
+Lazy namespace modules and deferred model building.
+
+These need a fresh interpreter without any models imported yet,
+so they're run in a spawned process.
+"""
+
+import multiprocessing as mp
+import sys
+from importlib import import_module
+
+NAMESPACE = "nwb_models.models.pydantic.core.v2_7_0.namespace"
+
+
+def _loaded() -> list[str]:
+    return [name for name in sys.modules if name.startswith("nwb_models.models.pydantic.")]
+
+
+def _lazy_import() -> dict:
+    namespace = import_module(NAMESPACE)
+    result = {"import": _loaded()}
+    device = namespace.Device
+    result["getattr"] = _loaded()
+    result["built"] = device.__pydantic_complete__
+    device(name="device")
+    result["used"] = device.__pydantic_complete__
+    return result
+
+
+def _import_split() -> dict:
+    module_name = f"{NAMESPACE.rsplit('.', 1)[0]}.core_nwb_file"
+    import_module(module_name)
+    models = [
+        obj
+        for name in _loaded()
+        for obj in vars(sys.modules[name]).values()
+        if isinstance(obj, type)
+        and obj.__module__ == name
+        and issubclass(obj, sys.modules[name].ConfiguredBaseModel)
+    ]
+    built = [
+        model.__name__
+        for model in models
+        if model.__pydantic_complete__ and not model.__pydantic_generic_metadata__["parameters"]
+    ]
+    return {"models": len(models), "built": built}
+
+
+def test_lazy_namespace():
+    """
+    Importing a namespace shouldn't import any of the modules in it,
+    and getting a class should only import the modules it needs, without building the model.
+    """
+    with mp.get_context("spawn").Pool(1) as pool:
+        result = pool.apply(_lazy_import)
+
+    assert [name for name in result["import"] if "_nwb_" in name or "hdmf" in name] == []
+    assert f"{NAMESPACE.rsplit('.', 1)[0]}.core_nwb_device" in result["getattr"]
+    assert f"{NAMESPACE.rsplit('.', 1)[0]}.core_nwb_file" not in result["getattr"]
+    assert not result["built"]
+    assert result["used"]
+
+
+def test_deferred_build():
+    """
+    Importing a module (and the modules it imports) shouldn't build any of the models in them.
+
+    Generic models are the exception - pydantic builds them when they are parametrized
+    in an annotation.
+    """
+    with mp.get_context("spawn").Pool(1) as pool:
+        result = pool.apply(_import_split)
+
+    assert result["models"] > 50
+    assert result["built"] == []
@@ -1,10 +1,21 @@
+import shutil
+
 import h5py
 import networkx as nx
 import numpy as np
 import pytest
 
-from nwb_linkml.io.hdf5 import HDF5IO, filter_dependency_graph, hdf_dependency_graph, truncate_file
-from nwb_linkml.maps.hdf5 import resolve_hardlink
+from nwb_linkml.io.hdf5 import (
+    HDF5IO,
+    ReadPlan,
+    file_identity,
+    filter_dependency_graph,
+    hdf_dependency_graph,
+    read_many,
+    spec_hash,
+    truncate_file,
+)
+from nwb_linkml.maps.hdf5 import get_dataset_references, resolve_hardlink
 
 
 @pytest.mark.skip()
@@ -112,6 +123,193 @@ def test_dependencies_hardlink(nwb_file):
     assert graph.edges[parent, target]["label"] == "child"
 
 
+def test_dataset_references_dtype(tmp_output_dir_func, monkeypatch):
+    """
+    References in datasets should be found from their dtype,
+    and datasets without references should never be read.
+    """
+    h5f = h5py.File(str(tmp_output_dir_func / "refs.hdf5"), "w")
+    data = h5f.create_dataset("data", data=np.zeros((1000, 10)))
+    scalar = h5f.create_dataset("scalar", data=data.ref, dtype=h5py.ref_dtype)
+    vector = h5f.create_dataset("vector", data=[data.ref, data.ref], dtype=h5py.ref_dtype)
+    compound_dtype = np.dtype([("idx", np.int32), ("ref", h5py.ref_dtype)])
+    compound = h5f.create_dataset(
+        "compound", data=np.array([(0, data.ref), (1, data.ref)], dtype=compound_dtype)
+    )
+    region = h5f.create_dataset(
+        "region", data=[data.regionref[0:10], data.regionref[5:20]], dtype=h5py.regionref_dtype
+    )
+    no_refs = h5f.create_dataset(
+        "no_refs", data=np.zeros((2,), dtype=[("a", np.int32), ("b", np.float64)])
+    )
+
+    assert get_dataset_references(scalar) == ["/data"]
+    assert get_dataset_references(vector) == ["/data", "/data"]
+    assert get_dataset_references(compound) == {"ref": ["/data", "/data"]}
+    assert get_dataset_references(region) == ["/data", "/data"]
+
+    def _no_read(*args, **kwargs):
+        raise AssertionError("dataset without references should not be read")
+
+    monkeypatch.setattr(h5py.Dataset, "__getitem__", _no_read)
+    assert get_dataset_references(data) == []
+    assert get_dataset_references(no_refs) == []
+    h5f.close()
+
+
+def test_read_plan_cache(nwb_file, monkeypatch):
+    """
+    Read plans should be cached and reused without walking the file again,
+    and reads should only cache them when asked to
+    """
+    graph = filter_dependency_graph(hdf_dependency_graph(nwb_file))
+    io = HDF5IO(nwb_file)
+    plan = io.plan(cache=False)
+    assert set(plan.nodes) == set(graph.nodes)
+    assert set(plan.to_graph().edges) == set(graph.edges)
+    assert plan.order[-1] == "/"
+
+    ReadPlan.cache_path(nwb_file).unlink(missing_ok=True)
+    assert io.plan() == plan
+    assert ReadPlan.cache_path(nwb_file).exists()
+
+    # reads only cache their plans when asked to
+    ReadPlan.cache_path(nwb_file).unlink()
+    io.read("/units")
+    assert not ReadPlan.cache_path(nwb_file).exists()
+    io.read("/units", cache=True)
+    assert ReadPlan.cache_path(nwb_file).exists()
+
+    def _no_walk(*args, **kwargs):
+        raise AssertionError("Should have used cached plan")
+
+    monkeypatch.setattr("nwb_linkml.io.hdf5.hdf_dependency_graph", _no_walk)
+    assert io.plan() == plan
+
+
+def test_read_plan_bytes_attrs(tmp_output_dir_func):
+    """
+    Read plans should hold bytes attributes as strings
+    """
+    with h5py.File(str(tmp_output_dir_func / "bytes_attrs.hdf5"), "w") as h5f:
+        group = h5f.create_group("series")
+        group.attrs["neurodata_type"] = np.bytes_("TimeSeries")
+        group.attrs["namespace"] = np.bytes_("core")
+        assert isinstance(group.attrs["neurodata_type"], bytes)
+
+        plan = ReadPlan.from_file(h5f)
+    assert plan.nodes["/series"] == {"neurodata_type": "TimeSeries", "namespace": "core"}
+
+
+def test_file_identity(nwb_file, tmp_output_dir_func):
+    """
+    File identity should change when the file is modified
+    """
+    copied = tmp_output_dir_func / "identity.nwb"
+    shutil.copy(nwb_file, copied)
+    identity = file_identity(copied)
+    assert identity == file_identity(copied)
+    assert identity != file_identity(nwb_file)
+
+    with h5py.File(copied, "r+") as h5f:
+        h5f.create_dataset("new_dataset", data=np.arange(100))
+    assert file_identity(copied) != identity
+
+
+def test_spec_cache(nwb_file, tmp_output_dir_func, monkeypatch):
+    """
+    Models for embedded specifications should be cached by the hash of the specifications
+    """
+    import nwb_linkml.io.hdf5
+    from nwb_linkml.providers.schema import SchemaProvider
+
+    provider = HDF5IO(nwb_file).make_provider()
+    with h5py.File(nwb_file, "r") as h5f:
+        key = spec_hash(h5f["specifications"])
+    assert provider.path.name == key
+    assert (provider.path / "versions.json").exists()
+
+    # files with the same specs get the same provider, even if their data differ
+    copied = tmp_output_dir_func / "spec_cache.nwb"
+    shutil.copy(nwb_file, copied)
+    with h5py.File(copied, "r+") as h5f:
+        h5f.create_dataset("new_dataset", data=np.arange(100))
+    assert HDF5IO(copied).make_provider() is provider
+
+    # from the disk cache without building anything
+    monkeypatch.setattr(nwb_linkml.io.hdf5, "_spec_providers", {})
+    monkeypatch.setattr(
+        SchemaProvider, "build_from_dicts", lambda *args, **kwargs: pytest.fail("rebuilt")
+    )
+    cached = HDF5IO(copied).make_provider()
+    assert cached is not provider
+    assert cached.path == provider.path
+    assert cached.versions == provider.versions
+    assert cached.get_class("core", "NWBFile").__name__ == "NWBFile"
+
+    # different specifications under the same version get a different hash
+    with h5py.File(copied, "r+") as h5f:
+        ns_path = next(
+            node.name
+            for node in h5f["specifications"]["core"].values()
+            if isinstance(node, h5py.Group)
+        )
+        spec = h5f[ns_path]["nwb.base"][()]
+        del h5f[ns_path]["nwb.base"]
+        h5f[ns_path].create_dataset("nwb.base", data=spec + b" ")
+        assert spec_hash(h5f["specifications"]) != key
+
+
+def _summarize(nwbfile) -> dict:
+    return {
+        "identifier": nwbfile.identifier,
+        "acquisition": sorted(nwbfile.acquisition.keys()),
+    }
+
+
+def test_read_many(nwb_file, tmp_output_dir_func, monkeypatch):
+    """
+    Read many files in a process pool, building their models once
+    """
+    copies = []
+    for i in range(3):
+        copied = tmp_output_dir_func / f"read_many_{i}.nwb"
+        shutil.copy(nwb_file, copied)
+        copies.append(copied)
+    broken = tmp_output_dir_func / "broken.nwb"
+    broken.write_text("not an hdf5 file")
+
+    make_provider = HDF5IO.make_provider
+    made = []
+
+    def _make_provider(self, *args, **kwargs):
+        made.append(self.path)
+        return make_provider(self, *args, **kwargs)
+
+    monkeypatch.setattr(HDF5IO, "make_provider", _make_provider)
+
+    results = list(read_many([*copies, broken], fn=_summarize, max_workers=2, max_in_flight=2))
+    assert len(made) == 1
+    assert {res.path for res in results} == {*copies, broken}
+
+    failed = [res for res in results if not res.ok]
+    assert len(failed) == 1
+    assert failed[0].path == broken
+    assert failed[0].traceback
+
+    expected = _summarize(HDF5IO(nwb_file).read())
+    for res in results:
+        if res.ok:
+            assert res.result == expected
+
+    # reading paths within files, without fn
+    with h5py.File(nwb_file, "r") as h5f:
+        description = h5f["session_description"][()]
+    results = list(read_many(copies, path="/session_description", max_workers=2))
+    assert all(res.ok for res in results)
+    assert {res.result for res in results} == {description}
+
+
 @pytest.mark.dev
 def test_dependency_graph_images(nwb_file, tmp_output_dir):
     """
@@ -108,3 +108,147 @@ def test_read_from_yaml(nwb_file):
     Read data from a yaml-fied NWB file
     """
     pass
+
+
+def test_read_parallel(nwb_file, read_nwbfile):
+    """
+    Reading each generation of the dependency graph in parallel should give the same result
+    """
+    res = HDF5IO(nwb_file).read(parallel=True, max_workers=4)
+    assert res.model_fields_set == read_nwbfile.model_fields_set
+    assert res.acquisition.keys() == read_nwbfile.acquisition.keys()
+    assert np.array_equal(
+        res.acquisition["test_timeseries"].data[:],
+        read_nwbfile.acquisition["test_timeseries"].data[:],
+    )
+    pd.testing.assert_frame_equal(res.intervals.trials[:], read_nwbfile.intervals.trials[:])
+
+
+def test_read_validate(nwb_file, read_nwbfile, monkeypatch):
+    """
+    Trusting values read from the file should give the same models as validating them,
+    and still validate the values that need it
+    """
+    import nwb_linkml.io.hdf5
+
+    validated = []
+    _construct = nwb_linkml.io.hdf5._construct
+
+    def _logged_construct(model, args, validate=False):
+        instance = _construct(model, args, validate)
+        if validate:
+            validated.append(model.__name__)
+        return instance
+
+    monkeypatch.setattr(nwb_linkml.io.hdf5, "_construct", _logged_construct)
+
+    res = HDF5IO(nwb_file).read(validate=True)
+    assert "NWBFile" in validated
+    assert res.model_fields_set == read_nwbfile.model_fields_set
+    assert res.acquisition.keys() == read_nwbfile.acquisition.keys()
+
+    for name, series in res.acquisition.items():
+        trusted = read_nwbfile.acquisition[name]
+        assert type(series) is type(trusted)
+        assert series.model_fields_set == trusted.model_fields_set
+    for name, device in res.general.devices.value.items():
+        assert device.model_dump() == read_nwbfile.general.devices.value[name].model_dump()
+    assert res.general.subject.model_dump() == read_nwbfile.general.subject.model_dump()
+
+    # arrays and numpy scalars are still validated
+    data = read_nwbfile.acquisition["test_timeseries"].data
+    assert isinstance(data.value, H5Proxy)
+    assert np.array_equal(data.value[:], res.acquisition["test_timeseries"].data.value[:])
+    assert isinstance(read_nwbfile.session_start_time, np.datetime64) == isinstance(
+        res.session_start_time, np.datetime64
+    )
+    pd.testing.assert_frame_equal(res.intervals.trials[:], read_nwbfile.intervals.trials[:])
+
+
+def test_read_subtree(nwb_file, read_nwbfile, monkeypatch):
+    """
+    Reading a path should only load the path and the nodes it depends on,
+    including references to nodes outside of its subtree
+    """
+    import nwb_linkml.io.hdf5
+
+    loaded = []
+    _load_node = nwb_linkml.io.hdf5._load_node
+
+    def _logged_load_node(path, *args, **kwargs):
+        loaded.append(path)
+        return _load_node(path, *args, **kwargs)
+
+    monkeypatch.setattr(nwb_linkml.io.hdf5, "_load_node", _logged_load_node)
+
+    series = HDF5IO(nwb_file).read("/acquisition/ElectricalSeries")
+    assert series.name == "ElectricalSeries"
+    assert "/general/extracellular_ephys/electrodes" in loaded
+    assert not any(node.startswith("/units") for node in loaded)
+    assert "/" not in loaded
+    pd.testing.assert_frame_equal(
+        series.electrodes.table[:],
+        read_nwbfile.acquisition["ElectricalSeries"].electrodes.table[:],
+    )
+
+
+def test_read_subtree_glob(nwb_file, read_nwbfile):
+    """
+    Lists of paths and glob patterns should return a dict of matched paths
+    """
+    io = HDF5IO(nwb_file)
+    res = io.read(["/acquisition/*", "/units"])
+    assert res.keys() == {*(f"/acquisition/{k}" for k in read_nwbfile.acquisition), "/units"}
+    assert np.array_equal(
+        res["/acquisition/test_timeseries"].data[:],
+        read_nwbfile.acquisition["test_timeseries"].data[:],
+    )
+    pd.testing.assert_frame_equal(res["/units"][:], read_nwbfile.units[:])
+
+    parallel = io.read("/acquisition/*", parallel=True)
+    assert parallel.keys() == {f"/acquisition/{k}" for k in read_nwbfile.acquisition}
+
+    with pytest.raises(KeyError):
+        io.read("/not/a/path")
+
+
+def test_read_lazy(nwb_file, read_nwbfile, monkeypatch):
+    """
+    Lazy reads should only read what is accessed, and memoize what they load
+    """
+    io = HDF5IO(nwb_file)
+
+    # reading untyped scalar datasets shouldn't need the schema or the read plan
+    with monkeypatch.context() as m:
+        m.setattr(HDF5IO, "make_provider", lambda self: pytest.fail("made provider"))
+        m.setattr(HDF5IO, "plan", lambda self, cache=True: pytest.fail("made read plan"))
+        lazy = io.read(lazy=True)
+        assert lazy.session_description == read_nwbfile.session_description
+        assert lazy.identifier == read_nwbfile.identifier
+        assert "acquisition" in lazy
+        assert set(lazy.acquisition.keys()) == set(read_nwbfile.acquisition.keys())
+
+    series = lazy.acquisition["test_timeseries"]
+    assert np.array_equal(series.data[:], read_nwbfile.acquisition["test_timeseries"].data[:])
+    assert lazy.acquisition.test_timeseries is series
+    pd.testing.assert_frame_equal(lazy.intervals.trials[:], read_nwbfile.intervals.trials[:])
+
+    # references are shared with the other lazily loaded nodes
+    electrodes = lazy.acquisition.ElectricalSeries.electrodes.table
+    assert electrodes is lazy.general.extracellular_ephys.electrodes
+
+    nwbfile = lazy.materialize()
+    assert type(nwbfile).__name__ == "NWBFile"
+    assert nwbfile.acquisition["test_timeseries"] is series
+
+    # closing closes the shared file, and accessing more children reopens it
+    h5f = lazy._reader.h5f
+    lazy.close()
+    assert not h5f
+    assert lazy.acquisition.test_timeseries is series
+    assert lazy._reader.h5f
+
+    with io.read(lazy=True) as lazy:
+        assert lazy.identifier == read_nwbfile.identifier
+        h5f = lazy._reader.h5f
+    assert not h5f
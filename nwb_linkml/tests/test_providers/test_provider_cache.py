@@ -0,0 +1,73 @@
+import multiprocessing as mp
+from shutil import rmtree
+
+import pytest
+
+from nwb_linkml.providers import cache
+from nwb_linkml.providers.cache import path_lock, publish_directory, temp_path, write_atomic
+
+
+def _try_lock(path) -> bool:
+    try:
+        with path_lock(path, blocking=False):
+            return True
+    except BlockingIOError:
+        return False
+
+
+def test_path_lock(tmp_output_dir_func):
+    """
+    Path locks should be reentrant within a process, and exclusive between processes
+    """
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        with path_lock(tmp_output_dir_func) as lock_file:
+            assert lock_file.exists()
+            # reentrant
+            with path_lock(tmp_output_dir_func, blocking=False):
+                pass
+            assert not pool.apply(_try_lock, (tmp_output_dir_func,))
+
+        assert pool.apply(_try_lock, (tmp_output_dir_func,))
+
+
+def test_publish(tmp_output_dir_func, monkeypatch):
+    """
+    Files and directories should be written somewhere temporary and moved into place,
+    and the directory they replace should only be deleted once it's out of the way
+    """
+    target = tmp_output_dir_func / "v1_0_0"
+    target.mkdir()
+    (target / "stale.yaml").write_text("stale")
+
+    tmp_dir = temp_path(target)
+    tmp_dir.mkdir()
+    write_atomic(tmp_dir / "namespace.yaml", "fresh")
+    assert not (target / "namespace.yaml").exists()
+
+    deleted = []
+
+    def _rmtree(path):
+        deleted.append((path.name, (target / "namespace.yaml").exists()))
+        rmtree(path)
+
+    monkeypatch.setattr(cache.shutil, "rmtree", _rmtree)
+
+    publish_directory(tmp_dir, target)
+    assert deleted == [(temp_path(target, "old").name, True)]
+    assert not tmp_dir.exists()
+    assert (target / "namespace.yaml").read_text() == "fresh"
+    assert not (target / "stale.yaml").exists()
+    assert [p.name for p in tmp_output_dir_func.iterdir()] == ["v1_0_0"]
+
+
+@pytest.mark.parametrize("blocking", [True, False])
+def test_path_lock_released_on_error(tmp_output_dir_func, blocking):
+    """
+    Locks should be released if the locked block raises
+    """
+    with pytest.raises(ValueError), path_lock(tmp_output_dir_func, blocking=blocking):
+        raise ValueError()
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        assert pool.apply(_try_lock, (tmp_output_dir_func,))
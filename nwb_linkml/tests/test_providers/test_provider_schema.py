@@ -1,4 +1,6 @@
+import json
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
@@ -8,9 +10,12 @@ import pytest
 from numpydantic import NDArray, Shape
 
 import nwb_linkml
+from nwb_linkml import Config
 from nwb_linkml.maps.naming import version_module_case
 from nwb_linkml.providers import LinkMLProvider, PydanticProvider
 from nwb_linkml.providers.git import DEFAULT_REPOS
+from nwb_linkml.providers.provider import MANIFEST_FILE, Manifest, _read_manifest
+from nwb_linkml.providers.schema import SchemaProvider
 
 CORE_MODULES = (
     "core.nwb.base",
@@ -113,3 +118,80 @@ def test_pydantic_provider_core(tmp_output_dir, class_name, test_fields):
             assert test_class.model_fields[k].annotation.__name__ == v
         else:
             assert test_class.model_fields[k].annotation == v
+
+
+def test_schema_provider_get_class_memoized(tmp_output_dir_func, monkeypatch):
+    """
+    Classes should only be resolved once per provider, until it builds something
+    """
+    provider = SchemaProvider(path=tmp_output_dir_func, versions={"core": "2.7.0"})
+    timeseries = provider.get_class("core", "TimeSeries")
+    assert timeseries.__name__ == "TimeSeries"
+
+    monkeypatch.setattr(
+        PydanticProvider, "get_class", lambda *args, **kwargs: pytest.fail("not memoized")
+    )
+    assert provider.get_class("core", "TimeSeries") is timeseries
+    assert provider.get_class("core", "TimeSeries", "2.7.0") is timeseries
+
+
+def test_pydantic_provider_get_class_index(tmp_output_dir_func):
+    """
+    Getting a class should only import the module that defines it (and what that imports),
+    not the namespace module
+    """
+    # in a fresh interpreter, without pytest (which makes includes import the namespace)
+    script = (
+        "import json, sys\n"
+        "from nwb_linkml.providers import PydanticProvider\n"
+        f"device = PydanticProvider(path={str(tmp_output_dir_func)!r})"
+        ".get_class('core', 'Device', '2.7.0')\n"
+        "print(json.dumps([device.__module__, list(sys.modules)]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    module, imported = json.loads(result.stdout.strip().splitlines()[-1])
+
+    package = PydanticProvider.module_name("core", "2.7.0")
+    assert module == f"{package}.core_nwb_device"
+    assert module in imported
+    assert f"{package}.namespace" not in imported
+    assert f"{package}.core_nwb_file" not in imported
+
+
+def test_provider_manifest(tmp_output_dir_func, monkeypatch):
+    """
+    Available versions should come from the manifest,
+    which is made from the directory for caches that don't have one yet
+    """
+    linkml_dir = Config(cache_dir=tmp_output_dir_func).linkml_dir
+    legacy = linkml_dir / "my_namespace" / "v0_1_0"
+    legacy.mkdir(parents=True)
+    assert not (linkml_dir / MANIFEST_FILE).exists()
+
+    # opening a cache without a manifest makes one
+    provider = LinkMLProvider(path=tmp_output_dir_func)
+    assert (provider.path / MANIFEST_FILE).exists()
+    assert provider.available_versions["my_namespace"] == ["v0_1_0"]
+
+    # and it's only read again when it changes
+    reads = _read_manifest.cache_info().misses
+    assert provider.manifest is provider.manifest
+    assert provider.available_versions["my_namespace"] == ["v0_1_0"]
+    assert _read_manifest.cache_info().misses == reads
+
+    # once we have a manifest, we shouldn't scan the directory
+    monkeypatch.setattr(
+        Manifest, "from_directory", classmethod(lambda cls, path: pytest.fail("scanned"))
+    )
+    entry = provider.record_build("my-namespace", "0.2.0", spec_hash="abc")
+    assert entry.version == "0.2.0"
+    assert provider.available_versions["my_namespace"] == ["v0_1_0", "v0_2_0"]
+    assert provider.namespace_path("my-namespace") == provider.path / "my_namespace" / "v0_2_0"
+
+    manifest = Manifest.load(provider.path)
+    assert manifest.namespaces["my_namespace"]["v0_2_0"].spec_hash == "abc"
+
+    # builtins are still available
+    assert "core" in provider.available_versions
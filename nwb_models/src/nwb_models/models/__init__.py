@@ -1 +1,17 @@
-from .pydantic.core.v2_7_0.namespace import *
+"""
+The latest version of the NWB core models,
+imported from their namespace module when they are first used.
+"""
+
+from importlib import import_module
+from typing import Any, List
+
+LATEST = ".pydantic.core.v2_7_0.namespace"
+
+
+def __getattr__(name: str) -> Any:
+    return getattr(import_module(LATEST, __name__), name)
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *dir(import_module(LATEST, __name__))})
@@ -5,11 +5,21 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Optional, Type, TypeVar, Union
 
 import numpy as np
 from numpydantic import NDArray, Shape
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 from ...hdmf_common.v1_1_0.hdmf_common_table import Container, Data, DynamicTable
 
@@ -27,6 +37,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -41,33 +52,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -78,10 +62,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -127,7 +108,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -169,10 +261,12 @@ class Image(NWBData):
     )
     description: Optional[str] = Field(None, description="""Description of the image.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* x, * y"], float | int],
-            NDArray[Shape["* x, * y, 3 r_g_b"], float | int],
-            NDArray[Shape["* x, * y, 4 r_g_b_a"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* x, * y"], float | int],
+                NDArray[Shape["* x, * y, 3 r_g_b"], float | int],
+                NDArray[Shape["* x, * y, 4 r_g_b_a"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -221,25 +315,25 @@ class TimeSeries(NWBDataInterface):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    data: TimeSeriesData = Field(
+    data: CastWithValue[CoerceValue[TimeSeriesData]] = Field(
         ...,
         description="""Data values. Data can be in 1-D, 2-D, 3-D, or 4-D. The first dimension should always represent time. This can also be used to store binary data (e.g., image frames). This can also be a link to data stored in an external file.""",
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -278,11 +372,13 @@ class TimeSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* num_times"], Any],
-            NDArray[Shape["* num_times, * num_dim2"], Any],
-            NDArray[Shape["* num_times, * num_dim2, * num_dim3"], Any],
-            NDArray[Shape["* num_times, * num_dim2, * num_dim3, * num_dim4"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* num_times"], Any],
+                NDArray[Shape["* num_times, * num_dim2"], Any],
+                NDArray[Shape["* num_times, * num_dim2, * num_dim3"], Any],
+                NDArray[Shape["* num_times, * num_dim2, * num_dim3, * num_dim4"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -356,18 +452,6 @@ class Images(NWBDataInterface):
 
     name: str = Field("Images", json_schema_extra={"linkml_meta": {"ifabsent": "string(Images)"}})
     description: str = Field(..., description="""Description of this collection of images.""")
-    image: List[str] = Field(..., description="""Images stored in this collection.""")
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-NWBData.model_rebuild()
-Image.model_rebuild()
-NWBContainer.model_rebuild()
-NWBDataInterface.model_rebuild()
-TimeSeries.model_rebuild()
-TimeSeriesData.model_rebuild()
-TimeSeriesStartingTime.model_rebuild()
-TimeSeriesSync.model_rebuild()
-ProcessingModule.model_rebuild()
-Images.model_rebuild()
+    image: CastWithValue[CoerceValue[List[str]]] = Field(
+        ..., description="""Images stored in this collection."""
+    )
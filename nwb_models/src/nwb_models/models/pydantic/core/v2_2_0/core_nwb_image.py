@@ -5,11 +5,21 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Optional, Type, TypeVar, Union
 
 import numpy as np
 from numpydantic import NDArray, Shape
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 from ...core.v2_2_0.core_nwb_base import Image, TimeSeries, TimeSeriesStartingTime, TimeSeriesSync
 
@@ -27,6 +37,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -41,33 +52,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -78,10 +62,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -127,7 +108,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -152,7 +244,7 @@ class GrayscaleImage(Image):
     )
 
     name: str = Field(...)
-    value: Optional[NDArray[Shape["* x, * y"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* x, * y"], float | int]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "x"}, {"alias": "y"}]}}
@@ -174,7 +266,7 @@ class RGBImage(Image):
     )
 
     name: str = Field(...)
-    value: Optional[NDArray[Shape["* x, * y, 3 r_g_b"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* x, * y, 3 r_g_b"], float | int]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {
@@ -204,7 +296,7 @@ class RGBAImage(Image):
     )
 
     name: str = Field(...)
-    value: Optional[NDArray[Shape["* x, * y, 4 r_g_b_a"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* x, * y, 4 r_g_b_a"], float | int]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {
@@ -234,15 +326,15 @@ class ImageSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: Optional[ImageSeriesData] = Field(
+    data: Optional[CastWithValue[CoerceValue[ImageSeriesData]]] = Field(
         None, description="""Binary data representing images across frames."""
     )
-    dimension: Optional[NDArray[Shape["* rank"], int]] = Field(
+    dimension: Optional[CoerceValue[NDArray[Shape["* rank"], int]]] = Field(
         None,
         description="""Number of pixels on x, y, (and z) axes.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "rank"}]}}},
     )
-    external_file: Optional[ImageSeriesExternalFile] = Field(
+    external_file: Optional[CastWithValue[CoerceValue[ImageSeriesExternalFile]]] = Field(
         None,
         description="""Paths to one or more external file(s). The field is only present if format='external'. This is only relevant if the image series is stored in the file system as one or more image file(s). This field should NOT be used if the image is stored in another NWB file and that file is linked to this file.""",
     )
@@ -261,21 +353,21 @@ class ImageSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -314,9 +406,11 @@ class ImageSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* frame, * x, * y"], float | int],
-            NDArray[Shape["* frame, * x, * y, * z"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* frame, * x, * y"], float | int],
+                NDArray[Shape["* frame, * x, * y, * z"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -338,7 +432,7 @@ class ImageSeriesExternalFile(ConfiguredBaseModel):
         ...,
         description="""Each external image may contain one or more consecutive frames of the full ImageSeries. This attribute serves as an index to indicate which frames each file contains, to faciliate random access. The 'starting_frame' attribute, hence, contains a list of frame numbers within the full ImageSeries of the first frame of each file listed in the parent 'external_file' dataset. Zero-based indexing is used (hence, the first element will always be zero). For example, if the 'external_file' dataset has three paths to files and the first file has 5 frames, the second file has 10 frames, and the third file has 20 frames, then this attribute will have values [0, 5, 15]. If there is a single external file that holds all of the frames of the ImageSeries (and so there is a single element in the 'external_file' dataset), then this attribute should have value [0].""",
     )
-    value: Optional[NDArray[Shape["* num_files"], str]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_files"], str]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_files"}]}}}
     )
 
@@ -362,15 +456,15 @@ class ImageMaskSeries(ImageSeries):
             }
         },
     )
-    data: Optional[ImageSeriesData] = Field(
+    data: Optional[CastWithValue[CoerceValue[ImageSeriesData]]] = Field(
         None, description="""Binary data representing images across frames."""
     )
-    dimension: Optional[NDArray[Shape["* rank"], int]] = Field(
+    dimension: Optional[CoerceValue[NDArray[Shape["* rank"], int]]] = Field(
         None,
         description="""Number of pixels on x, y, (and z) axes.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "rank"}]}}},
     )
-    external_file: Optional[ImageSeriesExternalFile] = Field(
+    external_file: Optional[CastWithValue[CoerceValue[ImageSeriesExternalFile]]] = Field(
         None,
         description="""Paths to one or more external file(s). The field is only present if format='external'. This is only relevant if the image series is stored in the file system as one or more image file(s). This field should NOT be used if the image is stored in another NWB file and that file is linked to this file.""",
     )
@@ -389,21 +483,21 @@ class ImageMaskSeries(ImageSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -430,23 +524,26 @@ class OpticalSeries(ImageSeries):
         None, description="""Distance from camera/monitor to target/eye."""
     )
     field_of_view: Optional[
-        Union[
-            NDArray[Shape["2 width_height"], float], NDArray[Shape["3 width_height_depth"], float]
+        CoerceValue[
+            Union[
+                NDArray[Shape["2 width_height"], float],
+                NDArray[Shape["3 width_height_depth"], float],
+            ]
         ]
     ] = Field(None, description="""Width, height and depth of image, or imaged area, in meters.""")
     orientation: Optional[str] = Field(
         None,
         description="""Description of image relative to some reference frame (e.g., which way is up). Must also specify frame of reference.""",
     )
-    data: Optional[ImageSeriesData] = Field(
+    data: Optional[CastWithValue[CoerceValue[ImageSeriesData]]] = Field(
         None, description="""Binary data representing images across frames."""
     )
-    dimension: Optional[NDArray[Shape["* rank"], int]] = Field(
+    dimension: Optional[CoerceValue[NDArray[Shape["* rank"], int]]] = Field(
         None,
         description="""Number of pixels on x, y, (and z) axes.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "rank"}]}}},
     )
-    external_file: Optional[ImageSeriesExternalFile] = Field(
+    external_file: Optional[CastWithValue[CoerceValue[ImageSeriesExternalFile]]] = Field(
         None,
         description="""Paths to one or more external file(s). The field is only present if format='external'. This is only relevant if the image series is stored in the file system as one or more image file(s). This field should NOT be used if the image is stored in another NWB file and that file is linked to this file.""",
     )
@@ -465,21 +562,21 @@ class OpticalSeries(ImageSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -502,7 +599,7 @@ class IndexSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: IndexSeriesData = Field(
+    data: CastWithValue[CoerceValue[IndexSeriesData]] = Field(
         ..., description="""Index of the frame in the referenced ImageSeries."""
     )
     indexed_timeseries: Union[ImageSeries, str] = Field(
@@ -524,21 +621,21 @@ class IndexSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -576,20 +673,6 @@ class IndexSeriesData(ConfiguredBaseModel):
         ...,
         description="""Base unit of measurement for working with the data. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
     )
-    value: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-GrayscaleImage.model_rebuild()
-RGBImage.model_rebuild()
-RGBAImage.model_rebuild()
-ImageSeries.model_rebuild()
-ImageSeriesData.model_rebuild()
-ImageSeriesExternalFile.model_rebuild()
-ImageMaskSeries.model_rebuild()
-OpticalSeries.model_rebuild()
-IndexSeries.model_rebuild()
-IndexSeriesData.model_rebuild()
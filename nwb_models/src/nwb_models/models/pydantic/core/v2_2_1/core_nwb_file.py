@@ -5,11 +5,21 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Optional, Type, TypeVar, Union
 
 import numpy as np
 from numpydantic import NDArray, Shape
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 from ...core.v2_2_1.core_nwb_base import (
     NWBContainer,
@@ -45,6 +55,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -59,33 +70,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -96,10 +80,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -145,7 +126,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -189,7 +281,7 @@ class NWBFile(NWBContainer):
         description="""File version string. Use semantic versioning, e.g. 1.2.1. This will be the name of the format with trailing major, minor and patch numbers.""",
         json_schema_extra={"linkml_meta": {"equals_string": "2.2.1", "ifabsent": "string(2.2.1)"}},
     )
-    file_create_date: NDArray[Shape["* num_modifications"], datetime] = Field(
+    file_create_date: CoerceValue[NDArray[Shape["* num_modifications"], datetime]] = Field(
         ...,
         description="""A record of the date the file was created and of subsequent modifications. The date is stored in UTC with local timezone offset as ISO 8601 extended formatted strings: 2018-09-28T14:43:54.123+02:00. Dates stored in UTC end in \"Z\" with no timezone offset. Date accuracy is up to milliseconds. The file can be created after the experiment was run, so this may differ from the experiment start time. Each modification to the nwb file adds a new entry to the array.""",
         json_schema_extra={
@@ -232,7 +324,7 @@ class NWBFile(NWBContainer):
             "linkml_meta": {"any_of": [{"range": "NWBContainer"}, {"range": "DynamicTable"}]}
         },
     )
-    processing: Optional[Dict[str, ProcessingModule]] = Field(
+    processing: Optional[CastWithValue[CoerceValue[Dict[str, ProcessingModule]]]] = Field(
         None,
         description="""The home for ProcessingModules. These modules perform intermediate analysis of data that is necessary to perform before scientific analysis. Examples include spike clustering, extracting position from tracking data, stitching together image slices. ProcessingModules can be large and express many data sets from relatively complex analysis (e.g., spike detection and clustering) or small, representing extraction of position information from tracking video, or even binary lick/no-lick decisions. Common software tools (e.g., klustakwik, MClust) are expected to read/write data here.  'Processing' refers to intermediate analysis of the acquired data to make it more amenable to scientific analysis.""",
         json_schema_extra={"linkml_meta": {"any_of": [{"range": "ProcessingModule"}]}},
@@ -245,7 +337,7 @@ class NWBFile(NWBContainer):
         ...,
         description="""Experimental metadata, including protocol, notes and description of hardware device(s).  The metadata stored in this section should be used to describe the experiment. Metadata necessary for interpreting the data is stored with the data. General experimental metadata, including animal strain, experimental protocols, experimenter, devices, etc, are stored under 'general'. Core metadata (e.g., that required to interpret data fields) is stored with the data itself, and implicitly defined by the file specification (e.g., time is in seconds). The strategy used here for storing non-core metadata is to use free-form text fields, such as would appear in sentences or paragraphs from a Methods section. Metadata fields are text to enable them to be more general, for example to represent ranges instead of numerical values. Machine-readable metadata is stored as attributes to these free-form datasets. All entries in the below table are to be included when data is present. Unused groups (e.g., intracellular_ephys in an optophysiology experiment) should not be created unless there is data to store within them.""",
     )
-    intervals: Optional[NWBFileIntervals] = Field(
+    intervals: Optional[CastWithValue[CoerceValue[NWBFileIntervals]]] = Field(
         None,
         description="""Experimental intervals, whether that be logically distinct sub-experiments having a particular scientific goal, trials (see trials subgroup) during an experiment, or epochs (see epochs subgroup) deriving from analysis of data.""",
     )
@@ -299,7 +391,7 @@ class NWBFileGeneral(ConfiguredBaseModel):
     experiment_description: Optional[str] = Field(
         None, description="""General description of the experiment."""
     )
-    experimenter: Optional[NDArray[Shape["* num_experimenters"], str]] = Field(
+    experimenter: Optional[CoerceValue[NDArray[Shape["* num_experimenters"], str]]] = Field(
         None,
         description="""Name of person(s) who performed the experiment. Can also specify roles of different people involved.""",
         json_schema_extra={
@@ -309,7 +401,7 @@ class NWBFileGeneral(ConfiguredBaseModel):
     institution: Optional[str] = Field(
         None, description="""Institution(s) where experiment was performed."""
     )
-    keywords: Optional[NDArray[Shape["* num_keywords"], str]] = Field(
+    keywords: Optional[CoerceValue[NDArray[Shape["* num_keywords"], str]]] = Field(
         None,
         description="""Terms to search over.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_keywords"}]}}},
@@ -324,7 +416,7 @@ class NWBFileGeneral(ConfiguredBaseModel):
         None,
         description="""Experimental protocol, if applicable. e.g., include IACUC protocol number.""",
     )
-    related_publications: Optional[NDArray[Shape["* num_publications"], str]] = Field(
+    related_publications: Optional[CoerceValue[NDArray[Shape["* num_publications"], str]]] = Field(
         None,
         description="""Publication information. PMID, DOI, URL, etc.""",
         json_schema_extra={
@@ -336,7 +428,7 @@ class NWBFileGeneral(ConfiguredBaseModel):
         None,
         description="""Description of slices, including information about preparation thickness, orientation, temperature, and bath solution.""",
     )
-    source_script: Optional[GeneralSourceScript] = Field(
+    source_script: Optional[CastWithValue[CoerceValue[GeneralSourceScript]]] = Field(
         None,
         description="""Script file or link to public source code used to create this NWB file.""",
     )
@@ -364,10 +456,10 @@ class NWBFileGeneral(ConfiguredBaseModel):
         None,
         description="""Information about the animal or person from which the data was measured.""",
     )
-    extracellular_ephys: Optional[GeneralExtracellularEphys] = Field(
+    extracellular_ephys: Optional[CastWithValue[CoerceValue[GeneralExtracellularEphys]]] = Field(
         None, description="""Metadata related to extracellular electrophysiology."""
     )
-    intracellular_ephys: Optional[GeneralIntracellularEphys] = Field(
+    intracellular_ephys: Optional[CastWithValue[CoerceValue[GeneralIntracellularEphys]]] = Field(
         None, description="""Metadata related to intracellular electrophysiology."""
     )
     optogenetics: Optional[Dict[str, OptogeneticStimulusSite]] = Field(
@@ -474,7 +566,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             "linkml_meta": {"equals_string": "electrodes", "ifabsent": "string(electrodes)"}
         },
     )
-    x: VectorData[NDArray[Any, float]] = Field(
+    x: CoerceValue[VectorData[NDArray[Any, float]]] = Field(
         ...,
         description="""x coordinate of the channel location in the brain (+x is posterior).""",
         json_schema_extra={
@@ -483,7 +575,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    y: VectorData[NDArray[Any, float]] = Field(
+    y: CoerceValue[VectorData[NDArray[Any, float]]] = Field(
         ...,
         description="""y coordinate of the channel location in the brain (+y is inferior).""",
         json_schema_extra={
@@ -492,7 +584,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    z: VectorData[NDArray[Any, float]] = Field(
+    z: CoerceValue[VectorData[NDArray[Any, float]]] = Field(
         ...,
         description="""z coordinate of the channel location in the brain (+z is right).""",
         json_schema_extra={
@@ -501,7 +593,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    imp: VectorData[NDArray[Any, float]] = Field(
+    imp: CoerceValue[VectorData[NDArray[Any, float]]] = Field(
         ...,
         description="""Impedance of the channel.""",
         json_schema_extra={
@@ -510,7 +602,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    location: VectorData[NDArray[Any, str]] = Field(
+    location: CoerceValue[VectorData[NDArray[Any, str]]] = Field(
         ...,
         description="""Location of the electrode (channel). Specify the area, layer, comments on estimation of area/layer, stereotaxic coordinates if in vivo, etc. Use standard atlas names for anatomical regions when possible.""",
         json_schema_extra={
@@ -519,7 +611,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    filtering: VectorData[NDArray[Any, float]] = Field(
+    filtering: CoerceValue[VectorData[NDArray[Any, float]]] = Field(
         ...,
         description="""Description of hardware filtering.""",
         json_schema_extra={
@@ -528,7 +620,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    group: VectorData[NDArray[Any, ElectrodeGroup]] = Field(
+    group: CoerceValue[VectorData[NDArray[Any, ElectrodeGroup]]] = Field(
         ...,
         description="""Reference to the ElectrodeGroup this electrode is a part of.""",
         json_schema_extra={
@@ -537,7 +629,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    group_name: VectorData[NDArray[Any, str]] = Field(
+    group_name: CoerceValue[VectorData[NDArray[Any, str]]] = Field(
         ...,
         description="""Name of the ElectrodeGroup this electrode is a part of.""",
         json_schema_extra={
@@ -546,7 +638,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    rel_x: Optional[VectorData[NDArray[Any, float]]] = Field(
+    rel_x: Optional[CoerceValue[VectorData[NDArray[Any, float]]]] = Field(
         None,
         description="""x coordinate in electrode group""",
         json_schema_extra={
@@ -555,7 +647,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    rel_y: Optional[VectorData[NDArray[Any, float]]] = Field(
+    rel_y: Optional[CoerceValue[VectorData[NDArray[Any, float]]]] = Field(
         None,
         description="""y coordinate in electrode group""",
         json_schema_extra={
@@ -564,7 +656,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    rel_z: Optional[VectorData[NDArray[Any, float]]] = Field(
+    rel_z: Optional[CoerceValue[VectorData[NDArray[Any, float]]]] = Field(
         None,
         description="""z coordinate in electrode group""",
         json_schema_extra={
@@ -573,7 +665,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
             }
         },
     )
-    reference: Optional[VectorData[NDArray[Any, str]]] = Field(
+    reference: Optional[CoerceValue[VectorData[NDArray[Any, str]]]] = Field(
         None,
         description="""Description of the reference used for this electrode.""",
         json_schema_extra={
@@ -587,7 +679,7 @@ class ExtracellularEphysElectrodes(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CoerceValue[ElementIdentifiers] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -649,16 +741,3 @@ class NWBFileIntervals(ConfiguredBaseModel):
         None,
         description="""Optional additional table(s) for describing other experimental time intervals.""",
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-NWBFile.model_rebuild()
-NWBFileStimulus.model_rebuild()
-NWBFileGeneral.model_rebuild()
-GeneralSourceScript.model_rebuild()
-Subject.model_rebuild()
-GeneralExtracellularEphys.model_rebuild()
-ExtracellularEphysElectrodes.model_rebuild()
-GeneralIntracellularEphys.model_rebuild()
-NWBFileIntervals.model_rebuild()
@@ -16,6 +16,8 @@ from pydantic import (
     Field,
     RootModel,
     ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
@@ -44,6 +46,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -58,33 +61,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -95,10 +71,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -144,6 +117,82 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
 
 ModelType = TypeVar("ModelType", bound=Type[BaseModel])
@@ -161,6 +210,41 @@ def _get_name(item: ModelType | dict, info: ValidationInfo) -> Union[ModelType,
 
 
 Named = Annotated[ModelType, BeforeValidator(_get_name)]
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -190,13 +274,15 @@ class ElectricalSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    channel_conversion: Optional[NDArray[Shape["* num_channels"], float]] = Field(
+    channel_conversion: Optional[CoerceValue[NDArray[Shape["* num_channels"], float]]] = Field(
         None,
         description="""Channel-specific conversion factor. Multiply the data in the 'data' dataset by these values along the channel axis (as indicated by axis attribute) AND by the global conversion factor in the 'conversion' attribute of 'data' to get the data values in Volts, i.e, data in Volts = data * data.conversion * channel_conversion. This approach allows for both global and per-channel data conversion factors needed to support the storage of electrical recordings as native values generated by data acquisition systems. If this dataset is not present, then there is no channel-specific conversion factor, i.e. it is 1 for all channels.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_channels"}]}}},
     )
-    data: ElectricalSeriesData = Field(..., description="""Recorded voltage data.""")
-    electrodes: Named[DynamicTableRegion] = Field(
+    data: CastWithValue[CoerceValue[ElectricalSeriesData]] = Field(
+        ..., description="""Recorded voltage data."""
+    )
+    electrodes: CastWithValue[CoerceValue[Named[DynamicTableRegion]]] = Field(
         ...,
         description="""DynamicTableRegion pointer to the electrodes that this time series was generated from.""",
         json_schema_extra={
@@ -218,21 +304,21 @@ class ElectricalSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -272,10 +358,12 @@ class ElectricalSeriesData(ConfiguredBaseModel):
         json_schema_extra={"linkml_meta": {"equals_string": "volts", "ifabsent": "string(volts)"}},
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* num_times"], float | int],
-            NDArray[Shape["* num_times, * num_channels"], float | int],
-            NDArray[Shape["* num_times, * num_channels, * num_samples"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* num_times"], float | int],
+                NDArray[Shape["* num_times, * num_channels"], float | int],
+                NDArray[Shape["* num_times, * num_channels, * num_samples"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -290,18 +378,20 @@ class SpikeEventSeries(ElectricalSeries):
     )
 
     name: str = Field(...)
-    data: SpikeEventSeriesData = Field(..., description="""Spike waveforms.""")
-    timestamps: NDArray[Shape["* num_times"], float] = Field(
+    data: CastWithValue[CoerceValue[SpikeEventSeriesData]] = Field(
+        ..., description="""Spike waveforms."""
+    )
+    timestamps: CoerceValue[NDArray[Shape["* num_times"], float]] = Field(
         ...,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time. Timestamps are required for the events. Unlike for TimeSeries, timestamps are required for SpikeEventSeries and are thus re-specified here.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    channel_conversion: Optional[NDArray[Shape["* num_channels"], float]] = Field(
+    channel_conversion: Optional[CoerceValue[NDArray[Shape["* num_channels"], float]]] = Field(
         None,
         description="""Channel-specific conversion factor. Multiply the data in the 'data' dataset by these values along the channel axis (as indicated by axis attribute) AND by the global conversion factor in the 'conversion' attribute of 'data' to get the data values in Volts, i.e, data in Volts = data * data.conversion * channel_conversion. This approach allows for both global and per-channel data conversion factors needed to support the storage of electrical recordings as native values generated by data acquisition systems. If this dataset is not present, then there is no channel-specific conversion factor, i.e. it is 1 for all channels.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_channels"}]}}},
     )
-    electrodes: Named[DynamicTableRegion] = Field(
+    electrodes: CastWithValue[CoerceValue[Named[DynamicTableRegion]]] = Field(
         ...,
         description="""DynamicTableRegion pointer to the electrodes that this time series was generated from.""",
         json_schema_extra={
@@ -323,16 +413,16 @@ class SpikeEventSeries(ElectricalSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -372,9 +462,11 @@ class SpikeEventSeriesData(ConfiguredBaseModel):
         json_schema_extra={"linkml_meta": {"equals_string": "volts", "ifabsent": "string(volts)"}},
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* num_events, * num_samples"], float | int],
-            NDArray[Shape["* num_events, * num_channels, * num_samples"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* num_events, * num_samples"], float | int],
+                NDArray[Shape["* num_events, * num_channels, * num_samples"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -392,32 +484,34 @@ class FeatureExtraction(NWBDataInterface):
         "FeatureExtraction",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(FeatureExtraction)"}},
     )
-    description: NDArray[Shape["* num_features"], str] = Field(
+    description: CoerceValue[NDArray[Shape["* num_features"], str]] = Field(
         ...,
         description="""Description of features (eg, ''PC1'') for each of the extracted features.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_features"}]}}},
     )
-    features: NDArray[Shape["* num_events, * num_channels, * num_features"], float] = Field(
-        ...,
-        description="""Multi-dimensional array of features extracted from each event.""",
-        json_schema_extra={
-            "linkml_meta": {
-                "array": {
-                    "dimensions": [
-                        {"alias": "num_events"},
-                        {"alias": "num_channels"},
-                        {"alias": "num_features"},
-                    ]
+    features: CoerceValue[NDArray[Shape["* num_events, * num_channels, * num_features"], float]] = (
+        Field(
+            ...,
+            description="""Multi-dimensional array of features extracted from each event.""",
+            json_schema_extra={
+                "linkml_meta": {
+                    "array": {
+                        "dimensions": [
+                            {"alias": "num_events"},
+                            {"alias": "num_channels"},
+                            {"alias": "num_features"},
+                        ]
+                    }
                 }
-            }
-        },
+            },
+        )
     )
-    times: NDArray[Shape["* num_events"], float] = Field(
+    times: CoerceValue[NDArray[Shape["* num_events"], float]] = Field(
         ...,
         description="""Times of events that features correspond to (can be a link).""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_events"}]}}},
     )
-    electrodes: Named[DynamicTableRegion] = Field(
+    electrodes: CastWithValue[CoerceValue[Named[DynamicTableRegion]]] = Field(
         ...,
         description="""DynamicTableRegion pointer to the electrodes that this time series was generated from.""",
         json_schema_extra={
@@ -447,12 +541,12 @@ class EventDetection(NWBDataInterface):
         ...,
         description="""Description of how events were detected, such as voltage threshold, or dV/dT threshold, as well as relevant values.""",
     )
-    source_idx: NDArray[Shape["* num_events"], int] = Field(
+    source_idx: CoerceValue[NDArray[Shape["* num_events"], int]] = Field(
         ...,
         description="""Indices (zero-based) into source ElectricalSeries::data array corresponding to time of event. ''description'' should define what is meant by time of event (e.g., .25 ms before action potential peak, zero-crossing time, etc). The index points to each event from the raw data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_events"}]}}},
     )
-    times: NDArray[Shape["* num_events"], float] = Field(
+    times: CoerceValue[NDArray[Shape["* num_events"], float]] = Field(
         ...,
         description="""Timestamps of events, in seconds.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_events"}]}}},
@@ -559,17 +653,17 @@ class ElectrodeGroupPosition(ConfiguredBaseModel):
             "linkml_meta": {"equals_string": "position", "ifabsent": "string(position)"}
         },
     )
-    x: Optional[NDArray[Shape["*"], float]] = Field(
+    x: Optional[CoerceValue[NDArray[Shape["*"], float]]] = Field(
         None,
         description="""x coordinate""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    y: Optional[NDArray[Shape["*"], float]] = Field(
+    y: Optional[CoerceValue[NDArray[Shape["*"], float]]] = Field(
         None,
         description="""y coordinate""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    z: Optional[NDArray[Shape["*"], float]] = Field(
+    z: Optional[CoerceValue[NDArray[Shape["*"], float]]] = Field(
         None,
         description="""z coordinate""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
@@ -592,7 +686,7 @@ class ClusterWaveforms(NWBDataInterface):
     waveform_filtering: str = Field(
         ..., description="""Filtering applied to data before generating mean/sd"""
     )
-    waveform_mean: NDArray[Shape["* num_clusters, * num_samples"], float] = Field(
+    waveform_mean: CoerceValue[NDArray[Shape["* num_clusters, * num_samples"], float]] = Field(
         ...,
         description="""The mean waveform for each cluster, using the same indices for each wave as cluster numbers in the associated Clustering module (i.e, cluster 3 is in array slot [3]). Waveforms corresponding to gaps in cluster sequence should be empty (e.g., zero- filled)""",
         json_schema_extra={
@@ -601,7 +695,7 @@ class ClusterWaveforms(NWBDataInterface):
             }
         },
     )
-    waveform_sd: NDArray[Shape["* num_clusters, * num_samples"], float] = Field(
+    waveform_sd: CoerceValue[NDArray[Shape["* num_clusters, * num_samples"], float]] = Field(
         ...,
         description="""Stdev of waveforms for each cluster, using the same indices as in mean""",
         json_schema_extra={
@@ -637,35 +731,18 @@ class Clustering(NWBDataInterface):
         ...,
         description="""Description of clusters or clustering, (e.g. cluster 0 is noise, clusters curated using Klusters, etc)""",
     )
-    num: NDArray[Shape["* num_events"], int] = Field(
+    num: CoerceValue[NDArray[Shape["* num_events"], int]] = Field(
         ...,
         description="""Cluster number of each event""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_events"}]}}},
     )
-    peak_over_rms: NDArray[Shape["* num_clusters"], float] = Field(
+    peak_over_rms: CoerceValue[NDArray[Shape["* num_clusters"], float]] = Field(
         ...,
         description="""Maximum ratio of waveform peak to RMS on any channel in the cluster (provides a basic clustering metric).""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_clusters"}]}}},
     )
-    times: NDArray[Shape["* num_events"], float] = Field(
+    times: CoerceValue[NDArray[Shape["* num_events"], float]] = Field(
         ...,
         description="""Times of clustered events, in seconds. This may be a link to times field in associated FeatureExtraction module.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_events"}]}}},
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-ElectricalSeries.model_rebuild()
-ElectricalSeriesData.model_rebuild()
-SpikeEventSeries.model_rebuild()
-SpikeEventSeriesData.model_rebuild()
-FeatureExtraction.model_rebuild()
-EventDetection.model_rebuild()
-EventWaveform.model_rebuild()
-FilteredEphys.model_rebuild()
-LFP.model_rebuild()
-ElectrodeGroup.model_rebuild()
-ElectrodeGroupPosition.model_rebuild()
-ClusterWaveforms.model_rebuild()
-Clustering.model_rebuild()
@@ -16,6 +16,8 @@ from pydantic import (
     Field,
     RootModel,
     ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
@@ -51,6 +53,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -65,33 +68,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -102,10 +78,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -151,8 +124,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
 
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 ModelType = TypeVar("ModelType", bound=Type[BaseModel])
 
 
@@ -204,7 +287,9 @@ class TwoPhotonSeries(ImageSeries):
         description="""Lines imaged per second. This is also stored in /general/optophysiology but is kept here as it is useful information for analysis, and so good to be stored w/ the actual data.""",
     )
     field_of_view: Optional[
-        Union[NDArray[Shape["2 width_height"], float], NDArray[Shape["3 width_height"], float]]
+        CoerceValue[
+            Union[NDArray[Shape["2 width_height"], float], NDArray[Shape["3 width_height"], float]]
+        ]
     ] = Field(None, description="""Width, height and depth of image, or imaged area, in meters.""")
     imaging_plane: Union[ImagingPlane, str] = Field(
         ...,
@@ -215,15 +300,15 @@ class TwoPhotonSeries(ImageSeries):
             }
         },
     )
-    data: Optional[ImageSeriesData] = Field(
+    data: Optional[CastWithValue[CoerceValue[ImageSeriesData]]] = Field(
         None, description="""Binary data representing images across frames."""
     )
-    dimension: Optional[NDArray[Shape["* rank"], int]] = Field(
+    dimension: Optional[CoerceValue[NDArray[Shape["* rank"], int]]] = Field(
         None,
         description="""Number of pixels on x, y, (and z) axes.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "rank"}]}}},
     )
-    external_file: Optional[ImageSeriesExternalFile] = Field(
+    external_file: Optional[CastWithValue[CoerceValue[ImageSeriesExternalFile]]] = Field(
         None,
         description="""Paths to one or more external file(s). The field is only present if format='external'. This is only relevant if the image series is stored in the file system as one or more image file(s). This field should NOT be used if the image is stored in another NWB file and that file is linked to this file.""",
     )
@@ -242,21 +327,21 @@ class TwoPhotonSeries(ImageSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -279,8 +364,10 @@ class RoiResponseSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: RoiResponseSeriesData = Field(..., description="""Signals from ROIs.""")
-    rois: Named[DynamicTableRegion] = Field(
+    data: CastWithValue[CoerceValue[RoiResponseSeriesData]] = Field(
+        ..., description="""Signals from ROIs."""
+    )
+    rois: CastWithValue[CoerceValue[Named[DynamicTableRegion]]] = Field(
         ...,
         description="""DynamicTableRegion referencing into an ROITable containing information on the ROIs stored in this timeseries.""",
         json_schema_extra={
@@ -302,21 +389,21 @@ class RoiResponseSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -355,9 +442,11 @@ class RoiResponseSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* num_times"], float | int],
-            NDArray[Shape["* num_times, * num_rois"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* num_times"], float | int],
+                NDArray[Shape["* num_times, * num_rois"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -423,21 +512,25 @@ class PlaneSegmentation(DynamicTable):
 
     name: str = Field(...)
     image_mask: Optional[
-        VectorData[
-            Union[
-                NDArray[Shape["* num_roi, * num_x, * num_y"], Any],
-                NDArray[Shape["* num_roi, * num_x, * num_y, * num_z"], Any],
+        CastWithValue[
+            CoerceValue[
+                VectorData[
+                    Union[
+                        NDArray[Shape["* num_roi, * num_x, * num_y"], Any],
+                        NDArray[Shape["* num_roi, * num_x, * num_y, * num_z"], Any],
+                    ]
+                ]
             ]
         ]
     ] = Field(
         None,
         description="""ROI masks for each ROI. Each image mask is the size of the original imaging plane (or volume) and members of the ROI are finite non-zero.""",
     )
-    pixel_mask: Optional[PlaneSegmentationPixelMask] = Field(
+    pixel_mask: Optional[CastWithValue[CoerceValue[PlaneSegmentationPixelMask]]] = Field(
         None,
         description="""Pixel masks for each ROI: a list of indices and weights for the ROI. Pixel masks are concatenated and parsing of this dataset is maintained by the PlaneSegmentation""",
     )
-    pixel_mask_index: Optional[Named[VectorIndex]] = Field(
+    pixel_mask_index: Optional[CastWithValue[CoerceValue[Named[VectorIndex]]]] = Field(
         None,
         description="""Index into pixel_mask.""",
         json_schema_extra={
@@ -449,11 +542,11 @@ class PlaneSegmentation(DynamicTable):
             }
         },
     )
-    voxel_mask: Optional[PlaneSegmentationVoxelMask] = Field(
+    voxel_mask: Optional[CastWithValue[CoerceValue[PlaneSegmentationVoxelMask]]] = Field(
         None,
         description="""Voxel masks for each ROI: a list of indices and weights for the ROI. Voxel masks are concatenated and parsing of this dataset is maintained by the PlaneSegmentation""",
     )
-    voxel_mask_index: Optional[Named[VectorIndex]] = Field(
+    voxel_mask_index: Optional[CastWithValue[CoerceValue[Named[VectorIndex]]]] = Field(
         None,
         description="""Index into voxel_mask.""",
         json_schema_extra={
@@ -484,7 +577,7 @@ class PlaneSegmentation(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -504,28 +597,30 @@ class PlaneSegmentationPixelMask(VectorData):
             "linkml_meta": {"equals_string": "pixel_mask", "ifabsent": "string(pixel_mask)"}
         },
     )
-    x: Optional[NDArray[Shape["*"], int]] = Field(
+    x: Optional[CoerceValue[NDArray[Shape["*"], int]]] = Field(
         None,
         description="""Pixel x-coordinate.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    y: Optional[NDArray[Shape["*"], int]] = Field(
+    y: Optional[CoerceValue[NDArray[Shape["*"], int]]] = Field(
         None,
         description="""Pixel y-coordinate.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    weight: Optional[NDArray[Shape["*"], float]] = Field(
+    weight: Optional[CoerceValue[NDArray[Shape["*"], float]]] = Field(
         None,
         description="""Weight of the pixel.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -543,33 +638,35 @@ class PlaneSegmentationVoxelMask(VectorData):
             "linkml_meta": {"equals_string": "voxel_mask", "ifabsent": "string(voxel_mask)"}
         },
     )
-    x: Optional[NDArray[Shape["*"], int]] = Field(
+    x: Optional[CoerceValue[NDArray[Shape["*"], int]]] = Field(
         None,
         description="""Voxel x-coordinate.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    y: Optional[NDArray[Shape["*"], int]] = Field(
+    y: Optional[CoerceValue[NDArray[Shape["*"], int]]] = Field(
         None,
         description="""Voxel y-coordinate.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    z: Optional[NDArray[Shape["*"], int]] = Field(
+    z: Optional[CoerceValue[NDArray[Shape["*"], int]]] = Field(
         None,
         description="""Voxel z-coordinate.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    weight: Optional[NDArray[Shape["*"], float]] = Field(
+    weight: Optional[CoerceValue[NDArray[Shape["*"], float]]] = Field(
         None,
         description="""Weight of the voxel.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -595,15 +692,15 @@ class ImagingPlane(NWBContainer):
         ...,
         description="""Location of the imaging plane. Specify the area, layer, comments on estimation of area/layer, stereotaxic coordinates if in vivo, etc. Use standard atlas names for anatomical regions when possible.""",
     )
-    manifold: Optional[ImagingPlaneManifold] = Field(
+    manifold: Optional[CastWithValue[CoerceValue[ImagingPlaneManifold]]] = Field(
         None,
         description="""DEPRECATED Physical position of each pixel. 'xyz' represents the position of the pixel relative to the defined coordinate space. Deprecated in favor of origin_coords and grid_spacing.""",
     )
-    origin_coords: Optional[ImagingPlaneOriginCoords] = Field(
+    origin_coords: Optional[CastWithValue[CoerceValue[ImagingPlaneOriginCoords]]] = Field(
         None,
         description="""Physical location of the first element of the imaging plane (0, 0) for 2-D data or (0, 0, 0) for 3-D data. See also reference_frame for what the physical location is relative to (e.g., bregma).""",
     )
-    grid_spacing: Optional[ImagingPlaneGridSpacing] = Field(
+    grid_spacing: Optional[CastWithValue[CoerceValue[ImagingPlaneGridSpacing]]] = Field(
         None,
         description="""Space between pixels in (x, y) or voxels in (x, y, z) directions, in the specified unit. Assumes imaging plane is a regular grid. See also reference_frame to interpret the grid.""",
     )
@@ -649,9 +746,11 @@ class ImagingPlaneManifold(ConfiguredBaseModel):
         json_schema_extra={"linkml_meta": {"ifabsent": "string(meters)"}},
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* height, * width, 3 x_y_z"], float],
-            NDArray[Shape["* height, * width, * depth, 3 x_y_z"], float],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* height, * width, 3 x_y_z"], float],
+                NDArray[Shape["* height, * width, * depth, 3 x_y_z"], float],
+            ]
         ]
     ] = Field(None)
 
@@ -674,7 +773,7 @@ class ImagingPlaneOriginCoords(ConfiguredBaseModel):
         description="""Measurement units for origin_coords. The default value is 'meters'.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(meters)"}},
     )
-    value: Optional[NDArray[Shape["2 x_y, 3 x_y_z"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["2 x_y, 3 x_y_z"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {
@@ -707,7 +806,7 @@ class ImagingPlaneGridSpacing(ConfiguredBaseModel):
         description="""Measurement units for grid_spacing. The default value is 'meters'.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(meters)"}},
     )
-    value: Optional[NDArray[Shape["2 x_y, 3 x_y_z"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["2 x_y, 3 x_y_z"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {
@@ -780,23 +879,3 @@ class CorrectedImageStack(NWBDataInterface):
             }
         },
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-TwoPhotonSeries.model_rebuild()
-RoiResponseSeries.model_rebuild()
-RoiResponseSeriesData.model_rebuild()
-DfOverF.model_rebuild()
-Fluorescence.model_rebuild()
-ImageSegmentation.model_rebuild()
-PlaneSegmentation.model_rebuild()
-PlaneSegmentationPixelMask.model_rebuild()
-PlaneSegmentationVoxelMask.model_rebuild()
-ImagingPlane.model_rebuild()
-ImagingPlaneManifold.model_rebuild()
-ImagingPlaneOriginCoords.model_rebuild()
-ImagingPlaneGridSpacing.model_rebuild()
-OpticalChannel.model_rebuild()
-MotionCorrection.model_rebuild()
-CorrectedImageStack.model_rebuild()
@@ -16,6 +16,8 @@ from pydantic import (
     Field,
     RootModel,
     ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
@@ -44,6 +46,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -58,33 +61,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -95,10 +71,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -144,8 +117,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
 
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 ModelType = TypeVar("ModelType", bound=Type[BaseModel])
 
 
@@ -190,15 +273,15 @@ class AbstractFeatureSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: AbstractFeatureSeriesData = Field(
+    data: CastWithValue[CoerceValue[AbstractFeatureSeriesData]] = Field(
         ..., description="""Values of each feature at each time."""
     )
-    feature_units: Optional[NDArray[Shape["* num_features"], str]] = Field(
+    feature_units: Optional[CoerceValue[NDArray[Shape["* num_features"], str]]] = Field(
         None,
         description="""Units of each feature.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_features"}]}}},
     )
-    features: NDArray[Shape["* num_features"], str] = Field(
+    features: CoerceValue[NDArray[Shape["* num_features"], str]] = Field(
         ...,
         description="""Description of the features represented in TimeSeries::data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_features"}]}}},
@@ -213,21 +296,21 @@ class AbstractFeatureSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -267,9 +350,11 @@ class AbstractFeatureSeriesData(ConfiguredBaseModel):
         json_schema_extra={"linkml_meta": {"ifabsent": "string(see 'feature_units')"}},
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* num_times"], float | int],
-            NDArray[Shape["* num_times, * num_features"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* num_times"], float | int],
+                NDArray[Shape["* num_times, * num_features"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -284,7 +369,7 @@ class AnnotationSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: AnnotationSeriesData = Field(
+    data: CastWithValue[CoerceValue[AnnotationSeriesData]] = Field(
         ..., description="""Annotations made during an experiment."""
     )
     description: Optional[str] = Field(
@@ -297,21 +382,21 @@ class AnnotationSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -352,7 +437,7 @@ class AnnotationSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. Annotations have no units, so the value is fixed to 'n/a'.""",
         json_schema_extra={"linkml_meta": {"equals_string": "n/a", "ifabsent": "string(n/a)"}},
     )
-    value: Optional[NDArray[Shape["* num_times"], str]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], str]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -367,7 +452,7 @@ class IntervalSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: IntervalSeriesData = Field(
+    data: CastWithValue[CoerceValue[IntervalSeriesData]] = Field(
         ..., description="""Use values >0 if interval started, <0 if interval ended."""
     )
     description: Optional[str] = Field(
@@ -380,21 +465,21 @@ class IntervalSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -435,7 +520,7 @@ class IntervalSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. Annotations have no units, so the value is fixed to 'n/a'.""",
         json_schema_extra={"linkml_meta": {"equals_string": "n/a", "ifabsent": "string(n/a)"}},
     )
-    value: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -450,7 +535,7 @@ class DecompositionSeries(TimeSeries):
     )
 
     name: str = Field(...)
-    data: DecompositionSeriesData = Field(
+    data: CastWithValue[CoerceValue[DecompositionSeriesData]] = Field(
         ..., description="""Data decomposed into frequency bands."""
     )
     metric: str = Field(..., description="""The metric used, e.g. phase, amplitude, power.""")
@@ -477,21 +562,21 @@ class DecompositionSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -530,21 +615,21 @@ class DecompositionSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no unit)"}},
     )
-    value: Optional[NDArray[Shape["* num_times, * num_channels, * num_bands"], float | int]] = (
-        Field(
-            None,
-            json_schema_extra={
-                "linkml_meta": {
-                    "array": {
-                        "dimensions": [
-                            {"alias": "num_times"},
-                            {"alias": "num_channels"},
-                            {"alias": "num_bands"},
-                        ]
-                    }
+    value: Optional[
+        CoerceValue[NDArray[Shape["* num_times, * num_channels, * num_bands"], float | int]]
+    ] = Field(
+        None,
+        json_schema_extra={
+            "linkml_meta": {
+                "array": {
+                    "dimensions": [
+                        {"alias": "num_times"},
+                        {"alias": "num_channels"},
+                        {"alias": "num_bands"},
+                    ]
                 }
-            },
-        )
+            }
+        },
     )
 
 
@@ -559,7 +644,7 @@ class DecompositionSeriesBands(DynamicTable):
         "bands",
         json_schema_extra={"linkml_meta": {"equals_string": "bands", "ifabsent": "string(bands)"}},
     )
-    band_name: VectorData[NDArray[Any, str]] = Field(
+    band_name: CastWithValue[CoerceValue[VectorData[NDArray[Any, str]]]] = Field(
         ...,
         description="""Name of the band, e.g. theta.""",
         json_schema_extra={
@@ -568,7 +653,9 @@ class DecompositionSeriesBands(DynamicTable):
             }
         },
     )
-    band_limits: VectorData[NDArray[Shape["* num_bands, 2 low_high"], float]] = Field(
+    band_limits: CastWithValue[
+        CoerceValue[VectorData[NDArray[Shape["* num_bands, 2 low_high"], float]]]
+    ] = Field(
         ...,
         description="""Low and high limit of each band in Hz. If it is a Gaussian filter, use 2 SD on either side of the center.""",
         json_schema_extra={
@@ -582,22 +669,24 @@ class DecompositionSeriesBands(DynamicTable):
             }
         },
     )
-    band_mean: VectorData[NDArray[Shape["* num_bands"], float]] = Field(
+    band_mean: CastWithValue[CoerceValue[VectorData[NDArray[Shape["* num_bands"], float]]]] = Field(
         ...,
         description="""The mean Gaussian filters, in Hz.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_bands"}]}}},
     )
-    band_stdev: VectorData[NDArray[Shape["* num_bands"], float]] = Field(
-        ...,
-        description="""The standard deviation of Gaussian filters, in Hz.""",
-        json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_bands"}]}}},
+    band_stdev: CastWithValue[CoerceValue[VectorData[NDArray[Shape["* num_bands"], float]]]] = (
+        Field(
+            ...,
+            description="""The standard deviation of Gaussian filters, in Hz.""",
+            json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_bands"}]}}},
+        )
     )
     colnames: List[str] = Field(
         ...,
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -614,7 +703,9 @@ class Units(DynamicTable):
     )
 
     name: str = Field("Units", json_schema_extra={"linkml_meta": {"ifabsent": "string(Units)"}})
-    electrode_group: Optional[VectorData[NDArray[Any, ElectrodeGroup]]] = Field(
+    electrode_group: Optional[
+        CastWithValue[CoerceValue[VectorData[NDArray[Any, ElectrodeGroup]]]]
+    ] = Field(
         None,
         description="""Electrode group that each spike unit came from.""",
         json_schema_extra={
@@ -623,7 +714,7 @@ class Units(DynamicTable):
             }
         },
     )
-    electrodes: Optional[Named[DynamicTableRegion]] = Field(
+    electrodes: Optional[CastWithValue[CoerceValue[Named[DynamicTableRegion]]]] = Field(
         None,
         description="""Electrode that each spike unit came from, specified using a DynamicTableRegion.""",
         json_schema_extra={
@@ -635,7 +726,7 @@ class Units(DynamicTable):
             }
         },
     )
-    electrodes_index: Optional[Named[VectorIndex]] = Field(
+    electrodes_index: Optional[CastWithValue[CoerceValue[Named[VectorIndex]]]] = Field(
         None,
         description="""Index into electrodes.""",
         json_schema_extra={
@@ -647,23 +738,25 @@ class Units(DynamicTable):
             }
         },
     )
-    obs_intervals: Optional[VectorData[NDArray[Shape["* num_intervals, 2 start_end"], float]]] = (
-        Field(
-            None,
-            description="""Observation intervals for each unit.""",
-            json_schema_extra={
-                "linkml_meta": {
-                    "array": {
-                        "dimensions": [
-                            {"alias": "num_intervals"},
-                            {"alias": "start_end", "exact_cardinality": 2},
-                        ]
-                    }
+    obs_intervals: Optional[
+        CastWithValue[
+            CoerceValue[VectorData[NDArray[Shape["* num_intervals, 2 start_end"], float]]]
+        ]
+    ] = Field(
+        None,
+        description="""Observation intervals for each unit.""",
+        json_schema_extra={
+            "linkml_meta": {
+                "array": {
+                    "dimensions": [
+                        {"alias": "num_intervals"},
+                        {"alias": "start_end", "exact_cardinality": 2},
+                    ]
                 }
-            },
-        )
+            }
+        },
     )
-    obs_intervals_index: Optional[Named[VectorIndex]] = Field(
+    obs_intervals_index: Optional[CastWithValue[CoerceValue[Named[VectorIndex]]]] = Field(
         None,
         description="""Index into the obs_intervals dataset.""",
         json_schema_extra={
@@ -675,10 +768,10 @@ class Units(DynamicTable):
             }
         },
     )
-    spike_times: Optional[UnitsSpikeTimes] = Field(
+    spike_times: Optional[CastWithValue[CoerceValue[UnitsSpikeTimes]]] = Field(
         None, description="""Spike times for each unit."""
     )
-    spike_times_index: Optional[Named[VectorIndex]] = Field(
+    spike_times_index: Optional[CastWithValue[CoerceValue[Named[VectorIndex]]]] = Field(
         None,
         description="""Index into the spike_times dataset.""",
         json_schema_extra={
@@ -690,10 +783,10 @@ class Units(DynamicTable):
             }
         },
     )
-    waveform_mean: Optional[UnitsWaveformMean] = Field(
+    waveform_mean: Optional[CastWithValue[CoerceValue[UnitsWaveformMean]]] = Field(
         None, description="""Spike waveform mean for each spike unit."""
     )
-    waveform_sd: Optional[UnitsWaveformSd] = Field(
+    waveform_sd: Optional[CastWithValue[CoerceValue[UnitsWaveformSd]]] = Field(
         None, description="""Spike waveform standard deviation for each spike unit."""
     )
     colnames: List[str] = Field(
@@ -701,7 +794,7 @@ class Units(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -727,11 +820,13 @@ class UnitsSpikeTimes(VectorData):
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -757,11 +852,13 @@ class UnitsWaveformMean(VectorData):
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -787,27 +884,12 @@ class UnitsWaveformSd(VectorData):
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-AbstractFeatureSeries.model_rebuild()
-AbstractFeatureSeriesData.model_rebuild()
-AnnotationSeries.model_rebuild()
-AnnotationSeriesData.model_rebuild()
-IntervalSeries.model_rebuild()
-IntervalSeriesData.model_rebuild()
-DecompositionSeries.model_rebuild()
-DecompositionSeriesData.model_rebuild()
-DecompositionSeriesBands.model_rebuild()
-Units.model_rebuild()
-UnitsSpikeTimes.model_rebuild()
-UnitsWaveformMean.model_rebuild()
-UnitsWaveformSd.model_rebuild()
@@ -5,11 +5,21 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Optional, Type, TypeVar, Union
 
 import numpy as np
 from numpydantic import NDArray, Shape
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 from ...core.v2_2_5.core_nwb_base import NWBDataInterface
 
@@ -27,6 +37,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -41,33 +52,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -78,10 +62,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -127,7 +108,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -155,21 +247,21 @@ class ImagingRetinotopy(NWBDataInterface):
         "ImagingRetinotopy",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(ImagingRetinotopy)"}},
     )
-    axis_1_phase_map: ImagingRetinotopyAxis1PhaseMap = Field(
+    axis_1_phase_map: CastWithValue[CoerceValue[ImagingRetinotopyAxis1PhaseMap]] = Field(
         ..., description="""Phase response to stimulus on the first measured axis."""
     )
-    axis_1_power_map: Optional[ImagingRetinotopyAxis1PowerMap] = Field(
+    axis_1_power_map: Optional[CastWithValue[CoerceValue[ImagingRetinotopyAxis1PowerMap]]] = Field(
         None,
         description="""Power response on the first measured axis. Response is scaled so 0.0 is no power in the response and 1.0 is maximum relative power.""",
     )
-    axis_2_phase_map: ImagingRetinotopyAxis2PhaseMap = Field(
+    axis_2_phase_map: CastWithValue[CoerceValue[ImagingRetinotopyAxis2PhaseMap]] = Field(
         ..., description="""Phase response to stimulus on the second measured axis."""
     )
-    axis_2_power_map: Optional[ImagingRetinotopyAxis2PowerMap] = Field(
+    axis_2_power_map: Optional[CastWithValue[CoerceValue[ImagingRetinotopyAxis2PowerMap]]] = Field(
         None,
         description="""Power response on the second measured axis. Response is scaled so 0.0 is no power in the response and 1.0 is maximum relative power.""",
     )
-    axis_descriptions: NDArray[Shape["2 axis_1_axis_2"], str] = Field(
+    axis_descriptions: CoerceValue[NDArray[Shape["2 axis_1_axis_2"], str]] = Field(
         ...,
         description="""Two-element array describing the contents of the two response axis fields. Description should be something like ['altitude', 'azimuth'] or '['radius', 'theta'].""",
         json_schema_extra={
@@ -178,15 +270,17 @@ class ImagingRetinotopy(NWBDataInterface):
             }
         },
     )
-    focal_depth_image: Optional[ImagingRetinotopyFocalDepthImage] = Field(
-        None,
-        description="""Gray-scale image taken with same settings/parameters (e.g., focal depth, wavelength) as data collection. Array format: [rows][columns].""",
+    focal_depth_image: Optional[CastWithValue[CoerceValue[ImagingRetinotopyFocalDepthImage]]] = (
+        Field(
+            None,
+            description="""Gray-scale image taken with same settings/parameters (e.g., focal depth, wavelength) as data collection. Array format: [rows][columns].""",
+        )
     )
-    sign_map: Optional[ImagingRetinotopySignMap] = Field(
+    sign_map: Optional[CastWithValue[CoerceValue[ImagingRetinotopySignMap]]] = Field(
         None,
         description="""Sine of the angle between the direction of the gradient in axis_1 and axis_2.""",
     )
-    vasculature_image: ImagingRetinotopyVasculatureImage = Field(
+    vasculature_image: CastWithValue[CoerceValue[ImagingRetinotopyVasculatureImage]] = Field(
         ...,
         description="""Gray-scale anatomical image of cortical surface. Array structure: [rows][columns]""",
     )
@@ -214,7 +308,7 @@ class ImagingRetinotopyAxis1PhaseMap(ConfiguredBaseModel):
     )
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
     unit: str = Field(..., description="""Unit that axis data is stored in (e.g., degrees).""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
@@ -244,7 +338,7 @@ class ImagingRetinotopyAxis1PowerMap(ConfiguredBaseModel):
     )
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
     unit: str = Field(..., description="""Unit that axis data is stored in (e.g., degrees).""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
@@ -274,7 +368,7 @@ class ImagingRetinotopyAxis2PhaseMap(ConfiguredBaseModel):
     )
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
     unit: str = Field(..., description="""Unit that axis data is stored in (e.g., degrees).""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
@@ -304,7 +398,7 @@ class ImagingRetinotopyAxis2PowerMap(ConfiguredBaseModel):
     )
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
     unit: str = Field(..., description="""Unit that axis data is stored in (e.g., degrees).""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
@@ -339,7 +433,7 @@ class ImagingRetinotopyFocalDepthImage(ConfiguredBaseModel):
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
     focal_depth: float = Field(..., description="""Focal depth offset, in meters.""")
     format: str = Field(..., description="""Format of image. Right now only 'raw' is supported.""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], int]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
@@ -365,7 +459,7 @@ class ImagingRetinotopySignMap(ConfiguredBaseModel):
         description="""Number of rows and columns in the image. NOTE: row, column representation is equivalent to height, width.""",
     )
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], float]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], float]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
@@ -399,21 +493,9 @@ class ImagingRetinotopyVasculatureImage(ConfiguredBaseModel):
     )
     field_of_view: List[float] = Field(..., description="""Size of viewing area, in meters.""")
     format: str = Field(..., description="""Format of image. Right now only 'raw' is supported.""")
-    value: Optional[NDArray[Shape["* num_rows, * num_cols"], int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_rows, * num_cols"], int]]] = Field(
         None,
         json_schema_extra={
             "linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}, {"alias": "num_cols"}]}}
         },
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-ImagingRetinotopy.model_rebuild()
-ImagingRetinotopyAxis1PhaseMap.model_rebuild()
-ImagingRetinotopyAxis1PowerMap.model_rebuild()
-ImagingRetinotopyAxis2PhaseMap.model_rebuild()
-ImagingRetinotopyAxis2PowerMap.model_rebuild()
-ImagingRetinotopyFocalDepthImage.model_rebuild()
-ImagingRetinotopySignMap.model_rebuild()
-ImagingRetinotopyVasculatureImage.model_rebuild()
@@ -5,165 +5,12 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from importlib import import_module
+from typing import Any, ClassVar, Dict, List, Literal, Optional, TYPE_CHECKING, Type, Union
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
 
-from ...core.v2_2_5.core_nwb_base import (
-    Image,
-    Images,
-    NWBContainer,
-    NWBData,
-    NWBDataInterface,
-    ProcessingModule,
-    TimeSeries,
-    TimeSeriesData,
-    TimeSeriesStartingTime,
-    TimeSeriesSync,
-)
-from ...core.v2_2_5.core_nwb_behavior import (
-    BehavioralEpochs,
-    BehavioralEvents,
-    BehavioralTimeSeries,
-    CompassDirection,
-    EyeTracking,
-    Position,
-    PupilTracking,
-    SpatialSeries,
-    SpatialSeriesData,
-)
-from ...core.v2_2_5.core_nwb_device import Device
-from ...core.v2_2_5.core_nwb_ecephys import (
-    ClusterWaveforms,
-    Clustering,
-    ElectricalSeries,
-    ElectricalSeriesData,
-    ElectrodeGroup,
-    ElectrodeGroupPosition,
-    EventDetection,
-    EventWaveform,
-    FeatureExtraction,
-    FilteredEphys,
-    LFP,
-    SpikeEventSeries,
-    SpikeEventSeriesData,
-)
-from ...core.v2_2_5.core_nwb_epoch import TimeIntervals, TimeIntervalsTimeseries
-from ...core.v2_2_5.core_nwb_file import (
-    ExtracellularEphysElectrodes,
-    GeneralExtracellularEphys,
-    GeneralIntracellularEphys,
-    GeneralSourceScript,
-    LabMetaData,
-    NWBFile,
-    NWBFileGeneral,
-    NWBFileIntervals,
-    NWBFileStimulus,
-    ScratchData,
-    Subject,
-)
-from ...core.v2_2_5.core_nwb_icephys import (
-    CurrentClampSeries,
-    CurrentClampSeriesData,
-    CurrentClampStimulusSeries,
-    CurrentClampStimulusSeriesData,
-    IZeroClampSeries,
-    IntracellularElectrode,
-    PatchClampSeries,
-    PatchClampSeriesData,
-    SweepTable,
-    VoltageClampSeries,
-    VoltageClampSeriesCapacitanceFast,
-    VoltageClampSeriesCapacitanceSlow,
-    VoltageClampSeriesData,
-    VoltageClampSeriesResistanceCompBandwidth,
-    VoltageClampSeriesResistanceCompCorrection,
-    VoltageClampSeriesResistanceCompPrediction,
-    VoltageClampSeriesWholeCellCapacitanceComp,
-    VoltageClampSeriesWholeCellSeriesResistanceComp,
-    VoltageClampStimulusSeries,
-    VoltageClampStimulusSeriesData,
-)
-from ...core.v2_2_5.core_nwb_image import (
-    GrayscaleImage,
-    ImageMaskSeries,
-    ImageSeries,
-    ImageSeriesData,
-    ImageSeriesExternalFile,
-    IndexSeries,
-    IndexSeriesData,
-    OpticalSeries,
-    OpticalSeriesData,
-    RGBAImage,
-    RGBImage,
-)
-from ...core.v2_2_5.core_nwb_misc import (
-    AbstractFeatureSeries,
-    AbstractFeatureSeriesData,
-    AnnotationSeries,
-    AnnotationSeriesData,
-    DecompositionSeries,
-    DecompositionSeriesBands,
-    DecompositionSeriesData,
-    IntervalSeries,
-    IntervalSeriesData,
-    Units,
-    UnitsSpikeTimes,
-    UnitsWaveformMean,
-    UnitsWaveformSd,
-)
-from ...core.v2_2_5.core_nwb_ogen import (
-    OptogeneticSeries,
-    OptogeneticSeriesData,
-    OptogeneticStimulusSite,
-)
-from ...core.v2_2_5.core_nwb_ophys import (
-    CorrectedImageStack,
-    DfOverF,
-    Fluorescence,
-    ImageSegmentation,
-    ImagingPlane,
-    ImagingPlaneGridSpacing,
-    ImagingPlaneManifold,
-    ImagingPlaneOriginCoords,
-    MotionCorrection,
-    OpticalChannel,
-    PlaneSegmentation,
-    PlaneSegmentationPixelMask,
-    PlaneSegmentationVoxelMask,
-    RoiResponseSeries,
-    RoiResponseSeriesData,
-    TwoPhotonSeries,
-)
-from ...core.v2_2_5.core_nwb_retinotopy import (
-    ImagingRetinotopy,
-    ImagingRetinotopyAxis1PhaseMap,
-    ImagingRetinotopyAxis1PowerMap,
-    ImagingRetinotopyAxis2PhaseMap,
-    ImagingRetinotopyAxis2PowerMap,
-    ImagingRetinotopyFocalDepthImage,
-    ImagingRetinotopySignMap,
-    ImagingRetinotopyVasculatureImage,
-)
-from ...hdmf_common.v1_1_3.hdmf_common_sparse import (
-    CSRMatrix,
-    CSRMatrixData,
-    CSRMatrixIndices,
-    CSRMatrixIndptr,
-)
-from ...hdmf_common.v1_1_3.hdmf_common_table import (
-    Container,
-    Data,
-    DynamicTable,
-    DynamicTableRegion,
-    ElementIdentifiers,
-    Index,
-    VectorData,
-    VectorIndex,
-)
-
-
 metamodel_version = "None"
 version = "2.2.5"
 
@@ -177,6 +24,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -191,33 +39,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -228,10 +49,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -277,6 +95,386 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
+if TYPE_CHECKING:
+    from ...core.v2_2_5.core_nwb_base import (
+        Image,
+        Images,
+        NWBContainer,
+        NWBData,
+        NWBDataInterface,
+        ProcessingModule,
+        TimeSeries,
+        TimeSeriesData,
+        TimeSeriesStartingTime,
+        TimeSeriesSync,
+    )
+    from ...core.v2_2_5.core_nwb_behavior import (
+        BehavioralEpochs,
+        BehavioralEvents,
+        BehavioralTimeSeries,
+        CompassDirection,
+        EyeTracking,
+        Position,
+        PupilTracking,
+        SpatialSeries,
+        SpatialSeriesData,
+    )
+    from ...core.v2_2_5.core_nwb_device import Device
+    from ...core.v2_2_5.core_nwb_ecephys import (
+        ClusterWaveforms,
+        Clustering,
+        ElectricalSeries,
+        ElectricalSeriesData,
+        ElectrodeGroup,
+        ElectrodeGroupPosition,
+        EventDetection,
+        EventWaveform,
+        FeatureExtraction,
+        FilteredEphys,
+        LFP,
+        SpikeEventSeries,
+        SpikeEventSeriesData,
+    )
+    from ...core.v2_2_5.core_nwb_epoch import TimeIntervals, TimeIntervalsTimeseries
+    from ...core.v2_2_5.core_nwb_file import (
+        ExtracellularEphysElectrodes,
+        GeneralExtracellularEphys,
+        GeneralIntracellularEphys,
+        GeneralSourceScript,
+        LabMetaData,
+        NWBFile,
+        NWBFileGeneral,
+        NWBFileIntervals,
+        NWBFileStimulus,
+        ScratchData,
+        Subject,
+    )
+    from ...core.v2_2_5.core_nwb_icephys import (
+        CurrentClampSeries,
+        CurrentClampSeriesData,
+        CurrentClampStimulusSeries,
+        CurrentClampStimulusSeriesData,
+        IZeroClampSeries,
+        IntracellularElectrode,
+        PatchClampSeries,
+        PatchClampSeriesData,
+        SweepTable,
+        VoltageClampSeries,
+        VoltageClampSeriesCapacitanceFast,
+        VoltageClampSeriesCapacitanceSlow,
+        VoltageClampSeriesData,
+        VoltageClampSeriesResistanceCompBandwidth,
+        VoltageClampSeriesResistanceCompCorrection,
+        VoltageClampSeriesResistanceCompPrediction,
+        VoltageClampSeriesWholeCellCapacitanceComp,
+        VoltageClampSeriesWholeCellSeriesResistanceComp,
+        VoltageClampStimulusSeries,
+        VoltageClampStimulusSeriesData,
+    )
+    from ...core.v2_2_5.core_nwb_image import (
+        GrayscaleImage,
+        ImageMaskSeries,
+        ImageSeries,
+        ImageSeriesData,
+        ImageSeriesExternalFile,
+        IndexSeries,
+        IndexSeriesData,
+        OpticalSeries,
+        OpticalSeriesData,
+        RGBAImage,
+        RGBImage,
+    )
+    from ...core.v2_2_5.core_nwb_misc import (
+        AbstractFeatureSeries,
+        AbstractFeatureSeriesData,
+        AnnotationSeries,
+        AnnotationSeriesData,
+        DecompositionSeries,
+        DecompositionSeriesBands,
+        DecompositionSeriesData,
+        IntervalSeries,
+        IntervalSeriesData,
+        Units,
+        UnitsSpikeTimes,
+        UnitsWaveformMean,
+        UnitsWaveformSd,
+    )
+    from ...core.v2_2_5.core_nwb_ogen import (
+        OptogeneticSeries,
+        OptogeneticSeriesData,
+        OptogeneticStimulusSite,
+    )
+    from ...core.v2_2_5.core_nwb_ophys import (
+        CorrectedImageStack,
+        DfOverF,
+        Fluorescence,
+        ImageSegmentation,
+        ImagingPlane,
+        ImagingPlaneGridSpacing,
+        ImagingPlaneManifold,
+        ImagingPlaneOriginCoords,
+        MotionCorrection,
+        OpticalChannel,
+        PlaneSegmentation,
+        PlaneSegmentationPixelMask,
+        PlaneSegmentationVoxelMask,
+        RoiResponseSeries,
+        RoiResponseSeriesData,
+        TwoPhotonSeries,
+    )
+    from ...core.v2_2_5.core_nwb_retinotopy import (
+        ImagingRetinotopy,
+        ImagingRetinotopyAxis1PhaseMap,
+        ImagingRetinotopyAxis1PowerMap,
+        ImagingRetinotopyAxis2PhaseMap,
+        ImagingRetinotopyAxis2PowerMap,
+        ImagingRetinotopyFocalDepthImage,
+        ImagingRetinotopySignMap,
+        ImagingRetinotopyVasculatureImage,
+    )
+    from ...hdmf_common.v1_1_3.hdmf_common_sparse import (
+        CSRMatrix,
+        CSRMatrixData,
+        CSRMatrixIndices,
+        CSRMatrixIndptr,
+    )
+    from ...hdmf_common.v1_1_3.hdmf_common_table import (
+        Container,
+        Data,
+        DynamicTable,
+        DynamicTableRegion,
+        ElementIdentifiers,
+        Index,
+        VectorData,
+        VectorIndex,
+    )
+
+
+_CLASS_MODULES = {
+    "AbstractFeatureSeries": "...core.v2_2_5.core_nwb_misc",
+    "AbstractFeatureSeriesData": "...core.v2_2_5.core_nwb_misc",
+    "AnnotationSeries": "...core.v2_2_5.core_nwb_misc",
+    "AnnotationSeriesData": "...core.v2_2_5.core_nwb_misc",
+    "BehavioralEpochs": "...core.v2_2_5.core_nwb_behavior",
+    "BehavioralEvents": "...core.v2_2_5.core_nwb_behavior",
+    "BehavioralTimeSeries": "...core.v2_2_5.core_nwb_behavior",
+    "CSRMatrix": "...hdmf_common.v1_1_3.hdmf_common_sparse",
+    "CSRMatrixData": "...hdmf_common.v1_1_3.hdmf_common_sparse",
+    "CSRMatrixIndices": "...hdmf_common.v1_1_3.hdmf_common_sparse",
+    "CSRMatrixIndptr": "...hdmf_common.v1_1_3.hdmf_common_sparse",
+    "ClusterWaveforms": "...core.v2_2_5.core_nwb_ecephys",
+    "Clustering": "...core.v2_2_5.core_nwb_ecephys",
+    "CompassDirection": "...core.v2_2_5.core_nwb_behavior",
+    "Container": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "CorrectedImageStack": "...core.v2_2_5.core_nwb_ophys",
+    "CurrentClampSeries": "...core.v2_2_5.core_nwb_icephys",
+    "CurrentClampSeriesData": "...core.v2_2_5.core_nwb_icephys",
+    "CurrentClampStimulusSeries": "...core.v2_2_5.core_nwb_icephys",
+    "CurrentClampStimulusSeriesData": "...core.v2_2_5.core_nwb_icephys",
+    "Data": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "DecompositionSeries": "...core.v2_2_5.core_nwb_misc",
+    "DecompositionSeriesBands": "...core.v2_2_5.core_nwb_misc",
+    "DecompositionSeriesData": "...core.v2_2_5.core_nwb_misc",
+    "Device": "...core.v2_2_5.core_nwb_device",
+    "DfOverF": "...core.v2_2_5.core_nwb_ophys",
+    "DynamicTable": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "DynamicTableRegion": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "ElectricalSeries": "...core.v2_2_5.core_nwb_ecephys",
+    "ElectricalSeriesData": "...core.v2_2_5.core_nwb_ecephys",
+    "ElectrodeGroup": "...core.v2_2_5.core_nwb_ecephys",
+    "ElectrodeGroupPosition": "...core.v2_2_5.core_nwb_ecephys",
+    "ElementIdentifiers": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "EventDetection": "...core.v2_2_5.core_nwb_ecephys",
+    "EventWaveform": "...core.v2_2_5.core_nwb_ecephys",
+    "ExtracellularEphysElectrodes": "...core.v2_2_5.core_nwb_file",
+    "EyeTracking": "...core.v2_2_5.core_nwb_behavior",
+    "FeatureExtraction": "...core.v2_2_5.core_nwb_ecephys",
+    "FilteredEphys": "...core.v2_2_5.core_nwb_ecephys",
+    "Fluorescence": "...core.v2_2_5.core_nwb_ophys",
+    "GeneralExtracellularEphys": "...core.v2_2_5.core_nwb_file",
+    "GeneralIntracellularEphys": "...core.v2_2_5.core_nwb_file",
+    "GeneralSourceScript": "...core.v2_2_5.core_nwb_file",
+    "GrayscaleImage": "...core.v2_2_5.core_nwb_image",
+    "IZeroClampSeries": "...core.v2_2_5.core_nwb_icephys",
+    "Image": "...core.v2_2_5.core_nwb_base",
+    "ImageMaskSeries": "...core.v2_2_5.core_nwb_image",
+    "ImageSegmentation": "...core.v2_2_5.core_nwb_ophys",
+    "ImageSeries": "...core.v2_2_5.core_nwb_image",
+    "ImageSeriesData": "...core.v2_2_5.core_nwb_image",
+    "ImageSeriesExternalFile": "...core.v2_2_5.core_nwb_image",
+    "Images": "...core.v2_2_5.core_nwb_base",
+    "ImagingPlane": "...core.v2_2_5.core_nwb_ophys",
+    "ImagingPlaneGridSpacing": "...core.v2_2_5.core_nwb_ophys",
+    "ImagingPlaneManifold": "...core.v2_2_5.core_nwb_ophys",
+    "ImagingPlaneOriginCoords": "...core.v2_2_5.core_nwb_ophys",
+    "ImagingRetinotopy": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopyAxis1PhaseMap": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopyAxis1PowerMap": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopyAxis2PhaseMap": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopyAxis2PowerMap": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopyFocalDepthImage": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopySignMap": "...core.v2_2_5.core_nwb_retinotopy",
+    "ImagingRetinotopyVasculatureImage": "...core.v2_2_5.core_nwb_retinotopy",
+    "Index": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "IndexSeries": "...core.v2_2_5.core_nwb_image",
+    "IndexSeriesData": "...core.v2_2_5.core_nwb_image",
+    "IntervalSeries": "...core.v2_2_5.core_nwb_misc",
+    "IntervalSeriesData": "...core.v2_2_5.core_nwb_misc",
+    "IntracellularElectrode": "...core.v2_2_5.core_nwb_icephys",
+    "LFP": "...core.v2_2_5.core_nwb_ecephys",
+    "LabMetaData": "...core.v2_2_5.core_nwb_file",
+    "MotionCorrection": "...core.v2_2_5.core_nwb_ophys",
+    "NWBContainer": "...core.v2_2_5.core_nwb_base",
+    "NWBData": "...core.v2_2_5.core_nwb_base",
+    "NWBDataInterface": "...core.v2_2_5.core_nwb_base",
+    "NWBFile": "...core.v2_2_5.core_nwb_file",
+    "NWBFileGeneral": "...core.v2_2_5.core_nwb_file",
+    "NWBFileIntervals": "...core.v2_2_5.core_nwb_file",
+    "NWBFileStimulus": "...core.v2_2_5.core_nwb_file",
+    "OpticalChannel": "...core.v2_2_5.core_nwb_ophys",
+    "OpticalSeries": "...core.v2_2_5.core_nwb_image",
+    "OpticalSeriesData": "...core.v2_2_5.core_nwb_image",
+    "OptogeneticSeries": "...core.v2_2_5.core_nwb_ogen",
+    "OptogeneticSeriesData": "...core.v2_2_5.core_nwb_ogen",
+    "OptogeneticStimulusSite": "...core.v2_2_5.core_nwb_ogen",
+    "PatchClampSeries": "...core.v2_2_5.core_nwb_icephys",
+    "PatchClampSeriesData": "...core.v2_2_5.core_nwb_icephys",
+    "PlaneSegmentation": "...core.v2_2_5.core_nwb_ophys",
+    "PlaneSegmentationPixelMask": "...core.v2_2_5.core_nwb_ophys",
+    "PlaneSegmentationVoxelMask": "...core.v2_2_5.core_nwb_ophys",
+    "Position": "...core.v2_2_5.core_nwb_behavior",
+    "ProcessingModule": "...core.v2_2_5.core_nwb_base",
+    "PupilTracking": "...core.v2_2_5.core_nwb_behavior",
+    "RGBAImage": "...core.v2_2_5.core_nwb_image",
+    "RGBImage": "...core.v2_2_5.core_nwb_image",
+    "RoiResponseSeries": "...core.v2_2_5.core_nwb_ophys",
+    "RoiResponseSeriesData": "...core.v2_2_5.core_nwb_ophys",
+    "ScratchData": "...core.v2_2_5.core_nwb_file",
+    "SpatialSeries": "...core.v2_2_5.core_nwb_behavior",
+    "SpatialSeriesData": "...core.v2_2_5.core_nwb_behavior",
+    "SpikeEventSeries": "...core.v2_2_5.core_nwb_ecephys",
+    "SpikeEventSeriesData": "...core.v2_2_5.core_nwb_ecephys",
+    "Subject": "...core.v2_2_5.core_nwb_file",
+    "SweepTable": "...core.v2_2_5.core_nwb_icephys",
+    "TimeIntervals": "...core.v2_2_5.core_nwb_epoch",
+    "TimeIntervalsTimeseries": "...core.v2_2_5.core_nwb_epoch",
+    "TimeSeries": "...core.v2_2_5.core_nwb_base",
+    "TimeSeriesData": "...core.v2_2_5.core_nwb_base",
+    "TimeSeriesStartingTime": "...core.v2_2_5.core_nwb_base",
+    "TimeSeriesSync": "...core.v2_2_5.core_nwb_base",
+    "TwoPhotonSeries": "...core.v2_2_5.core_nwb_ophys",
+    "Units": "...core.v2_2_5.core_nwb_misc",
+    "UnitsSpikeTimes": "...core.v2_2_5.core_nwb_misc",
+    "UnitsWaveformMean": "...core.v2_2_5.core_nwb_misc",
+    "UnitsWaveformSd": "...core.v2_2_5.core_nwb_misc",
+    "VectorData": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "VectorIndex": "...hdmf_common.v1_1_3.hdmf_common_table",
+    "VoltageClampSeries": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesCapacitanceFast": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesCapacitanceSlow": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesData": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesResistanceCompBandwidth": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesResistanceCompCorrection": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesResistanceCompPrediction": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesWholeCellCapacitanceComp": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampSeriesWholeCellSeriesResistanceComp": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampStimulusSeries": "...core.v2_2_5.core_nwb_icephys",
+    "VoltageClampStimulusSeriesData": "...core.v2_2_5.core_nwb_icephys",
+}
+"""Modules that define the classes in this namespace, imported when first used"""
+
+__all__ = list(_CLASS_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import classes from the module that defines them the first time they are used"""
+    if name not in _CLASS_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(import_module(_CLASS_MODULES[name], __package__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_CLASS_MODULES})
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -305,7 +503,3 @@ linkml_meta = LinkMLMeta(
         "name": "core",
     }
 )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
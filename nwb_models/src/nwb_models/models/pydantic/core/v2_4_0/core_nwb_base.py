@@ -6,6 +6,7 @@ from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
 from typing import (
+    Annotated,
     Any,
     ClassVar,
     Dict,
@@ -15,6 +16,7 @@ from typing import (
     Literal,
     Optional,
     Tuple,
+    Type,
     TypeVar,
     Union,
     overload,
@@ -22,7 +24,17 @@ from typing import (
 
 import numpy as np
 from numpydantic import NDArray, Shape
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 from ...hdmf_common.v1_5_0.hdmf_common_base import Container, Data
 from ...hdmf_common.v1_5_0.hdmf_common_table import DynamicTable, VectorData
@@ -41,6 +53,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -55,33 +68,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -92,10 +78,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -141,6 +124,82 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
 
 T = TypeVar("T", bound=NDArray)
@@ -152,6 +211,8 @@ class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
     """
 
     _index: Optional["VectorIndex"] = None
+    _version: int = 0
+    """Number of times values have been assigned in place, see :meth:`.__setitem__`"""
 
     # redefined in `VectorData`, but included here for testing and type checking
     value: Optional[T] = None
@@ -174,6 +235,8 @@ class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
             self._index[key] = value
         else:
             self.value[key] = value
+        # so tables know to forget dataframes made from the old values
+        self._version += 1
 
     def __getattr__(self, item: str) -> Any:
         """
@@ -196,6 +259,44 @@ class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
         else:
             return len(self.value)
 
+    @staticmethod
+    def _runs(
+        starts: np.ndarray, ends: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Group ``[start, end)`` windows into runs of contiguous or overlapping windows,
+        so each run can be read at once.
+
+        Returns:
+            ``order`` (the windows sorted by start), ``run_ids`` (the run of each window,
+            in that order), and the start and stop of each run
+        """
+        order = np.argsort(starts, kind="stable")
+        run_ends = np.maximum.accumulate(ends[order])
+        new_run = np.ones(len(order), dtype=bool)
+        new_run[1:] = starts[order][1:] > run_ends[:-1]
+        run_ids = np.cumsum(new_run) - 1
+        run_starts = starts[order][new_run]
+        run_stops = np.maximum.reduceat(ends[order], np.flatnonzero(new_run))
+        return order, run_ids, run_starts, run_stops
+
+    def lengths(self) -> np.ndarray:
+        """
+        Number of items in each row of a ragged column, see :meth:`.VectorIndexMixin.lengths`
+        """
+        if self._index is None:
+            raise ValueError("Not a ragged column, there is no index to reduce with")
+        return self._index.lengths()
+
+    def reduce(self, ufunc: Union[str, np.ufunc] = "sum", chunk_size: int = 1048576) -> np.ndarray:
+        """
+        Reduce each row of a ragged column to a single value,
+        see :meth:`.VectorIndexMixin.reduce`
+        """
+        if self._index is None:
+            raise ValueError("Not a ragged column, there is no index to reduce with")
+        return self._index.reduce(ufunc, chunk_size)
+
 
 class TimeSeriesReferenceVectorDataMixin(VectorDataMixin):
     """
@@ -251,12 +352,51 @@ class TimeSeriesReferenceVectorDataMixin(VectorDataMixin):
         elif isinstance(item, (slice, Iterable)):
             if isinstance(item, slice):
                 item = range(*item.indices(len(self.idx_start)))
-            return [self.timeseries[subitem][self._slice_helper(subitem)] for subitem in item]
+            return self._get_many(np.array(item, dtype=int))
         else:
             raise ValueError(
                 f"Dont know how to index with {item}, must be an int, slice, or iterable"
             )
 
+    def _get_many(self, rows: np.ndarray) -> list:
+        """
+        Get many rows without reading from each referenced timeseries once per row.
+
+        Rows are grouped by the timeseries they refer to, and within each timeseries
+        overlapping or adjacent windows are read at once, so eg. many sweeps from the same
+        recording are a single read. Each row is then a view into the data read for its run.
+        """
+        rows[rows < 0] += len(self.idx_start)
+        if len(rows) == 0:
+            return []
+        starts = np.asarray(self.idx_start[:])[rows]
+        ends = starts + np.asarray(self.count[:])[rows]
+
+        # group by timeseries object rather than by row, since tables reference
+        # the same timeseries many times
+        groups = {}
+        for i, row in enumerate(rows):
+            timeseries = self.timeseries[row]
+            if starts[i] < 0:
+                # invalid references, as in hdmf, are not part of any group
+                groups[("invalid", i)] = (timeseries, [i])
+            else:
+                groups.setdefault(id(timeseries), (timeseries, []))[1].append(i)
+
+        res = [None] * len(rows)
+        for timeseries, positions in groups.values():
+            positions = np.asarray(positions)
+            if starts[positions[0]] < 0:
+                res[positions[0]] = timeseries[slice(starts[positions[0]], ends[positions[0]])]
+                continue
+
+            order, run_ids, run_starts, run_stops = self._runs(starts[positions], ends[positions])
+            runs = [timeseries[start:stop] for start, stop in zip(run_starts, run_stops)]
+            for i, run_id in zip(positions[order], run_ids):
+                offset = run_starts[run_id]
+                res[i] = runs[run_id][starts[i] - offset : ends[i] - offset]
+        return res
+
     def __setitem__(self, key: Union[int, slice, Iterable], value: Any) -> None:
         if self._index is not None:
             raise NotImplementedError(
@@ -284,6 +424,40 @@ class TimeSeriesReferenceVectorDataMixin(VectorDataMixin):
             raise ValueError(
                 f"Dont know how to index with {key}, must be an int, slice, or iterable"
             )
+        self._version += 1
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
 
 
 linkml_meta = LinkMLMeta(
@@ -328,28 +502,30 @@ class TimeSeriesReferenceVectorData(TimeSeriesReferenceVectorDataMixin, VectorDa
     name: str = Field(
         "timeseries", json_schema_extra={"linkml_meta": {"ifabsent": "string(timeseries)"}}
     )
-    idx_start: NDArray[Shape["*"], int] = Field(
+    idx_start: CoerceValue[NDArray[Shape["*"], int]] = Field(
         ...,
         description="""Start index into the TimeSeries 'data' and 'timestamp' datasets of the referenced TimeSeries. The first dimension of those arrays is always time.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    count: NDArray[Shape["*"], int] = Field(
+    count: CoerceValue[NDArray[Shape["*"], int]] = Field(
         ...,
         description="""Number of data samples available in this time series, during this epoch""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    timeseries: NDArray[Shape["*"], TimeSeries] = Field(
+    timeseries: CoerceValue[NDArray[Shape["*"], TimeSeries]] = Field(
         ...,
         description="""The TimeSeries that this index applies to""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -369,10 +545,12 @@ class Image(NWBData):
     )
     description: Optional[str] = Field(None, description="""Description of the image.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* x, * y"], float | int],
-            NDArray[Shape["* x, * y, 3 r_g_b"], float | int],
-            NDArray[Shape["* x, * y, 4 r_g_b_a"], float | int],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* x, * y"], float | int],
+                NDArray[Shape["* x, * y, 3 r_g_b"], float | int],
+                NDArray[Shape["* x, * y, 4 r_g_b_a"], float | int],
+            ]
         ]
     ] = Field(None)
 
@@ -421,25 +599,25 @@ class TimeSeries(NWBDataInterface):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    data: TimeSeriesData = Field(
+    data: CastWithValue[CoerceValue[TimeSeriesData]] = Field(
         ...,
         description="""Data values. Data can be in 1-D, 2-D, 3-D, or 4-D. The first dimension should always represent time. This can also be used to store binary data (e.g., image frames). This can also be a link to data stored in an external file.""",
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -482,11 +660,13 @@ class TimeSeriesData(ConfiguredBaseModel):
         description="""Optionally describe the continuity of the data. Can be \"continuous\", \"instantaneous\", or \"step\". For example, a voltage trace would be \"continuous\", because samples are recorded from a continuous process. An array of lick times would be \"instantaneous\", because the data represents distinct moments in time. Times of image presentations would be \"step\" because the picture remains the same until the next timepoint. This field is optional, but is useful in providing information about the underlying data. It may inform the way this data is interpreted, the way it is visualized, and what analysis methods are applicable.""",
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* num_times"], Any],
-            NDArray[Shape["* num_times, * num_dim2"], Any],
-            NDArray[Shape["* num_times, * num_dim2, * num_dim3"], Any],
-            NDArray[Shape["* num_times, * num_dim2, * num_dim3, * num_dim4"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* num_times"], Any],
+                NDArray[Shape["* num_times, * num_dim2"], Any],
+                NDArray[Shape["* num_times, * num_dim2, * num_dim3"], Any],
+                NDArray[Shape["* num_times, * num_dim2, * num_dim3, * num_dim4"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -560,19 +740,6 @@ class Images(NWBDataInterface):
 
     name: str = Field("Images", json_schema_extra={"linkml_meta": {"ifabsent": "string(Images)"}})
     description: str = Field(..., description="""Description of this collection of images.""")
-    image: List[str] = Field(..., description="""Images stored in this collection.""")
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-NWBData.model_rebuild()
-TimeSeriesReferenceVectorData.model_rebuild()
-Image.model_rebuild()
-NWBContainer.model_rebuild()
-NWBDataInterface.model_rebuild()
-TimeSeries.model_rebuild()
-TimeSeriesData.model_rebuild()
-TimeSeriesStartingTime.model_rebuild()
-TimeSeriesSync.model_rebuild()
-ProcessingModule.model_rebuild()
-Images.model_rebuild()
+    image: CastWithValue[CoerceValue[List[str]]] = Field(
+        ..., description="""Images stored in this collection."""
+    )
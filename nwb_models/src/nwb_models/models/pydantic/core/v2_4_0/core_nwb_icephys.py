@@ -16,6 +16,8 @@ from pydantic import (
     Field,
     RootModel,
     ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
@@ -51,6 +53,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -65,33 +68,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -102,10 +78,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -151,8 +124,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
 
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 ModelType = TypeVar("ModelType", bound=Type[BaseModel])
 
 
@@ -203,7 +286,9 @@ class PatchClampSeries(TimeSeries):
     sweep_number: Optional[int] = Field(
         None, description="""Sweep number, allows to group different PatchClampSeries together."""
     )
-    data: PatchClampSeriesData = Field(..., description="""Recorded voltage or current.""")
+    data: CastWithValue[CoerceValue[PatchClampSeriesData]] = Field(
+        ..., description="""Recorded voltage or current."""
+    )
     gain: Optional[float] = Field(
         None,
         description="""Gain of the recording, in units Volt/Amp (v-clamp) or Volt/Volt (c-clamp).""",
@@ -227,21 +312,21 @@ class PatchClampSeries(TimeSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -283,7 +368,7 @@ class PatchClampSeriesData(ConfiguredBaseModel):
         ...,
         description="""Base unit of measurement for working with the data. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
     )
-    value: Optional[NDArray[Shape["* num_times"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], float | int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -303,7 +388,9 @@ class CurrentClampSeries(PatchClampSeries):
     capacitance_compensation: Optional[float] = Field(
         None, description="""Capacitance compensation, in farads."""
     )
-    data: CurrentClampSeriesData = Field(..., description="""Recorded voltage.""")
+    data: CastWithValue[CoerceValue[CurrentClampSeriesData]] = Field(
+        ..., description="""Recorded voltage."""
+    )
     stimulus_description: str = Field(
         ..., description="""Protocol/stimulus name for this patch-clamp dataset."""
     )
@@ -333,21 +420,21 @@ class CurrentClampSeries(PatchClampSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -390,7 +477,7 @@ class CurrentClampSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. which is fixed to 'volts'. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
         json_schema_extra={"linkml_meta": {"equals_string": "volts", "ifabsent": "string(volts)"}},
     )
-    value: Optional[NDArray[Shape["* num_times"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], float | int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -415,7 +502,9 @@ class IZeroClampSeries(CurrentClampSeries):
     capacitance_compensation: float = Field(
         ..., description="""Capacitance compensation, in farads, fixed to 0.0."""
     )
-    data: CurrentClampSeriesData = Field(..., description="""Recorded voltage.""")
+    data: CastWithValue[CoerceValue[CurrentClampSeriesData]] = Field(
+        ..., description="""Recorded voltage."""
+    )
     sweep_number: Optional[int] = Field(
         None, description="""Sweep number, allows to group different PatchClampSeries together."""
     )
@@ -442,21 +531,21 @@ class IZeroClampSeries(CurrentClampSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -479,7 +568,9 @@ class CurrentClampStimulusSeries(PatchClampSeries):
     )
 
     name: str = Field(...)
-    data: CurrentClampStimulusSeriesData = Field(..., description="""Stimulus current applied.""")
+    data: CastWithValue[CoerceValue[CurrentClampStimulusSeriesData]] = Field(
+        ..., description="""Stimulus current applied."""
+    )
     stimulus_description: str = Field(
         ..., description="""Protocol/stimulus name for this patch-clamp dataset."""
     )
@@ -509,21 +600,21 @@ class CurrentClampStimulusSeries(PatchClampSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -568,7 +659,7 @@ class CurrentClampStimulusSeriesData(ConfiguredBaseModel):
             "linkml_meta": {"equals_string": "amperes", "ifabsent": "string(amperes)"}
         },
     )
-    value: Optional[NDArray[Shape["* num_times"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], float | int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -583,28 +674,30 @@ class VoltageClampSeries(PatchClampSeries):
     )
 
     name: str = Field(...)
-    capacitance_fast: Optional[VoltageClampSeriesCapacitanceFast] = Field(
-        None, description="""Fast capacitance, in farads."""
-    )
-    capacitance_slow: Optional[VoltageClampSeriesCapacitanceSlow] = Field(
-        None, description="""Slow capacitance, in farads."""
-    )
-    data: VoltageClampSeriesData = Field(..., description="""Recorded current.""")
-    resistance_comp_bandwidth: Optional[VoltageClampSeriesResistanceCompBandwidth] = Field(
-        None, description="""Resistance compensation bandwidth, in hertz."""
-    )
-    resistance_comp_correction: Optional[VoltageClampSeriesResistanceCompCorrection] = Field(
-        None, description="""Resistance compensation correction, in percent."""
-    )
-    resistance_comp_prediction: Optional[VoltageClampSeriesResistanceCompPrediction] = Field(
-        None, description="""Resistance compensation prediction, in percent."""
-    )
-    whole_cell_capacitance_comp: Optional[VoltageClampSeriesWholeCellCapacitanceComp] = Field(
-        None, description="""Whole cell capacitance compensation, in farads."""
-    )
-    whole_cell_series_resistance_comp: Optional[VoltageClampSeriesWholeCellSeriesResistanceComp] = (
-        Field(None, description="""Whole cell series resistance compensation, in ohms.""")
-    )
+    capacitance_fast: Optional[CastWithValue[CoerceValue[VoltageClampSeriesCapacitanceFast]]] = (
+        Field(None, description="""Fast capacitance, in farads.""")
+    )
+    capacitance_slow: Optional[CastWithValue[CoerceValue[VoltageClampSeriesCapacitanceSlow]]] = (
+        Field(None, description="""Slow capacitance, in farads.""")
+    )
+    data: CastWithValue[CoerceValue[VoltageClampSeriesData]] = Field(
+        ..., description="""Recorded current."""
+    )
+    resistance_comp_bandwidth: Optional[
+        CastWithValue[CoerceValue[VoltageClampSeriesResistanceCompBandwidth]]
+    ] = Field(None, description="""Resistance compensation bandwidth, in hertz.""")
+    resistance_comp_correction: Optional[
+        CastWithValue[CoerceValue[VoltageClampSeriesResistanceCompCorrection]]
+    ] = Field(None, description="""Resistance compensation correction, in percent.""")
+    resistance_comp_prediction: Optional[
+        CastWithValue[CoerceValue[VoltageClampSeriesResistanceCompPrediction]]
+    ] = Field(None, description="""Resistance compensation prediction, in percent.""")
+    whole_cell_capacitance_comp: Optional[
+        CastWithValue[CoerceValue[VoltageClampSeriesWholeCellCapacitanceComp]]
+    ] = Field(None, description="""Whole cell capacitance compensation, in farads.""")
+    whole_cell_series_resistance_comp: Optional[
+        CastWithValue[CoerceValue[VoltageClampSeriesWholeCellSeriesResistanceComp]]
+    ] = Field(None, description="""Whole cell series resistance compensation, in ohms.""")
     stimulus_description: str = Field(
         ..., description="""Protocol/stimulus name for this patch-clamp dataset."""
     )
@@ -634,21 +727,21 @@ class VoltageClampSeries(PatchClampSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -745,7 +838,7 @@ class VoltageClampSeriesData(ConfiguredBaseModel):
             "linkml_meta": {"equals_string": "amperes", "ifabsent": "string(amperes)"}
         },
     )
-    value: Optional[NDArray[Shape["* num_times"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], float | int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -886,7 +979,9 @@ class VoltageClampStimulusSeries(PatchClampSeries):
     )
 
     name: str = Field(...)
-    data: VoltageClampStimulusSeriesData = Field(..., description="""Stimulus voltage applied.""")
+    data: CastWithValue[CoerceValue[VoltageClampStimulusSeriesData]] = Field(
+        ..., description="""Stimulus voltage applied."""
+    )
     stimulus_description: str = Field(
         ..., description="""Protocol/stimulus name for this patch-clamp dataset."""
     )
@@ -916,21 +1011,21 @@ class VoltageClampStimulusSeries(PatchClampSeries):
         description="""Human-readable comments about the TimeSeries. This second descriptive field can be used to store additional information, or descriptive information if the primary description field is populated with a computer-readable string.""",
         json_schema_extra={"linkml_meta": {"ifabsent": "string(no comments)"}},
     )
-    starting_time: Optional[TimeSeriesStartingTime] = Field(
+    starting_time: Optional[CastWithValue[CoerceValue[TimeSeriesStartingTime]]] = Field(
         None,
         description="""Timestamp of the first sample in seconds. When timestamps are uniformly spaced, the timestamp of the first sample can be specified and all subsequent ones calculated from the sampling rate attribute.""",
     )
-    timestamps: Optional[NDArray[Shape["* num_times"], float]] = Field(
+    timestamps: Optional[CoerceValue[NDArray[Shape["* num_times"], float]]] = Field(
         None,
         description="""Timestamps for samples stored in data, in seconds, relative to the common experiment master-clock stored in NWBFile.timestamps_reference_time.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control: Optional[NDArray[Shape["* num_times"], int]] = Field(
+    control: Optional[CoerceValue[NDArray[Shape["* num_times"], int]]] = Field(
         None,
         description="""Numerical labels that apply to each time point in data for the purpose of querying and slicing data by these values. If present, the length of this array should be the same size as the first dimension of data.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}},
     )
-    control_description: Optional[NDArray[Shape["* num_control_values"], str]] = Field(
+    control_description: Optional[CoerceValue[NDArray[Shape["* num_control_values"], str]]] = Field(
         None,
         description="""Description of each control value. Must be present if control is present. If present, control_description[0] should describe time points where control == 0.""",
         json_schema_extra={
@@ -973,7 +1068,7 @@ class VoltageClampStimulusSeriesData(ConfiguredBaseModel):
         description="""Base unit of measurement for working with the data. which is fixed to 'volts'. Actual stored values are not necessarily stored in these units. To access the data in these units, multiply 'data' by 'conversion'.""",
         json_schema_extra={"linkml_meta": {"equals_string": "volts", "ifabsent": "string(volts)"}},
     )
-    value: Optional[NDArray[Shape["* num_times"], float | int]] = Field(
+    value: Optional[CoerceValue[NDArray[Shape["* num_times"], float | int]]] = Field(
         None, json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_times"}]}}}
     )
 
@@ -1025,7 +1120,7 @@ class SweepTable(DynamicTable):
     )
 
     name: str = Field(...)
-    series: VectorData[NDArray[Any, PatchClampSeries]] = Field(
+    series: CastWithValue[CoerceValue[VectorData[NDArray[Any, PatchClampSeries]]]] = Field(
         ...,
         description="""The PatchClampSeries with the sweep number in that row.""",
         json_schema_extra={
@@ -1034,7 +1129,7 @@ class SweepTable(DynamicTable):
             }
         },
     )
-    series_index: Named[VectorIndex] = Field(
+    series_index: CastWithValue[CoerceValue[Named[VectorIndex]]] = Field(
         ...,
         description="""Index for series.""",
         json_schema_extra={
@@ -1046,7 +1141,7 @@ class SweepTable(DynamicTable):
             }
         },
     )
-    sweep_number: VectorData[NDArray[Any, int]] = Field(
+    sweep_number: CastWithValue[CoerceValue[VectorData[NDArray[Any, int]]]] = Field(
         ...,
         description="""Sweep number of the PatchClampSeries in that row.""",
         json_schema_extra={
@@ -1060,7 +1155,7 @@ class SweepTable(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1087,7 +1182,7 @@ class IntracellularElectrodesTable(DynamicTable):
             }
         },
     )
-    electrode: VectorData[NDArray[Any, IntracellularElectrode]] = Field(
+    electrode: CastWithValue[CoerceValue[VectorData[NDArray[Any, IntracellularElectrode]]]] = Field(
         ...,
         description="""Column for storing the reference to the intracellular electrode.""",
         json_schema_extra={
@@ -1100,7 +1195,7 @@ class IntracellularElectrodesTable(DynamicTable):
         ...,
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1127,7 +1222,7 @@ class IntracellularStimuliTable(DynamicTable):
             }
         },
     )
-    stimulus: Named[TimeSeriesReferenceVectorData] = Field(
+    stimulus: CastWithValue[CoerceValue[Named[TimeSeriesReferenceVectorData]]] = Field(
         ...,
         description="""Column storing the reference to the recorded stimulus for the recording (rows).""",
         json_schema_extra={
@@ -1143,7 +1238,7 @@ class IntracellularStimuliTable(DynamicTable):
         ...,
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1170,7 +1265,7 @@ class IntracellularResponsesTable(DynamicTable):
             }
         },
     )
-    response: Named[TimeSeriesReferenceVectorData] = Field(
+    response: CastWithValue[CoerceValue[Named[TimeSeriesReferenceVectorData]]] = Field(
         ...,
         description="""Column storing the reference to the recorded response for the recording (rows)""",
         json_schema_extra={
@@ -1186,7 +1281,7 @@ class IntracellularResponsesTable(DynamicTable):
         ...,
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1253,7 +1348,7 @@ class IntracellularRecordingsTable(AlignedDynamicTable):
         ...,
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1278,11 +1373,11 @@ class SimultaneousRecordingsTable(DynamicTable):
             }
         },
     )
-    recordings: SimultaneousRecordingsTableRecordings = Field(
+    recordings: CastWithValue[CoerceValue[SimultaneousRecordingsTableRecordings]] = Field(
         ...,
         description="""A reference to one or more rows in the IntracellularRecordingsTable table.""",
     )
-    recordings_index: Named[VectorIndex] = Field(
+    recordings_index: CastWithValue[CoerceValue[Named[VectorIndex]]] = Field(
         ...,
         description="""Index dataset for the recordings column.""",
         json_schema_extra={
@@ -1299,7 +1394,7 @@ class SimultaneousRecordingsTable(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1319,7 +1414,7 @@ class SimultaneousRecordingsTableRecordings(DynamicTableRegion):
             "linkml_meta": {"equals_string": "recordings", "ifabsent": "string(recordings)"}
         },
     )
-    table: IntracellularRecordingsTable = Field(
+    table: CastWithValue[CoerceValue[IntracellularRecordingsTable]] = Field(
         ...,
         description="""Reference to the IntracellularRecordingsTable table that this table region applies to. This specializes the attribute inherited from DynamicTableRegion to fix the type of table that can be referenced here.""",
     )
@@ -1327,11 +1422,13 @@ class SimultaneousRecordingsTableRecordings(DynamicTableRegion):
         ..., description="""Description of what this table region points to."""
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -1354,11 +1451,13 @@ class SequentialRecordingsTable(DynamicTable):
             }
         },
     )
-    simultaneous_recordings: SequentialRecordingsTableSimultaneousRecordings = Field(
+    simultaneous_recordings: CastWithValue[
+        CoerceValue[SequentialRecordingsTableSimultaneousRecordings]
+    ] = Field(
         ...,
         description="""A reference to one or more rows in the SimultaneousRecordingsTable table.""",
     )
-    simultaneous_recordings_index: Named[VectorIndex] = Field(
+    simultaneous_recordings_index: CastWithValue[CoerceValue[Named[VectorIndex]]] = Field(
         ...,
         description="""Index dataset for the simultaneous_recordings column.""",
         json_schema_extra={
@@ -1370,7 +1469,7 @@ class SequentialRecordingsTable(DynamicTable):
             }
         },
     )
-    stimulus_type: VectorData[NDArray[Any, str]] = Field(
+    stimulus_type: CastWithValue[CoerceValue[VectorData[NDArray[Any, str]]]] = Field(
         ...,
         description="""The type of stimulus used for the sequential recording.""",
         json_schema_extra={
@@ -1384,7 +1483,7 @@ class SequentialRecordingsTable(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1415,11 +1514,13 @@ class SequentialRecordingsTableSimultaneousRecordings(DynamicTableRegion):
         ..., description="""Description of what this table region points to."""
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -1439,11 +1540,11 @@ class RepetitionsTable(DynamicTable):
             "linkml_meta": {"equals_string": "repetitions", "ifabsent": "string(repetitions)"}
         },
     )
-    sequential_recordings: RepetitionsTableSequentialRecordings = Field(
+    sequential_recordings: CastWithValue[CoerceValue[RepetitionsTableSequentialRecordings]] = Field(
         ...,
         description="""A reference to one or more rows in the SequentialRecordingsTable table.""",
     )
-    sequential_recordings_index: Named[VectorIndex] = Field(
+    sequential_recordings_index: CastWithValue[CoerceValue[Named[VectorIndex]]] = Field(
         ...,
         description="""Index dataset for the sequential_recordings column.""",
         json_schema_extra={
@@ -1460,7 +1561,7 @@ class RepetitionsTable(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1491,11 +1592,13 @@ class RepetitionsTableSequentialRecordings(DynamicTableRegion):
         ..., description="""Description of what this table region points to."""
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -1518,10 +1621,10 @@ class ExperimentalConditionsTable(DynamicTable):
             }
         },
     )
-    repetitions: ExperimentalConditionsTableRepetitions = Field(
+    repetitions: CastWithValue[CoerceValue[ExperimentalConditionsTableRepetitions]] = Field(
         ..., description="""A reference to one or more rows in the RepetitionsTable table."""
     )
-    repetitions_index: Named[VectorIndex] = Field(
+    repetitions_index: CastWithValue[CoerceValue[Named[VectorIndex]]] = Field(
         ...,
         description="""Index dataset for the repetitions column.""",
         json_schema_extra={
@@ -1538,7 +1641,7 @@ class ExperimentalConditionsTable(DynamicTable):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
@@ -1566,46 +1669,12 @@ class ExperimentalConditionsTableRepetitions(DynamicTableRegion):
         ..., description="""Description of what this table region points to."""
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-PatchClampSeries.model_rebuild()
-PatchClampSeriesData.model_rebuild()
-CurrentClampSeries.model_rebuild()
-CurrentClampSeriesData.model_rebuild()
-IZeroClampSeries.model_rebuild()
-CurrentClampStimulusSeries.model_rebuild()
-CurrentClampStimulusSeriesData.model_rebuild()
-VoltageClampSeries.model_rebuild()
-VoltageClampSeriesCapacitanceFast.model_rebuild()
-VoltageClampSeriesCapacitanceSlow.model_rebuild()
-VoltageClampSeriesData.model_rebuild()
-VoltageClampSeriesResistanceCompBandwidth.model_rebuild()
-VoltageClampSeriesResistanceCompCorrection.model_rebuild()
-VoltageClampSeriesResistanceCompPrediction.model_rebuild()
-VoltageClampSeriesWholeCellCapacitanceComp.model_rebuild()
-VoltageClampSeriesWholeCellSeriesResistanceComp.model_rebuild()
-VoltageClampStimulusSeries.model_rebuild()
-VoltageClampStimulusSeriesData.model_rebuild()
-IntracellularElectrode.model_rebuild()
-SweepTable.model_rebuild()
-IntracellularElectrodesTable.model_rebuild()
-IntracellularStimuliTable.model_rebuild()
-IntracellularResponsesTable.model_rebuild()
-IntracellularRecordingsTable.model_rebuild()
-SimultaneousRecordingsTable.model_rebuild()
-SimultaneousRecordingsTableRecordings.model_rebuild()
-SequentialRecordingsTable.model_rebuild()
-SequentialRecordingsTableSimultaneousRecordings.model_rebuild()
-RepetitionsTable.model_rebuild()
-RepetitionsTableSequentialRecordings.model_rebuild()
-ExperimentalConditionsTable.model_rebuild()
-ExperimentalConditionsTableRepetitions.model_rebuild()
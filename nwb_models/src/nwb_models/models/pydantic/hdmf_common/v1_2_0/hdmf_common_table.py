@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
+from pathlib import Path
 from typing import (
+    Annotated,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Generic,
@@ -14,7 +18,9 @@ from typing import (
     List,
     Literal,
     Optional,
+    TYPE_CHECKING,
     Tuple,
+    Type,
     TypeVar,
     Union,
     overload,
@@ -31,13 +37,13 @@ from pydantic import (
     ValidationError,
     ValidationInfo,
     ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
 
 from ...hdmf_common.v1_2_0.hdmf_common_base import Container, Data
 
-
 metamodel_version = "None"
 version = "1.2.0"
 
@@ -51,6 +57,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -65,33 +72,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -102,10 +82,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -151,10 +128,123 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
 
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 T = TypeVar("T", bound=NDArray)
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
     """
@@ -162,6 +252,8 @@ class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
     """
 
     _index: Optional["VectorIndex"] = None
+    _version: int = 0
+    """Number of times values have been assigned in place, see :meth:`.__setitem__`"""
 
     # redefined in `VectorData`, but included here for testing and type checking
     value: Optional[T] = None
@@ -184,6 +276,8 @@ class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
             self._index[key] = value
         else:
             self.value[key] = value
+        # so tables know to forget dataframes made from the old values
+        self._version += 1
 
     def __getattr__(self, item: str) -> Any:
         """
@@ -206,6 +300,44 @@ class VectorDataMixin(ConfiguredBaseModel, Generic[T]):
         else:
             return len(self.value)
 
+    @staticmethod
+    def _runs(
+        starts: np.ndarray, ends: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Group ``[start, end)`` windows into runs of contiguous or overlapping windows,
+        so each run can be read at once.
+
+        Returns:
+            ``order`` (the windows sorted by start), ``run_ids`` (the run of each window,
+            in that order), and the start and stop of each run
+        """
+        order = np.argsort(starts, kind="stable")
+        run_ends = np.maximum.accumulate(ends[order])
+        new_run = np.ones(len(order), dtype=bool)
+        new_run[1:] = starts[order][1:] > run_ends[:-1]
+        run_ids = np.cumsum(new_run) - 1
+        run_starts = starts[order][new_run]
+        run_stops = np.maximum.reduceat(ends[order], np.flatnonzero(new_run))
+        return order, run_ids, run_starts, run_stops
+
+    def lengths(self) -> np.ndarray:
+        """
+        Number of items in each row of a ragged column, see :meth:`.VectorIndexMixin.lengths`
+        """
+        if self._index is None:
+            raise ValueError("Not a ragged column, there is no index to reduce with")
+        return self._index.lengths()
+
+    def reduce(self, ufunc: Union[str, np.ufunc] = "sum", chunk_size: int = 1048576) -> np.ndarray:
+        """
+        Reduce each row of a ragged column to a single value,
+        see :meth:`.VectorIndexMixin.reduce`
+        """
+        if self._index is None:
+            raise ValueError("Not a ragged column, there is no index to reduce with")
+        return self._index.reduce(ufunc, chunk_size)
+
 
 class VectorIndexMixin(ConfiguredBaseModel, Generic[T]):
     """
@@ -229,6 +361,119 @@ class VectorIndexMixin(ConfiguredBaseModel, Generic[T]):
         end = self.value[arg]
         return slice(start, end)
 
+    def _bounds(self, rows: NDArray[Shape["*"], int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Start and end offsets of many rows in :attr:`.target` ,
+        reading the span of the index that covers them at once
+        """
+        first, last = rows.min(), rows.max()
+        if first == 0:
+            edges = np.concatenate([[0], np.asarray(self.value[0 : last + 1])])
+        else:
+            edges = np.asarray(self.value[first - 1 : last + 1])
+        return edges[rows - first], edges[rows - first + 1]
+
+    def _slice_many(self, item: Union[slice, Iterable]) -> list:
+        """
+        Get many ragged rows from :attr:`.target` without reading each row separately.
+
+        The index offsets for all the rows are read at once, and rows whose data
+        are contiguous or overlapping in the target are coalesced into a single read,
+        so eg. a slice of consecutive rows is one read of the index and one of the target.
+        Each row is then a view into the data read for its run.
+        """
+        if isinstance(item, slice):
+            rows = np.arange(*item.indices(len(self.value)))
+        else:
+            rows = np.asarray(item)
+            if rows.dtype == bool:
+                rows = np.flatnonzero(rows)
+            rows = rows.astype(int).reshape(-1)
+            rows[rows < 0] += len(self.value)
+        if len(rows) == 0:
+            return []
+
+        starts, ends = self._bounds(rows)
+
+        # group rows into runs of contiguous/overlapping data, in order of their start
+        order, run_ids, run_starts, run_stops = VectorDataMixin._runs(starts, ends)
+        runs = [self.target.value[start:stop] for start, stop in zip(run_starts, run_stops)]
+
+        res = [None] * len(rows)
+        for i, run_id in zip(order, run_ids):
+            offset = run_starts[run_id]
+            res[i] = runs[run_id][starts[i] - offset : ends[i] - offset]
+        return res
+
+    def lengths(self) -> np.ndarray:
+        """
+        Number of items in each row of :attr:`.target` , eg. the spike count of each unit
+        """
+        return np.diff(np.asarray(self.value[:]), prepend=0)
+
+    def reduce(self, ufunc: Union[str, np.ufunc] = "sum", chunk_size: int = 1048576) -> np.ndarray:
+        """
+        Reduce each row of :attr:`.target` to a single value (along its first axis),
+        without splitting it into a list of rows.
+
+        Rows are reduced with :meth:`numpy.ufunc.reduceat` over the flat target data,
+        which is read ``chunk_size`` items at a time (or one whole row, if a row is longer),
+        so hdf5-backed data doesn't need to fit in memory.
+
+        Args:
+            ufunc (str, :class:`numpy.ufunc`): ``"sum"``, ``"mean"``, ``"min"``, ``"max"`` ,
+                ``"first"``, ``"last"``, or a binary ufunc like :data:`numpy.add`
+            chunk_size (int): Max number of items of the target to read at once
+
+        Returns:
+            :class:`numpy.ndarray` with one value per row. Empty rows are the ufunc's
+            identity (eg. ``0`` for a sum), or ``nan`` if it has none (eg. ``min`` ).
+        """
+        ufuncs = {"sum": np.add, "mean": np.add, "min": np.minimum, "max": np.maximum}
+        how = ufunc
+        if isinstance(how, str):
+            if how not in (*ufuncs.keys(), "first", "last"):
+                raise ValueError(f"Don't know how to reduce with {how}")
+            ufunc = ufuncs.get(how)
+
+        ends = np.asarray(self.value[:]).astype(int)
+        starts = np.concatenate([[0], ends[:-1]])
+        nonempty = ends > starts
+
+        results = []
+        row = 0
+        while row < len(ends):
+            # rows whose data fits in a chunk, or at least one row
+            stop = max(row + 1, int(np.searchsorted(ends, starts[row] + chunk_size, side="right")))
+            base = starts[row]
+            data = np.asarray(self.target.value[base : ends[stop - 1]])
+            local_starts = starts[row:stop][nonempty[row:stop]] - base
+            if how == "first":
+                results.append(data[local_starts])
+            elif how == "last":
+                results.append(data[ends[row:stop][nonempty[row:stop]] - base - 1])
+            elif len(local_starts) > 0:
+                results.append(ufunc.reduceat(data, local_starts, axis=0))
+            row = stop
+
+        values = np.concatenate(results) if results else np.asarray(self.target.value[0:0])
+        if how == "mean":
+            counts = (ends - starts)[nonempty]
+            values = values / counts.reshape(-1, *[1] * (values.ndim - 1))
+        if nonempty.all():
+            return values
+
+        # fill empty rows
+        identity = None if how in ("mean", "first", "last") else ufunc.identity
+        if identity is None:
+            identity = np.nan
+            dtype = np.result_type(values.dtype, float)
+        else:
+            dtype = values.dtype
+        out = np.full((len(ends), *values.shape[1:]), identity, dtype)
+        out[nonempty] = values
+        return out
+
     def __getitem__(self, item: Union[int, slice, Iterable]) -> Any:
         if self.target is None:
             return self.value[item]
@@ -236,9 +481,7 @@ class VectorIndexMixin(ConfiguredBaseModel, Generic[T]):
             if isinstance(item, (int, np.integer)):
                 return self.target.value[self._slice(item)]
             elif isinstance(item, (slice, Iterable)):
-                if isinstance(item, slice):
-                    item = range(*item.indices(len(self.value)))
-                return [self.target.value[self._slice(i)] for i in item]
+                return self._slice_many(item)
             else:  # pragma: no cover
                 raise AttributeError(f"Could not index with {item}")
 
@@ -348,6 +591,54 @@ class DynamicTableRegionMixin(ConfiguredBaseModel):
             else:  # pragma: no cover
                 raise ValueError(f"Dont know how to index with {item}, need an int or a slice")
 
+    def gather(self, item: Optional[Union[int, slice, Iterable]] = None) -> pd.DataFrame:
+        """
+        Get the table rows referenced by many rows of this region as a single dataframe,
+        rather than one dataframe per row like :meth:`.__getitem__` .
+
+        All the referenced rows are read from the table at once, and the result is indexed
+        by the row of this region that referenced them and their ``id`` in the table,
+        so eg. ``region.gather().loc[i]`` is the same as ``region[i]`` .
+
+        Args:
+            item (int, slice, Iterable): Rows of this region to get. If ``None`` (default),
+                all of them.
+
+        Returns:
+            :class:`pandas.DataFrame` with a :class:`pandas.MultiIndex` of
+            ``(<region name>, id)``
+        """
+        n_rows = len(self._index.value) if self._index else len(self.value)
+        if item is None:
+            rows = np.arange(n_rows)
+        elif isinstance(item, slice):
+            rows = np.arange(*item.indices(n_rows))
+        else:
+            rows = np.asarray(item)
+            if rows.dtype == bool:
+                rows = np.flatnonzero(rows)
+            rows = rows.astype(int).reshape(-1)
+            rows[rows < 0] += n_rows
+
+        if self._index:
+            # the index gets all the ragged rows of value at once
+            regions = self._index[rows] if len(rows) > 0 else []
+            source = np.repeat(rows, [len(region) for region in regions])
+            targets = (
+                np.concatenate([np.asarray(region) for region in regions])
+                if len(regions) > 0
+                else np.array([], dtype=int)
+            )
+        else:
+            source = rows
+            targets = np.asarray(self.table._gather(self.value, rows))
+
+        frame = self.table[targets.astype(int)]
+        frame.index = pd.MultiIndex.from_arrays(
+            [source, frame.index.to_numpy()], names=[self.name, "id"]
+        )
+        return frame
+
     def __setitem__(self, key: Union[int, str, slice], value: Any) -> None:
         # self.table[self.value[key]] = value
         raise NotImplementedError(
@@ -374,14 +665,107 @@ class DynamicTableMixin(ConfiguredBaseModel):
         "hdf5_path",
         "object_id",
     )
+    FRAME_SCHEMA_ATTRS: ClassVar[tuple[str]] = ("columns", "dtypes", "shape")
+    """Pandas attributes that are gotten from a dataframe with no rows, without reading any data"""
 
     # overridden by subclass but implemented here for testing and typechecking purposes :)
     colnames: List[str] = Field(default_factory=list)
     id: Optional[NDArray[Shape["* num_rows"], int]] = None
 
+    _columns_cache: Optional[Tuple[Tuple[str, ...], Dict[str, Any]]] = None
+    """``colnames`` and the columns they referred to when :attr:`._columns` was last made"""
+    _frame_cache: Optional[Tuple[tuple, pd.DataFrame]] = None
+    """
+    The whole table as a dataframe, made the first time :attr:`._frame` is used,
+    and the :meth:`._frame_key` it was made with
+    """
+    _id_index_cache: Optional[pd.Index] = None
+    """Index from ``id`` values to row positions, made the first time :attr:`._id_index` is used"""
+
     @property
     def _columns(self) -> Dict[str, Union[list, "NDArray", "VectorDataMixin"]]:
-        return {k: getattr(self, k) for i, k in enumerate(self.colnames)}
+        colnames = tuple(self.colnames)
+        try:
+            cache = self._columns_cache
+        except AttributeError:
+            # private attributes aren't initialized yet while validating
+            return {k: getattr(self, k) for k in colnames}
+
+        if cache is None or cache[0] != colnames:
+            cache = (colnames, {k: getattr(self, k) for k in colnames})
+            self._columns_cache = cache
+        return cache[1]
+
+    @property
+    def _frame(self) -> pd.DataFrame:
+        """
+        The whole table as a dataframe, for using pandas attributes on the table.
+
+        Kept until a column is assigned, a column is written to, or rows are added,
+        rather than reading the whole table again every time a pandas attribute is used.
+        """
+        key = self._frame_key()
+        if self._frame_cache is None or self._frame_cache[0] != key:
+            self._frame_cache = (key, self[:, :])
+        return self._frame_cache[1]
+
+    def _frame_key(self) -> tuple:
+        """
+        Number of rows and the number of in-place writes to each column
+        (see :attr:`.VectorDataMixin._version` ), which change when :attr:`._frame` is stale
+        """
+        return (
+            len(self.id),
+            *(getattr(col, "_version", 0) for col in self._columns.values()),
+        )
+
+    @property
+    def _id_index(self) -> pd.Index:
+        """
+        Hash index from ``id`` values to row positions.
+
+        Kept until the ``id`` column is assigned or changes length (eg. when rows are added)
+        """
+        if self._id_index_cache is None or len(self._id_index_cache) != len(self.id):
+            self._id_index_cache = pd.Index(np.asarray(self.id[:]))
+        return self._id_index_cache
+
+    def loc_ids(
+        self, ids: Union[int, Iterable[int]], columns: Optional[Union[str, List[str]]] = None
+    ) -> pd.DataFrame:
+        """
+        Get rows by their ``id`` rather than their position, in the order of ``ids`` .
+
+        Ids are looked up in a hash index that is made the first time this is called,
+        rather than searching the ``id`` column for each of them.
+
+        Args:
+            ids (int, list[int]): ids of the rows to get
+            columns (str, list[str]): Columns to get. If ``None`` (default), all of them.
+
+        Returns:
+            :class:`pandas.DataFrame` of the rows. If ids in the table aren't unique,
+            all the rows with each id.
+
+        Raises:
+            KeyError: if any of the ``ids`` aren't in the table
+        """
+        ids = np.atleast_1d(np.asarray(ids))
+        index = self._id_index
+        if index.is_unique:
+            positions = index.get_indexer(ids)
+            missing = ids[positions < 0]
+        else:
+            positions, missing = index.get_indexer_non_unique(ids)
+            missing = ids[missing]
+        if len(missing) > 0:
+            raise KeyError(f"ids not in table: {missing.tolist()}")
+
+        if columns is None:
+            return self[positions]
+        elif isinstance(columns, str):
+            columns = [columns]
+        return self[positions, list(columns)]
 
     @overload
     def __getitem__(self, item: str) -> Union[list, "NDArray", "VectorDataMixin"]: ...
@@ -429,9 +813,11 @@ class DynamicTableMixin(ConfiguredBaseModel):
         """
         if isinstance(item, str):
             return self._columns[item]
+        if isinstance(item, np.ndarray) and item.dtype == bool:
+            item = np.flatnonzero(item)
         if isinstance(item, (int, slice, np.integer, np.ndarray)):
             data = self._slice_range(item)
-            index = self.id[item]
+            index = self._gather(self.id, item) if isinstance(item, np.ndarray) else self.id[item]
         elif isinstance(item, tuple):
             if len(item) != 2:
                 raise ValueError(
@@ -448,8 +834,13 @@ class DynamicTableMixin(ConfiguredBaseModel):
                 # single scalar value
                 return self._columns[cols][rows]
 
+            if isinstance(rows, (list, np.ndarray)):
+                rows = np.asarray(rows)
+                rows = np.flatnonzero(rows) if rows.dtype == bool else rows.astype(int)
+                index = self._gather(self.id, rows)
+            else:
+                index = self.id[rows]
             data = self._slice_range(rows, cols)
-            index = self.id[rows]
         else:
             raise ValueError(f"Unsure how to get item with key {item}")
 
@@ -466,13 +857,13 @@ class DynamicTableMixin(ConfiguredBaseModel):
             cols = self.colnames
         elif isinstance(cols, str):
             cols = [cols]
+        columns = self._columns
         data = {}
         for k in cols:
             if isinstance(rows, np.ndarray):
-                # help wanted - this is probably cr*zy slow
-                val = [self._columns[k][i] for i in rows]
+                val = self._gather(columns[k], rows)
             else:
-                val = self._columns[k][rows]
+                val = columns[k][rows]
 
             # scalars need to be wrapped in series for pandas
             # do this by the iterability of the rows index not the value because
@@ -484,6 +875,327 @@ class DynamicTableMixin(ConfiguredBaseModel):
             data[k] = val
         return data
 
+    @staticmethod
+    def _gather(column: Union[list, "NDArray", "VectorDataMixin"], rows: np.ndarray) -> Any:
+        """
+        Get many rows from a column at once.
+
+        Rows are read as a single sorted, deduplicated selection
+        (as required for fancy indexing of hdf5 datasets)
+        and then put back in the requested order.
+        """
+        if isinstance(column, list):
+            return [column[i] for i in rows]
+        if len(rows) == 0:
+            return column[0:0]
+
+        unique, inverse = np.unique(rows, return_inverse=True)
+        got = column[unique]
+        if isinstance(got, np.ndarray):
+            return got[inverse]
+        else:
+            return [got[i] for i in inverse]
+
+    def where(
+        self,
+        predicate: Callable[[Any], Any],
+        columns: Optional[Union[str, List[str]]] = None,
+        chunk_size: int = 65536,
+    ) -> pd.DataFrame:
+        """
+        Get the rows of the table that match a predicate,
+        without reading the whole table to filter it.
+
+        The predicate is called with chunks of rows at a time, and gets columns as
+        attributes (or items) of its argument, so it only reads the columns it uses,
+        and only ``chunk_size`` rows of them at once. Then only the matching rows
+        of only the requested ``columns`` are read.
+
+        Examples:
+
+            .. code-block:: python
+
+                units.where(lambda c: c.quality == "good", columns=["spike_times"])
+                units.where(lambda c: (c["firing_rate"] > 1) & (c.id < 100))
+
+        Ragged columns are given to the predicate as a list of arrays, one per row.
+
+        Args:
+            predicate (Callable): Given chunks of the columns, return a boolean array
+                with one value per row in the chunk
+            columns (str, list[str]): Columns to get for the matching rows.
+                If ``None`` (default), all of them.
+            chunk_size (int): Number of rows to give to the predicate at once
+
+        Returns:
+            :class:`pandas.DataFrame` of the matching rows
+        """
+        table = self
+
+        class _Chunk:
+            def __init__(self, rows: slice):
+                self._rows = rows
+                self._cache = {}
+
+            def __getitem__(self, name: str) -> Any:
+                if name not in self._cache:
+                    if name == "id":
+                        val = np.asarray(table.id[self._rows])
+                    elif name not in table.colnames:
+                        raise KeyError(f"No column named {name} in table {table.name}")
+                    else:
+                        column = table._columns[name]
+                        val = column[self._rows]
+                        if isinstance(column, list) or not isinstance(val, list):
+                            # ragged columns stay as a list of arrays, one per row
+                            val = np.asarray(val)
+                    self._cache[name] = val
+                return self._cache[name]
+
+            def __getattr__(self, name: str) -> Any:
+                if name.startswith("_"):
+                    raise AttributeError(name)
+                try:
+                    return self[name]
+                except KeyError as e:
+                    raise AttributeError(name) from e
+
+        n_rows = len(self)
+        matches = []
+        for start in range(0, n_rows, chunk_size):
+            stop = min(start + chunk_size, n_rows)
+            mask = np.asarray(predicate(_Chunk(slice(start, stop))), dtype=bool)
+            if mask.shape != (stop - start,):
+                raise ValueError(
+                    f"Predicate should return one bool per row, got shape {mask.shape} "
+                    f"for {stop - start} rows"
+                )
+            matches.append(np.flatnonzero(mask) + start)
+        rows = np.concatenate(matches) if matches else np.array([], dtype=int)
+
+        if columns is None:
+            columns = self.colnames
+        elif isinstance(columns, str):
+            columns = [columns]
+        return self[rows, list(columns)]
+
+    def iter_batches(
+        self,
+        batch_size: int = 65536,
+        columns: Optional[Union[str, List[str]]] = None,
+        as_frame: bool = True,
+        prefetch: bool = True,
+    ) -> Iterable[Union[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Iterate over batches of rows, to go through tables that are too big to read at once.
+
+        ``batch_size`` is rounded to a multiple of the chunk size of any hdf5-backed columns,
+        so each batch reads whole chunks and no chunk is read twice. While a batch is
+        being used, the next one is read in a background thread.
+        The rows referenced by ``DynamicTableRegion`` columns are read from their table
+        once per batch (see :meth:`.DynamicTableRegionMixin.gather` ).
+
+        Args:
+            batch_size (int): Number of rows in each batch (before rounding to chunks)
+            columns (str, list[str]): Columns to get. If ``None`` (default), all of them.
+            as_frame (bool): If ``True`` (default), yield :class:`pandas.DataFrame` s,
+                otherwise yield dicts of column values, with the row ids as ``id``
+            prefetch (bool): If ``True`` (default), read the next batch
+                while the current one is being used.
+
+        Yields:
+            :class:`pandas.DataFrame` or ``dict`` of each batch, in order
+        """
+        if columns is None:
+            columns = list(self.colnames)
+        elif isinstance(columns, str):
+            columns = [columns]
+        else:
+            columns = list(columns)
+
+        chunk_rows = self._chunk_rows(columns)
+        if chunk_rows:
+            batch_size = max(1, round(batch_size / chunk_rows)) * chunk_rows
+        n_rows = len(self)
+
+        regions = [k for k in columns if isinstance(self._columns[k], DynamicTableRegionMixin)]
+
+        def _read(start: int) -> Union[pd.DataFrame, Dict[str, Any]]:
+            rows = slice(start, min(start + batch_size, n_rows))
+            data = self._slice_range(rows, [k for k in columns if k not in regions])
+            for k in regions:
+                data[k] = self._gather_regions(self._columns[k], rows)
+            data = {k: data[k] for k in columns}
+            if as_frame:
+                return pd.DataFrame(data, index=pd.Index(data=self.id[rows], name="id"))
+            return {"id": self.id[rows], **data}
+
+        starts = range(0, n_rows, batch_size)
+        if not prefetch:
+            for start in starts:
+                yield _read(start)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = None
+            for start in starts:
+                next_future = executor.submit(_read, start)
+                if future is not None:
+                    yield future.result()
+                future = next_future
+            if future is not None:
+                yield future.result()
+
+    @staticmethod
+    def _gather_regions(column: "DynamicTableRegionMixin", rows: slice) -> List[pd.DataFrame]:
+        """
+        The referenced table rows for a range of rows of a region column, one dataframe
+        per row like indexing the column, but read from the table all at once.
+        """
+        frame = column.gather(rows)
+        groups = dict(iter(frame.groupby(level=0)))
+        empty = frame.iloc[0:0].droplevel(0)
+        return [
+            groups[i].droplevel(0) if i in groups else empty for i in range(rows.start, rows.stop)
+        ]
+
+    def _chunk_rows(self, columns: List[str]) -> Optional[int]:
+        """
+        The largest number of rows in a chunk of the id or any of the given columns
+        that are stored in chunked hdf5 datasets, if any are.
+
+        Ragged columns are chunked by their data rather than their rows, so they are skipped.
+        """
+        chunk_rows = None
+        for col in [self.id, *[self._columns[k] for k in columns]]:
+            if isinstance(col, list) or getattr(col, "_index", None) is not None:
+                continue
+            value = col.value if isinstance(col, BaseModel) else col
+            chunks = getattr(value, "chunks", None)
+            if chunks:
+                chunk_rows = max(chunk_rows or 0, chunks[0])
+        return chunk_rows
+
+    def to_arrow(self, columns: Optional[Union[str, List[str]]] = None) -> "pa.Table":
+        """
+        Convert the table to a :class:`pyarrow.Table` (requires ``pyarrow``)
+
+        Unlike converting to pandas, columns aren't boxed as python objects row by row:
+
+        - Fixed-width columns wrap their arrays without copying them
+          (for in-memory arrays, hdf5 arrays are read once).
+        - Ragged columns become :class:`pyarrow.ListArray` s, using their index
+          as the list offsets.
+        - ``DynamicTableRegion`` columns become the integer rows they refer to in their table,
+          and the name of that table is in the field metadata as ``table`` .
+          Convert the referenced table separately (eg. ``table[column].table.to_arrow()`` ),
+          or see :meth:`.to_parquet` .
+
+        Args:
+            columns (str, list[str]): Columns to convert. If ``None`` (default), all of them.
+                ``id`` is always included.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "pyarrow is required to convert tables to arrow, install nwb-models[arrow]"
+            ) from e
+
+        if columns is None:
+            columns = self.colnames
+        elif isinstance(columns, str):
+            columns = [columns]
+
+        ids = self._arrow_array(self.id)
+        fields = [pa.field("id", ids.type)]
+        arrays = [ids]
+        for name in columns:
+            column = self._columns[name]
+            array = self._arrow_column(column)
+            metadata = None
+            if isinstance(column, DynamicTableRegionMixin):
+                metadata = {"table": str(column.table.name)}
+            fields.append(pa.field(name, array.type, metadata=metadata))
+            arrays.append(array)
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    def to_parquet(
+        self, path: Union[str, "Path"], columns: Optional[Union[str, List[str]]] = None, **kwargs
+    ) -> List["Path"]:
+        """
+        Write the table to a parquet file (requires ``pyarrow``), see :meth:`.to_arrow`
+
+        The tables referred to by any ``DynamicTableRegion`` columns are written next to it,
+        named like ``{stem}.{column}{suffix}`` , so eg. writing ``units.parquet`` with
+        an ``electrodes`` column also writes ``units.electrodes.parquet`` .
+
+        Args:
+            path (:class:`pathlib.Path`): Parquet file to write
+            columns (str, list[str]): Columns to write. If ``None`` (default), all of them.
+            **kwargs: passed to :func:`pyarrow.parquet.write_table`
+
+        Returns:
+            list[:class:`pathlib.Path`]: The written files, this table first
+        """
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        pq.write_table(self.to_arrow(columns), path, **kwargs)
+        written = [path]
+
+        if columns is None:
+            columns = self.colnames
+        elif isinstance(columns, str):
+            columns = [columns]
+        for name in columns:
+            column = self._columns[name]
+            if isinstance(column, DynamicTableRegionMixin):
+                region_path = path.with_name(f"{path.stem}.{name}{path.suffix}")
+                pq.write_table(column.table.to_arrow(), region_path, **kwargs)
+                written.append(region_path)
+        return written
+
+    @classmethod
+    def _arrow_column(cls, column: Union[list, "NDArray", "VectorDataMixin"]) -> "pa.Array":
+        """
+        Convert a column to an arrow array, ragged columns to a list array
+        """
+        import pyarrow as pa
+
+        if isinstance(column, list):
+            return pa.array(column)
+        value = column.value if isinstance(column, BaseModel) else column
+        values = cls._arrow_array(value)
+
+        index = getattr(column, "_index", None)
+        if index is None:
+            return values
+
+        offsets = np.concatenate([[0], np.asarray(index.value[:])])
+        if offsets[-1] < np.iinfo(np.int32).max:
+            return pa.ListArray.from_arrays(pa.array(offsets.astype(np.int32)), values)
+        else:
+            return pa.LargeListArray.from_arrays(pa.array(offsets.astype(np.int64)), values)
+
+    @classmethod
+    def _arrow_array(cls, value: "NDArray") -> "pa.Array":
+        """
+        Convert an array to an arrow array, with the trailing dimensions of
+        multidimensional arrays as fixed-size lists.
+
+        In-memory numeric arrays are wrapped without copying, hdf5 arrays are read once.
+        """
+        import pyarrow as pa
+
+        value = value if isinstance(value, np.ndarray) else np.asarray(value[:])
+        if value.ndim <= 1:
+            return pa.array(value)
+        value = np.ascontiguousarray(value)
+        return pa.FixedSizeListArray.from_arrays(
+            cls._arrow_array(value.reshape(-1, *value.shape[2:])), value.shape[1]
+        )
+
     def __setitem__(self, key: str, value: Any) -> None:
         raise NotImplementedError("TODO")  # pragma: no cover
 
@@ -494,6 +1206,9 @@ class DynamicTableMixin(ConfiguredBaseModel):
         # don't use this while building the model
         if not getattr(self, "__pydantic_complete__", False):  # pragma: no cover
             return super().__setattr__(key, value)
+        # or for private attributes, which aren't columns
+        if key.startswith("_"):
+            return super().__setattr__(key, value)
 
         if key not in self.model_fields_set and not key.endswith("_index"):
             self.colnames.append(key)
@@ -503,6 +1218,10 @@ class DynamicTableMixin(ConfiguredBaseModel):
         if key not in self.model_fields and key not in self.__pydantic_extra__:
             self.__pydantic_extra__[key] = value
 
+        self._columns_cache = None
+        self._frame_cache = None
+        if key == "id":
+            self._id_index_cache = None
         return super().__setattr__(key, value)
 
     def __getattr__(self, item: str) -> Any:
@@ -510,8 +1229,15 @@ class DynamicTableMixin(ConfiguredBaseModel):
         try:
             return BaseModel.__getattr__(self, item)
         except AttributeError as e:
+            # don't read the whole table for things a dataframe wouldn't have either
+            # (typos, ``hasattr`` checks, etc.)
+            if not hasattr(pd.DataFrame, item):
+                raise e
+            if item in self.FRAME_SCHEMA_ATTRS:
+                empty = self[0:0, :]
+                return (len(self), empty.shape[1]) if item == "shape" else getattr(empty, item)
             try:
-                return getattr(self[:, :], item)
+                return getattr(self._frame, item)
             except AttributeError:
                 raise e from None
 
@@ -724,10 +1450,33 @@ class AlignedDynamicTableMixin(ConfiguredBaseModel):
     categories: List[str] = Field(default_factory=list)
     id: Optional[NDArray[Shape["* num_rows"], int]] = None
 
+    _frame_cache: Optional[Tuple[tuple, pd.DataFrame]] = None
+    """
+    All the tables as a dataframe, made the first time :attr:`._frame` is used,
+    and the :meth:`._frame_key` it was made with
+    """
+
     @property
     def _categories(self) -> Dict[str, "DynamicTableMixin"]:
         return {k: getattr(self, k) for i, k in enumerate(self.categories)}
 
+    @property
+    def _frame(self) -> pd.DataFrame:
+        """
+        All the tables as a dataframe, for using pandas attributes on the table.
+
+        Kept until a category is assigned or any of the tables changes
+        (see :attr:`.DynamicTableMixin._frame` ).
+        """
+        key = self._frame_key()
+        if self._frame_cache is None or self._frame_cache[0] != key:
+            self._frame_cache = (key, self[:])
+        return self._frame_cache[1]
+
+    def _frame_key(self) -> tuple:
+        """Number of rows and the :meth:`.DynamicTableMixin._frame_key` of each table"""
+        return (len(self.id), *(table._frame_key() for table in self._categories.values()))
+
     def __getitem__(
         self, item: Union[int, str, slice, NDArray[Shape["*"], int], Tuple[Union[int, slice], str]]
     ) -> pd.DataFrame:
@@ -785,11 +1534,24 @@ class AlignedDynamicTableMixin(ConfiguredBaseModel):
         try:
             return BaseModel.__getattr__(self, item)
         except AttributeError as e:
+            if not hasattr(pd.DataFrame, item):
+                raise e
+            if item in DynamicTableMixin.FRAME_SCHEMA_ATTRS:
+                empty = self[0:0]
+                return (len(self), empty.shape[1]) if item == "shape" else getattr(empty, item)
             try:
-                return getattr(self[:], item)
+                return getattr(self._frame, item)
             except AttributeError:
                 raise e from None
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Forget the cached dataframe when a category is assigned
+        """
+        if not key.startswith("_") and getattr(self, "__pydantic_complete__", False):
+            self._frame_cache = None
+        return super().__setattr__(key, value)
+
     def __len__(self) -> int:
         """
         Use the id column to determine length.
@@ -919,7 +1681,7 @@ class VectorData(VectorDataMixin):
 
     name: str = Field(...)
     description: str = Field(..., description="""Description of what these vectors represent.""")
-    value: Optional[T] = Field(None)
+    value: Optional[CoerceValue[T]] = Field(None)
 
 
 class VectorIndex(VectorIndexMixin):
@@ -932,16 +1694,18 @@ class VectorIndex(VectorIndexMixin):
     )
 
     name: str = Field(...)
-    target: Optional[VectorData] = Field(
+    target: Optional[CastWithValue[CoerceValue[VectorData]]] = Field(
         None, description="""Reference to the target dataset that this index applies to."""
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -958,7 +1722,7 @@ class ElementIdentifiers(ElementIdentifiersMixin, Data):
     name: str = Field(
         "element_id", json_schema_extra={"linkml_meta": {"ifabsent": "string(element_id)"}}
     )
-    value: Optional[T] = Field(
+    value: Optional[CoerceValue[T]] = Field(
         None,
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_elements"}]}}},
     )
@@ -981,11 +1745,13 @@ class DynamicTableRegion(DynamicTableRegionMixin, VectorData):
         ..., description="""Reference to the DynamicTable object that this region applies to."""
     )
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -1000,18 +1766,20 @@ class VocabData(VectorData):
     )
 
     name: str = Field(...)
-    vocabulary: NDArray[Shape["* null"], str] = Field(
+    vocabulary: CoerceValue[NDArray[Shape["* null"], str]] = Field(
         ...,
         description="""The available items in the controlled vocabulary.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "null"}]}}},
     )
     description: str = Field(..., description="""Description of what these vectors represent.""")
     value: Optional[
-        Union[
-            NDArray[Shape["* dim0"], Any],
-            NDArray[Shape["* dim0, * dim1"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2"], Any],
-            NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+        CoerceValue[
+            Union[
+                NDArray[Shape["* dim0"], Any],
+                NDArray[Shape["* dim0, * dim1"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2"], Any],
+                NDArray[Shape["* dim0, * dim1, * dim2, * dim3"], Any],
+            ]
         ]
     ] = Field(None)
 
@@ -1031,18 +1799,8 @@ class DynamicTable(DynamicTableMixin):
         description="""The names of the columns in this table. This should be used to specify an order to the columns.""",
     )
     description: str = Field(..., description="""Description of what is in this dynamic table.""")
-    id: ElementIdentifiers = Field(
+    id: CastWithValue[CoerceValue[ElementIdentifiers]] = Field(
         ...,
         description="""Array of unique identifiers for the rows of this dynamic table.""",
         json_schema_extra={"linkml_meta": {"array": {"dimensions": [{"alias": "num_rows"}]}}},
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-VectorData.model_rebuild()
-VectorIndex.model_rebuild()
-ElementIdentifiers.model_rebuild()
-DynamicTableRegion.model_rebuild()
-VocabData.model_rebuild()
-DynamicTable.model_rebuild()
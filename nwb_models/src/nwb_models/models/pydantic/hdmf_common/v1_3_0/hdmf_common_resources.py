@@ -5,11 +5,21 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Optional, Type, TypeVar, Union
 
 import numpy as np
 from numpydantic import NDArray, Shape
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
 
 from ...hdmf_common.v1_3_0.hdmf_common_base import Container, Data
 
@@ -27,6 +37,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -41,33 +52,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -78,10 +62,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -127,7 +108,118 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
 NUMPYDANTIC_VERSION = "1.2.1"
+
+
+ValueType = TypeVar("ValueType")
+
+
+def _coerce_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by using the value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler(v.value)
+        except AttributeError:
+            try:
+                return handler(v["value"])
+            except (IndexError, KeyError, TypeError):
+                raise e1 from None
+
+
+def _cast_with_value(v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    """Try to rescue instantiation by casting into the model's value field"""
+    try:
+        return handler(v)
+    except Exception as e1:
+        try:
+            return handler({"value": v})
+        except Exception:
+            raise e1 from None
+
+
+CoerceValue = Annotated[ValueType, WrapValidator(_coerce_value)]
+
+CastWithValue = Annotated[ValueType, WrapValidator(_cast_with_value)]
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -179,7 +271,7 @@ class ExternalResourcesKeys(Data):
         "keys",
         json_schema_extra={"linkml_meta": {"equals_string": "keys", "ifabsent": "string(keys)"}},
     )
-    key_name: NDArray[Shape["*"], str] = Field(
+    key_name: CoerceValue[NDArray[Shape["*"], str]] = Field(
         ...,
         description="""The user term that maps to one or more resources in the 'resources' table.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
@@ -199,22 +291,22 @@ class ExternalResourcesResources(Data):
             "linkml_meta": {"equals_string": "resources", "ifabsent": "string(resources)"}
         },
     )
-    keytable_idx: NDArray[Shape["*"], int] = Field(
+    keytable_idx: CoerceValue[NDArray[Shape["*"], int]] = Field(
         ...,
         description="""The index to the key in the 'keys' table.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    resource_name: NDArray[Shape["*"], str] = Field(
+    resource_name: CoerceValue[NDArray[Shape["*"], str]] = Field(
         ...,
         description="""The name of the online resource (e.g., website, database) that has the entity.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    resource_id: NDArray[Shape["*"], str] = Field(
+    resource_id: CoerceValue[NDArray[Shape["*"], str]] = Field(
         ...,
         description="""The unique identifier for the resource entity at the resource.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    uri: NDArray[Shape["*"], str] = Field(
+    uri: CoerceValue[NDArray[Shape["*"], str]] = Field(
         ...,
         description="""The URI for the resource entity this reference applies to. This can be an empty string.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
@@ -234,12 +326,12 @@ class ExternalResourcesObjects(Data):
             "linkml_meta": {"equals_string": "objects", "ifabsent": "string(objects)"}
         },
     )
-    object_id: NDArray[Shape["*"], str] = Field(
+    object_id: CoerceValue[NDArray[Shape["*"], str]] = Field(
         ...,
         description="""The UUID for the object.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    field: NDArray[Shape["*"], str] = Field(
+    field: CoerceValue[NDArray[Shape["*"], str]] = Field(
         ...,
         description="""The field of the object. This can be an empty string if the object is a dataset and the field is the dataset values.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
@@ -259,22 +351,13 @@ class ExternalResourcesObjectKeys(Data):
             "linkml_meta": {"equals_string": "object_keys", "ifabsent": "string(object_keys)"}
         },
     )
-    objecttable_idx: NDArray[Shape["*"], int] = Field(
+    objecttable_idx: CoerceValue[NDArray[Shape["*"], int]] = Field(
         ...,
         description="""The index to the 'objects' table for the object that holds the key.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-    keytable_idx: NDArray[Shape["*"], int] = Field(
+    keytable_idx: CoerceValue[NDArray[Shape["*"], int]] = Field(
         ...,
         description="""The index to the 'keys' table for the key.""",
         json_schema_extra={"linkml_meta": {"array": {"exact_number_dimensions": 1}}},
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-ExternalResources.model_rebuild()
-ExternalResourcesKeys.model_rebuild()
-ExternalResourcesResources.model_rebuild()
-ExternalResourcesObjects.model_rebuild()
-ExternalResourcesObjectKeys.model_rebuild()
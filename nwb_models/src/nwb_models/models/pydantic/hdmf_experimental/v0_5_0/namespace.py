@@ -5,33 +5,12 @@ import sys
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
+from importlib import import_module
+from typing import Any, ClassVar, Dict, List, Literal, Optional, TYPE_CHECKING, Type, Union
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
 
-from ...hdmf_common.v1_8_0.hdmf_common_base import Container, Data, SimpleMultiContainer
-from ...hdmf_common.v1_8_0.hdmf_common_sparse import CSRMatrix
-from ...hdmf_common.v1_8_0.hdmf_common_table import (
-    AlignedDynamicTable,
-    DynamicTable,
-    DynamicTableRegion,
-    ElementIdentifiers,
-    VectorData,
-    VectorIndex,
-)
-from ...hdmf_experimental.v0_5_0.hdmf_experimental_experimental import EnumData
-from ...hdmf_experimental.v0_5_0.hdmf_experimental_resources import (
-    HERD,
-    HERDEntities,
-    HERDEntityKeys,
-    HERDFiles,
-    HERDKeys,
-    HERDObjectKeys,
-    HERDObjects,
-)
-
-
 metamodel_version = "None"
 version = "0.5.0"
 
@@ -45,6 +24,7 @@ class ConfiguredBaseModel(BaseModel):
         use_enum_values=True,
         strict=False,
     )
+    model_config["defer_build"] = True
     hdf5_path: Optional[str] = Field(
         None, description="The absolute path that this object is stored in an NWB file"
     )
@@ -59,33 +39,6 @@ class ConfiguredBaseModel(BaseModel):
         else:
             raise KeyError("No value or data field to index from")
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def coerce_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by using the value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler(v.value)
-            except AttributeError:
-                try:
-                    return handler(v["value"])
-                except (IndexError, KeyError, TypeError):
-                    raise e1
-
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def cast_with_value(cls, v: Any, handler, info) -> Any:
-        """Try to rescue instantiation by casting into the model's value field"""
-        try:
-            return handler(v)
-        except Exception as e1:
-            try:
-                return handler({"value": v})
-            except Exception:
-                raise e1
-
     @field_validator("*", mode="before")
     @classmethod
     def coerce_subclass(cls, v: Any, info) -> Any:
@@ -96,10 +49,7 @@ class ConfiguredBaseModel(BaseModel):
                 annotation = annotation.__args__[0]
             try:
                 if issubclass(annotation, type(v)) and annotation is not type(v):
-                    if v.__pydantic_extra__:
-                        v = annotation(**{**v.__dict__, **v.__pydantic_extra__})
-                    else:
-                        v = annotation(**v.__dict__)
+                    v = _recast_subclass(annotation, v)
             except TypeError:
                 # fine, annotation is a non-class type like a TypeVar
                 pass
@@ -145,6 +95,143 @@ class LinkMLMeta(RootModel):
         return key in self.root
 
 
+RESCUE_VALIDATORS = ("coerce_subclass", "gather_extra_to_value")
+
+
+def _constructable(model: Type[BaseModel], values: dict) -> bool:
+    """
+    Whether a model can be built from values that are (mostly) already known to be valid
+    with :func:`._construct_validating` rather than validating all of them.
+
+    It can't if it has validators besides the :data:`.RESCUE_VALIDATORS`
+    (eg. the length checks and casts on tables are real checks that need to run),
+    if the values are missing required fields, or if they have extra fields
+    that the model would forbid or repack.
+    """
+    decorators = model.__pydantic_decorators__
+    validators = [
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    ]
+    fields = model.model_fields
+    return (
+        all(name in RESCUE_VALIDATORS for name in validators)
+        and all(key in values for key, field in fields.items() if field.is_required())
+        and (model.model_config.get("extra") == "allow" or all(key in fields for key in values))
+    )
+
+
+def _construct_validating(model: Type[BaseModel], trusted: dict, untrusted: dict) -> BaseModel:
+    """
+    Build a model (that is :func:`._constructable` ), setting the ``trusted`` values as they are,
+    and validating only the ``untrusted`` ones one field at a time.
+    """
+    instance = model.model_construct(**trusted)
+    for key, value in untrusted.items():
+        model.__pydantic_validator__.validate_assignment(instance, key, value)
+    return instance
+
+
+def _recast_subclass(model: Type[BaseModel], instance: BaseModel) -> BaseModel:
+    """
+    Recast an instance of a parent class as one of its child classes
+    without validating everything that was already validated again.
+
+    Fields that the child inherits unchanged are copied as they are,
+    and only fields that the child adds or narrows are validated.
+    Children that aren't :func:`._constructable` from the parent's values
+    are validated in full.
+    """
+    # models are built on first use, resolve their annotations before comparing them
+    model.model_rebuild()
+    type(instance).model_rebuild()
+    values = {**instance.__dict__, **(instance.__pydantic_extra__ or {})}
+    if not _constructable(model, values):
+        return model(**values)
+
+    fields = model.model_fields
+    parent_fields = type(instance).model_fields
+    inherited = {}
+    narrowed = {}
+    for key, value in values.items():
+        field = fields.get(key)
+        parent = parent_fields.get(key)
+        if field is None or (
+            parent is not None
+            and key in instance.__dict__
+            and field.annotation == parent.annotation
+            and field.metadata == parent.metadata
+        ):
+            inherited[key] = value
+        else:
+            narrowed[key] = value
+
+    return _construct_validating(model, inherited, narrowed)
+
+
+if TYPE_CHECKING:
+    from ...hdmf_common.v1_8_0.hdmf_common_base import Container, Data, SimpleMultiContainer
+    from ...hdmf_common.v1_8_0.hdmf_common_sparse import CSRMatrix
+    from ...hdmf_common.v1_8_0.hdmf_common_table import (
+        AlignedDynamicTable,
+        DynamicTable,
+        DynamicTableRegion,
+        ElementIdentifiers,
+        VectorData,
+        VectorIndex,
+    )
+    from ...hdmf_experimental.v0_5_0.hdmf_experimental_experimental import EnumData
+    from ...hdmf_experimental.v0_5_0.hdmf_experimental_resources import (
+        HERD,
+        HERDEntities,
+        HERDEntityKeys,
+        HERDFiles,
+        HERDKeys,
+        HERDObjectKeys,
+        HERDObjects,
+    )
+
+
+_CLASS_MODULES = {
+    "AlignedDynamicTable": "...hdmf_common.v1_8_0.hdmf_common_table",
+    "CSRMatrix": "...hdmf_common.v1_8_0.hdmf_common_sparse",
+    "Container": "...hdmf_common.v1_8_0.hdmf_common_base",
+    "Data": "...hdmf_common.v1_8_0.hdmf_common_base",
+    "DynamicTable": "...hdmf_common.v1_8_0.hdmf_common_table",
+    "DynamicTableRegion": "...hdmf_common.v1_8_0.hdmf_common_table",
+    "ElementIdentifiers": "...hdmf_common.v1_8_0.hdmf_common_table",
+    "EnumData": "...hdmf_experimental.v0_5_0.hdmf_experimental_experimental",
+    "HERD": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "HERDEntities": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "HERDEntityKeys": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "HERDFiles": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "HERDKeys": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "HERDObjectKeys": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "HERDObjects": "...hdmf_experimental.v0_5_0.hdmf_experimental_resources",
+    "SimpleMultiContainer": "...hdmf_common.v1_8_0.hdmf_common_base",
+    "VectorData": "...hdmf_common.v1_8_0.hdmf_common_table",
+    "VectorIndex": "...hdmf_common.v1_8_0.hdmf_common_table",
+}
+"""Modules that define the classes in this namespace, imported when first used"""
+
+__all__ = list(_CLASS_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import classes from the module that defines them the first time they are used"""
+    if name not in _CLASS_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(import_module(_CLASS_MODULES[name], __package__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_CLASS_MODULES})
+
+
 linkml_meta = LinkMLMeta(
     {
         "annotations": {
@@ -165,7 +252,3 @@ linkml_meta = LinkMLMeta(
         "name": "hdmf-experimental",
     }
 )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model